@@ -0,0 +1,14 @@
+"""
+Benchmarks de Pylpex : corpus de programmes représentatifs (corpus.py) et runner
+qui mesure chaque phase et détecte les régressions par rapport à une référence (runner.py).
+"""
+from .corpus import CORPUS, Benchmark
+from .runner import measure, run, compare
+
+__all__ = [
+    "CORPUS",
+    "Benchmark",
+    "measure",
+    "run",
+    "compare"
+]
@@ -0,0 +1,113 @@
+"""
+Programmes Pylpex représentatifs des charges mesurées par le runner (cf. benchmarks/runner.py).
+
+Chaque programme est déterministe, n'affiche rien et se termine par une expression
+dont la valeur est vérifiée après chaque évaluation.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """Programme du corpus et résultat attendu"""
+    name: str
+    description: str
+    code: str
+    expected: Any
+
+
+FIB = """
+function fib(n) {
+    if n <= 1 { return n }
+    return fib(n - 1) + fib(n - 2)
+}
+fib(18)
+"""
+
+NESTED_LOOPS = """
+total = 0
+for i in range(1, 120) {
+    j = 0
+    while j < 120 {
+        if (i + j) % 3 == 0 { total += i * j } else { total -= 1 }
+        j += 1
+    }
+}
+total
+"""
+
+STRINGS = """
+text = ''
+words = split('le vif renard brun saute par dessus le chien paresseux', ' ')
+for i in range(1, 300) {
+    for word in words {
+        text = text + capitalize(word) + '-'
+    }
+}
+parts = split(upper(text), '-')
+[len(text), len(parts), parts[3]]
+"""
+
+COLLECTIONS = """
+items = []
+for i in range(1, 4000) { append(items, i * 7 % 1000) }
+counts = {}
+keys = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
+for k in keys { counts[k] = 0 }
+for x in items {
+    k = keys[x % 8]
+    counts[k] = counts[k] + x
+}
+sort(items)
+evens = []
+for x in items { if x % 2 == 0 { append(evens, x) } }
+while len(evens) > 1000 { pop(evens) }
+[len(items), counts['a'], counts['h'], len(evens), evens[999]]
+"""
+
+CALLS = """
+function square(x) { return x * x }
+function add(a, b = 1) { return a + b }
+function clamp(x, low, high) { return max(low, min(x, high)) }
+function step(acc, i) { return add(acc, clamp(square(i) % 97, 10, 80)) }
+
+acc = 0
+for i in range(1, 6000) { acc = step(acc, i) }
+acc
+"""
+
+# Bloc répété pour produire un gros source : beaucoup de tokens et de nœuds,
+# mais une évaluation rapide (définitions et affectations)
+LARGE_BLOCK = """
+// Bloc {i}
+function helper_{i}(a, b = 2, c = 'texte') {{
+    if a > b and not (a == 0) {{
+        return [a * b + 3.5, c, {{ 'cle': a, 'autre': b }}]
+    }} else {{
+        x = -a if a % 7 == 0 else a
+        for k in [1, 2, 3] {{ x += k * (b - 1) / 2 }}
+        return x
+    }}
+}}
+value_{i} = (({i} + 1) * 2 - 3) // 4 ** 2 >= 10 or false
+"""
+
+
+def large_source(blocks: int = 400) -> str:
+    """Source volumineux (lexing et parsing) : `blocks` copies d'un bloc de définitions"""
+    return "".join(LARGE_BLOCK.format(i=i) for i in range(blocks)) + "helper_0(5)\n"
+
+
+CORPUS: Dict[str, Benchmark] = {
+    benchmark.name: benchmark for benchmark in [
+        Benchmark("fib", "fonction récursive (appels et conditions)", FIB, 2584),
+        Benchmark("nested_loops", "boucles imbriquées et arithmétique", NESTED_LOOPS, 17266000),
+        Benchmark("strings", "construction de chaînes et builtins de texte", STRINGS, [16500, 3001, "BRUN"]),
+        Benchmark("collections", "listes et dictionnaires : ajouts, tri, mises à jour", COLLECTIONS,
+                  [4000, 248000, 251500, 1000, 498]),
+        Benchmark("calls", "nombreux appels de fonctions courtes", CALLS, 281265),
+        Benchmark("large_source", "gros source : lexing et parsing", large_source(),
+                  [13.5, "texte", {"cle": 5, "autre": 2}]),
+    ]
+}
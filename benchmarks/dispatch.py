@@ -0,0 +1,44 @@
+"""
+Coût du dispatch de ASTVisitor.visit sur l'Evaluator : table de dispatch précalculée
+comparée à l'ancienne recherche par getattr(self, f"visit_{...}") à chaque nœud.
+
+    PYTHONPATH=src python benchmarks/dispatch.py [répétitions]
+"""
+import sys
+import timeit
+from pylpex.evaluator import Evaluator
+from pylpex.lexer import Lexer
+from pylpex.parser import Parser
+
+PROGRAMS = {
+    "fib": "function fib(n) { if n <= 1 { return n } return fib(n-1) + fib(n-2) } fib(15)",
+    "boucle": "s = 0; i = 0; while i < 20000 { s += i * 2 % 7; i += 1 } s",
+    "expressions": "x = 0; for i in range(1, 5000) { x = (i + 1) * (i - 1) / (i + 2) > 3 and not (i == 4) }",
+}
+
+
+class GetattrEvaluator(Evaluator):
+    """Evaluator utilisant la recherche de méthode d'origine (nom formaté puis getattr)"""
+
+    def visit(self, node):
+        method_name = f"visit_{type(node).__name__}"
+        visitor = getattr(self, method_name, self.generic_visit)
+        return visitor(node)
+
+
+def measure(evaluator_class, ast, repeat: int) -> float:
+    """Meilleur temps (en secondes) d'évaluation de l'AST sur `repeat` essais"""
+    return min(timeit.repeat(lambda: evaluator_class().evaluate(ast), number=1, repeat=repeat))
+
+
+def main(repeat: int = 5):
+    print(f"{'Programme':<12} {'getattr':>10} {'table':>10} {'gain':>7}")
+    for name, code in PROGRAMS.items():
+        ast = Parser(Lexer(code).iter_tokens()).parse()
+        before = measure(GetattrEvaluator, ast, repeat)
+        after = measure(Evaluator, ast, repeat)
+        print(f"{name:<12} {before:>9.3f}s {after:>9.3f}s {before / after:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
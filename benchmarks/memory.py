@@ -0,0 +1,47 @@
+"""
+Mémoire occupée par les tokens et les nœuds d'AST d'un programme volumineux.
+
+    PYTHONPATH=src python benchmarks/memory.py [répétitions]
+
+Le programme mesuré concatène les scripts de tests/evaluator autant de fois que demandé.
+"""
+import sys
+import tracemalloc
+from pathlib import Path
+from pylpex.lexer import Lexer
+from pylpex.parser import Parser
+from pylpex.optimizer import count_nodes
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "tests" / "evaluator"
+
+
+def build_program(repeat: int) -> str:
+    scripts = [path.read_text(encoding="utf-8") for path in sorted(SCRIPTS.glob("*.txt"))]
+    return "\n".join(scripts * repeat)
+
+
+def measure(build):
+    """Objet construit par `build` et mémoire (en octets) qu'il retient"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main(repeat: int = 200):
+    code = build_program(repeat)
+    print(f"Programme : {len(code)} caractères, {code.count(chr(10)) + 1} lignes")
+
+    tokens, size = measure(lambda: Lexer(code).tokenize())
+    print(f"Tokens    : {len(tokens):>8}  {size / len(tokens):7.1f} octets/token")
+    del tokens
+
+    ast, size = measure(lambda: Parser(Lexer(code).iter_tokens()).parse())
+    nodes = count_nodes(ast)
+    print(f"Nœuds     : {nodes:>8}  {size / nodes:7.1f} octets/nœud (listes, chaînes et positions comprises)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,178 @@
+"""
+Mesure le corpus de benchmarks phase par phase (lexing, parsing, optimisation, évaluation),
+enregistre les résultats en JSON et les compare à une référence.
+
+    PYTHONPATH=src python -m benchmarks [--engine tree] [--repeat 5] [--output resultats.json]
+                                        [--baseline reference.json] [--threshold 0.10] [noms...]
+
+Chaque phase est chronométrée séparément (ramasse-miettes désactivé, comme timeit) et on
+garde le meilleur des `repeat` essais.
+Avec --baseline, une phase est en régression si elle est plus lente que la référence de
+plus de `threshold` (10 % par défaut) ; le code de sortie est alors 1. Les phases plus
+courtes que --min-time dans la référence sont ignorées (trop bruitées).
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+from pylpex import __version__
+from pylpex.interpreter import ENGINES
+from pylpex.lexer import LEXERS
+from pylpex.parser import Parser
+from pylpex.optimizer import Optimizer, count_nodes
+from .corpus import CORPUS, Benchmark
+
+PHASES = ("lex", "parse", "optimize", "evaluate")
+
+
+def measure(benchmark: Benchmark, engine: str = "tree", lexer: str = "scanner", optimize: bool = True,
+            repeat: int = 5) -> Dict[str, Any]:
+    """Meilleur temps (en secondes) de chaque phase sur `repeat` essais, nombre de tokens et de nœuds"""
+    best = dict.fromkeys(PHASES, float("inf"))
+    gc_enabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            gc.collect()
+            gc.disable()
+            timings, tokens, ast = _measure_once(benchmark, engine, lexer, optimize)
+            gc.enable()
+            for phase, elapsed in zip(PHASES, timings):
+                best[phase] = min(best[phase], elapsed)
+    finally:
+        if gc_enabled:
+            gc.enable()
+        else:
+            gc.disable()
+
+    return {**best, "total": sum(best.values()), "tokens": len(tokens), "nodes": count_nodes(ast)}
+
+
+def _measure_once(benchmark: Benchmark, engine: str, lexer: str, optimize: bool):
+    """Durées des phases d'une exécution du benchmark, tokens et AST produits"""
+    start = time.perf_counter()
+    tokens = LEXERS[lexer](benchmark.code).tokenize()
+    lexed = time.perf_counter()
+    ast = Parser(iter(tokens)).parse()
+    parsed = time.perf_counter()
+    if optimize:
+        ast = Optimizer().optimize(ast)
+    optimized = time.perf_counter()
+
+    evaluator = ENGINES[engine]()
+    start_evaluation = time.perf_counter()
+    result = evaluator.evaluate(ast)
+    evaluated = time.perf_counter()
+
+    if result != benchmark.expected:
+        raise AssertionError(f"{benchmark.name}: résultat {result!r}, attendu {benchmark.expected!r}")
+    timings = (lexed - start, parsed - lexed, optimized - parsed, evaluated - start_evaluation)
+    return timings, tokens, ast
+
+
+def run(names: Iterable[str], engine: str = "tree", lexer: str = "scanner", optimize: bool = True,
+        repeat: int = 5) -> Dict[str, Any]:
+    """Mesure les benchmarks demandés ; rapport sérialisable en JSON"""
+    return {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "pylpex": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "engine": engine,
+            "lexer": lexer,
+            "optimize": optimize,
+            "repeat": repeat,
+        },
+        "results": {name: measure(CORPUS[name], engine, lexer, optimize, repeat) for name in names},
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.10,
+            min_time: float = 1e-3) -> List[Dict[str, Any]]:
+    """
+    Régressions du rapport par rapport à la référence : phases plus lentes de plus de
+    `threshold` (fraction du temps de référence), hors phases de référence plus courtes que `min_time`
+    """
+    regressions = []
+    for name, result in report["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+        for phase in (*PHASES, "total"):
+            before, after = reference.get(phase), result[phase]
+            if before is None or before < min_time:
+                continue
+            ratio = after / before
+            if ratio > 1 + threshold:
+                regressions.append({"benchmark": name, "phase": phase, "baseline": before, "current": after,
+                                    "ratio": ratio})
+    return regressions
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None):
+    """Tableau des temps (en millisecondes), avec le rapport à la référence pour le total"""
+    meta = report["meta"]
+    print(f"Pylpex {meta['pylpex']} · Python {meta['python']} · moteur {meta['engine']} · "
+          f"lexer {meta['lexer']} · meilleur de {meta['repeat']}")
+    header = f"{'Benchmark':<14}" + "".join(f"{phase:>10}" for phase in (*PHASES, "total"))
+    print(header + (f"{'vs réf.':>9}" if baseline else ""))
+    for name, result in report["results"].items():
+        line = f"{name:<14}" + "".join(f"{result[phase] * 1000:>8.2f}ms" for phase in (*PHASES, "total"))
+        reference = baseline["results"].get(name) if baseline else None
+        if reference:
+            line += f"{result['total'] / reference['total']:>8.2f}x"
+        print(line)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks du corpus Pylpex")
+    parser.add_argument("names", nargs="*", help=f"benchmarks à exécuter (par défaut : {', '.join(CORPUS)})")
+    parser.add_argument("--engine", default="tree", choices=list(ENGINES))
+    parser.add_argument("--lexer", default="scanner", choices=list(LEXERS))
+    parser.add_argument("--no-optimize", action="store_true", help="ne pas optimiser l'AST")
+    parser.add_argument("--repeat", type=int, default=5, help="nombre d'essais par benchmark")
+    parser.add_argument("--output", help="fichier JSON où enregistrer les résultats")
+    parser.add_argument("--baseline", help="fichier JSON de référence (résultats d'un --output précédent)")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="ralentissement toléré par rapport à la référence (0.10 = 10 %%)")
+    parser.add_argument("--min-time", type=float, default=1e-3,
+                        help="phases de référence plus courtes ignorées (secondes)")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.names if name not in CORPUS]
+    if unknown:
+        parser.error(f"benchmark inconnu: {', '.join(unknown)}")
+
+    report = run(args.names or CORPUS, args.engine, args.lexer, not args.no_optimize, args.repeat)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline["meta"].get("engine") != args.engine:
+            print(f"Attention : la référence a été mesurée avec le moteur '{baseline['meta'].get('engine')}'")
+
+    print_report(report, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Résultats enregistrés dans {args.output}")
+
+    if baseline is not None:
+        regressions = compare(report, baseline, args.threshold, args.min_time)
+        for r in regressions:
+            print(f"RÉGRESSION {r['benchmark']}.{r['phase']}: {r['baseline'] * 1000:.2f}ms -> "
+                  f"{r['current'] * 1000:.2f}ms ({r['ratio']:.2f}x)")
+        if regressions:
+            return 1
+        print(f"Aucune régression au-delà de {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
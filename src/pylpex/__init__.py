@@ -1,7 +1,9 @@
 from .interpreter import Interpreter
+from .pool import InterpreterPool
 
 __all__ = [
-    "Interpreter"
+    "Interpreter",
+    "InterpreterPool"
 ]
 
 __version__ = "1.1.3"
@@ -0,0 +1,14 @@
+from .core import ParseCache, source_hash
+from .serializer import dump_ast, load_ast
+from .pylc import cache_path, read_pylc, write_pylc, load_program
+
+__all__ = [
+    "ParseCache",
+    "source_hash",
+    "dump_ast",
+    "load_ast",
+    "cache_path",
+    "read_pylc",
+    "write_pylc",
+    "load_program",
+]
@@ -0,0 +1,66 @@
+# pylpex/cache/core.py
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+from pylpex.parser.ASTNodes import ASTNode
+
+
+def source_hash(code: str) -> str:
+    """Empreinte (SHA-256) d'un code source, utilisée comme clé de cache"""
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+class ParseCache:
+    """
+    Cache LRU en mémoire des AST, indexé par l'empreinte du code source.
+
+    Les AST mis en cache sont ceux prêts à être évalués (déjà optimisés) : ils ne
+    doivent pas être modifiés par l'appelant. Une taille de 0 désactive le cache.
+    """
+
+    def __init__(self, size: int = 128):
+        if size < 0:
+            raise ValueError(f"Taille de cache invalide: {size}")
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, ASTNode] = OrderedDict()
+
+    def get(self, code: str) -> Optional[ASTNode]:
+        """AST associé au code source, ou None (l'entrée trouvée devient la plus récente)"""
+        if self.size == 0:
+            self.misses += 1
+            return None
+        key = source_hash(code)
+        ast = self._entries.get(key)
+        if ast is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return ast
+
+    def put(self, code: str, ast: ASTNode):
+        """Ajoute un AST, en évinçant la moins récemment utilisée des entrées si le cache est plein"""
+        if self.size == 0:
+            return
+        key = source_hash(code)
+        self._entries[key] = ast
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Vide le cache et remet les compteurs à zéro"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, code: str) -> bool:
+        return source_hash(code) in self._entries
+
+    def __repr__(self):
+        return f"ParseCache(size={self.size}, entries={len(self)}, hits={self.hits}, misses={self.misses})"
@@ -0,0 +1,161 @@
+# pylpex/cache/pylc.py
+import os
+import struct
+from typing import Optional, Type
+from pylpex.lexer import Lexer
+from pylpex.parser import Parser, ASTNode
+from .core import source_hash
+from .serializer import SCHEMA, dump_ast, load_ast
+
+# Format d'un fichier .pylc (entiers petit-boutistes) :
+#
+#     magic (4 octets) | version du format (u16) | mode de validation (u16) | schéma de l'AST (8 octets)
+#     validation : mtime en ns (i64) + taille (u64) de la source, ou SHA-256 du code (32 octets)
+#     AST sérialisé (cf. serializer)
+#
+# Comme pour les .pyc de CPython, la validation par horodatage évite de relire la
+# source, la validation par empreinte reste correcte si les dates ne sont pas fiables.
+
+MAGIC = b"PYLC"
+FORMAT_VERSION = 1
+EXTENSION = ".pylc"
+
+TIMESTAMP = 0
+HASH = 1
+VALIDATION_MODES = {"timestamp": TIMESTAMP, "hash": HASH}
+
+HEADER = struct.Struct("<4sHH8s")
+TIMESTAMP_FIELDS = struct.Struct("<qQ")
+HASH_SIZE = 32
+
+
+def cache_path(source_path: str) -> str:
+    """Chemin du fichier .pylc associé à un fichier source (dans le même dossier)"""
+    return os.path.splitext(source_path)[0] + EXTENSION
+
+
+def _validation_mode(validation: str) -> int:
+    if validation not in VALIDATION_MODES:
+        raise ValueError(f"Mode de validation inconnu '{validation}', attendu parmi: {', '.join(VALIDATION_MODES)}")
+    return VALIDATION_MODES[validation]
+
+
+def _read_source(source_path: str) -> str:
+    with open(source_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def dump_pylc(ast: ASTNode, stat: os.stat_result, code: Optional[str] = None, validation: str = "timestamp") -> bytes:
+    """
+    Contenu d'un fichier .pylc.
+
+    Args:
+        ast: AST issu du parsing de la source (non optimisé)
+        stat: Résultat de os.stat sur la source
+        code: Code source (requis pour la validation par empreinte)
+        validation: "timestamp" ou "hash"
+    """
+    mode = _validation_mode(validation)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, mode, SCHEMA)
+    if mode == TIMESTAMP:
+        check = TIMESTAMP_FIELDS.pack(stat.st_mtime_ns, stat.st_size)
+    else:
+        if code is None:
+            raise ValueError("Le code source est requis pour la validation par empreinte")
+        check = bytes.fromhex(source_hash(code))
+    return header + check + dump_ast(ast)
+
+
+def load_pylc(data: bytes, source_path: str) -> Optional[ASTNode]:
+    """AST contenu dans un fichier .pylc, ou None s'il est invalide ou périmé par rapport à la source"""
+    if len(data) < HEADER.size:
+        return None
+    magic, version, mode, schema = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION or schema != SCHEMA:
+        return None
+
+    offset = HEADER.size
+    if mode == TIMESTAMP:
+        if len(data) < offset + TIMESTAMP_FIELDS.size:
+            return None
+        mtime_ns, size = TIMESTAMP_FIELDS.unpack_from(data, offset)
+        stat = os.stat(source_path)
+        if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+            return None
+        offset += TIMESTAMP_FIELDS.size
+    elif mode == HASH:
+        if data[offset:offset + HASH_SIZE] != bytes.fromhex(source_hash(_read_source(source_path))):
+            return None
+        offset += HASH_SIZE
+    else:
+        return None
+
+    try:
+        return load_ast(data[offset:])
+    except ValueError:
+        return None
+
+
+def write_pylc(source_path: str, ast: ASTNode, code: Optional[str] = None, validation: str = "timestamp",
+               stat: Optional[os.stat_result] = None) -> bool:
+    """
+    Écrit le fichier .pylc d'une source. L'écriture est atomique ; un échec
+    (dossier en lecture seule...) est ignoré, comme pour les .pyc.
+    `stat` doit être relevé avant la lecture de la source : une modification
+    pendant le parsing rend alors le .pylc périmé plutôt que faux.
+
+    Returns:
+        True si le fichier a été écrit
+    """
+    path = cache_path(source_path)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        data = dump_pylc(ast, stat or os.stat(source_path), code, validation)
+        with open(temporary, "wb") as f:
+            f.write(data)
+        os.replace(temporary, path)
+        return True
+    except OSError:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+        return False
+
+
+def read_pylc(source_path: str) -> Optional[ASTNode]:
+    """AST du fichier .pylc d'une source s'il existe et reste valide, sinon None"""
+    try:
+        with open(cache_path(source_path), "rb") as f:
+            data = f.read()
+        return load_pylc(data, source_path)
+    except OSError:
+        return None
+
+
+def load_program(source_path: str, write: bool = True, validation: str = "timestamp",
+                 lexer: Type[Lexer] = Lexer) -> ASTNode:
+    """
+    AST d'un fichier source : lu depuis son .pylc s'il est valide, sinon parsé
+    (et le .pylc est alors réécrit si `write` est vrai).
+
+    Args:
+        source_path: Chemin du fichier source
+        write: Si True, écrit le .pylc après un parsing
+        validation: Mode de validation du .pylc écrit ("timestamp" ou "hash")
+        lexer: Classe du lexer utilisé en cas de parsing
+
+    Returns:
+        AST non optimisé du programme
+    """
+    _validation_mode(validation)
+    ast = read_pylc(source_path)
+    if ast is not None:
+        return ast
+
+    stat = os.stat(source_path)
+    code = _read_source(source_path)
+    ast = Parser(lexer(code).iter_tokens()).parse()
+    if write:
+        write_pylc(source_path, ast, code, validation, stat)
+    return ast
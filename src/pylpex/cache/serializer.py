@@ -0,0 +1,131 @@
+# pylpex/cache/serializer.py
+import hashlib
+import marshal
+from dataclasses import fields
+from enum import Enum
+from typing import Any, Dict, List, Type
+from pylpex.parser.ASTNodes import *
+from pylpex.parser import ASTNodes
+from pylpex.typesystem import TypeInfo, BaseType
+
+# Sérialisation compacte des AST.
+#
+# L'AST est converti en structure de types primitifs (None, bool, int, float, str,
+# list, tuple) puis écrit avec `marshal`, dont le décodage est natif. Les valeurs
+# qui ne sont pas primitives sont encodées par des tuples étiquetés :
+#
+#     nœud     -> (index de classe, ligne, colonne, *champs)
+#     tuple    -> (TUPLE, *éléments)
+#     énum     -> (ENUM, index d'énumération, index du membre)
+#     TypeInfo -> (TYPE, index du type de base, sous-types ou None)
+#
+# Les index de classe des nœuds suivent les étiquettes réservées. Seuls les champs
+# comparés sont enregistrés : les annotations du Resolver (`_slot`, `_locals`) sont
+# recalculées à chaque évaluation.
+
+TUPLE = 0
+ENUM = 1
+TYPE = 2
+FIRST_NODE = 3
+
+NODE_CLASSES: List[Type[ASTNode]] = sorted(
+    (value for value in vars(ASTNodes).values()
+     if isinstance(value, type) and issubclass(value, ASTNode) and value is not ASTNode),
+    key=lambda cls: cls.__name__
+)
+
+ENUM_CLASSES: List[Type[Enum]] = sorted(
+    [value for value in vars(ASTNodes).values()
+     if isinstance(value, type) and issubclass(value, TypeEnum) and value is not TypeEnum] + [BaseType],
+    key=lambda cls: cls.__name__
+)
+
+
+def _persisted_fields(cls: Type[ASTNode]) -> List[str]:
+    """Champs enregistrés d'une classe de nœud, dans l'ordre de son constructeur"""
+    init_fields = [f for f in fields(cls) if f.init and not f.kw_only]
+    names = [f.name for f in init_fields if f.compare]
+    if [f.name for f in init_fields[:len(names)]] != names:
+        raise TypeError(f"Les champs enregistrés de {cls.__name__} doivent précéder les annotations")
+    return names
+
+
+NODE_FIELDS: Dict[Type[ASTNode], List[str]] = {cls: _persisted_fields(cls) for cls in NODE_CLASSES}
+NODE_INDEX = {cls: FIRST_NODE + i for i, cls in enumerate(NODE_CLASSES)}
+ENUM_INDEX = {cls: i for i, cls in enumerate(ENUM_CLASSES)}
+ENUM_MEMBERS = [list(cls) for cls in ENUM_CLASSES]
+MEMBER_INDEX = {member: (ENUM_INDEX[cls], i) for cls, members in zip(ENUM_CLASSES, ENUM_MEMBERS) for i, member in enumerate(members)}
+BASE_TYPES = ENUM_MEMBERS[ENUM_INDEX[BaseType]]
+
+
+def _schema_fingerprint() -> bytes:
+    """Empreinte des définitions de nœuds et d'énumérations : un AST enregistré avec un autre schéma est invalide"""
+    parts = [f"{cls.__name__}({','.join(NODE_FIELDS[cls])})" for cls in NODE_CLASSES]
+    parts += [f"{cls.__name__}({','.join(m.name for m in members)})" for cls, members in zip(ENUM_CLASSES, ENUM_MEMBERS)]
+    return hashlib.sha256(";".join(parts).encode("utf-8")).digest()[:8]
+
+SCHEMA = _schema_fingerprint()
+
+
+# -----------------------------------------------------
+# Encodage
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, ASTNode):
+        cls = type(value)
+        line, column = value.position if value.position else (None, None)
+        return (NODE_INDEX[cls], line, column, *(_encode(getattr(value, name)) for name in NODE_FIELDS[cls]))
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, tuple):
+        return (TUPLE, *(_encode(item) for item in value))
+    if isinstance(value, Enum):
+        return (ENUM, *MEMBER_INDEX[value])
+    if isinstance(value, TypeInfo):
+        subtypes = [_encode(t) for t in value.subtypes] if value.subtypes is not None else None
+        return (TYPE, MEMBER_INDEX[value.base][1], subtypes)
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f"Valeur non sérialisable dans l'AST: {value!r}")
+
+
+def dump_ast(node: ASTNode) -> bytes:
+    """Sérialise un AST"""
+    return marshal.dumps(_encode(node))
+
+
+# -----------------------------------------------------
+# Décodage
+
+def _decode(value: Any) -> Any:
+    kind = type(value)
+    if kind is list:
+        return [_decode(item) for item in value]
+    if kind is not tuple:
+        return value
+
+    tag = value[0]
+    if tag >= FIRST_NODE:
+        cls = NODE_CLASSES[tag - FIRST_NODE]
+        line = value[1]
+        position = (line, value[2]) if line is not None else None
+        return cls(*[_decode(item) for item in value[3:]], position=position)
+    if tag == TUPLE:
+        return tuple(_decode(item) for item in value[1:])
+    if tag == ENUM:
+        return ENUM_MEMBERS[value[1]][value[2]]
+    if tag == TYPE:
+        subtypes = value[2]
+        return TypeInfo(BASE_TYPES[value[1]], [_decode(t) for t in subtypes] if subtypes is not None else None)
+    raise ValueError(f"Étiquette inconnue dans l'AST sérialisé: {tag}")
+
+
+def load_ast(data: bytes) -> ASTNode:
+    """Reconstruit un AST sérialisé par dump_ast"""
+    try:
+        node = _decode(marshal.loads(data))
+    except (EOFError, TypeError, IndexError) as e:
+        raise ValueError(f"AST sérialisé invalide: {e}") from None
+    if not isinstance(node, ASTNode):
+        raise ValueError("AST sérialisé invalide: la racine n'est pas un nœud")
+    return node
@@ -0,0 +1,15 @@
+from .code import CodeObject
+from .core import Compiler
+from .vm import VirtualMachine
+from .transpiler import Transpiler, TranspiledProgram, TranspileError
+from .python_engine import PythonEvaluator
+
+__all__ = [
+    "CodeObject",
+    "Compiler",
+    "VirtualMachine",
+    "Transpiler",
+    "TranspiledProgram",
+    "TranspileError",
+    "PythonEvaluator",
+]
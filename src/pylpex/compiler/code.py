@@ -0,0 +1,94 @@
+# pylpex/compiler/code.py
+from array import array
+from typing import Any, List, Optional
+from pylpex.parser.ASTNodes import ParameterNode, BinaryOperatorType, UnaryOperatorType
+from pylpex.typesystem import TypeInfo
+from .opcodes import OPNAMES, JUMP_OPCODES, DEREF_SHIFT, DEREF_MASK, LOAD_CONST, MAKE_FUNCTION, LOAD_DEREF, ASSIGN_DEREF
+
+# Ordre des opérateurs référencés par BINARY_OP / INPLACE_OP / UNARY_OP
+BINARY_OPERATORS = list(BinaryOperatorType)
+UNARY_OPERATORS = list(UnaryOperatorType)
+
+
+class SourceLocation:
+    """Position source d'une instruction, utilisable comme nœud par ExecutionError"""
+    __slots__ = ("position",)
+
+    def __init__(self, position: Optional[tuple[int, int]]):
+        self.position = position
+
+
+class CodeObject:
+    """
+    Programme ou corps de fonction compilé.
+
+    Les opcodes sont stockés dans un array('B') et leurs arguments dans un array('i')
+    parallèle : l'instruction i est (opcodes[i], args[i]). Les constantes, noms globaux
+    et noms locaux (slots) sont référencés par index.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        opcodes: array,
+        args: array,
+        constants: List[Any],
+        names: List[str],
+        varnames: List[str],
+        positions: List[Optional[tuple[int, int]]],
+        parameters: Optional[List[ParameterNode]] = None,
+        defaults: Optional[List[bool]] = None,
+        return_type: Optional[TypeInfo] = None,
+        callee_loads: Optional[frozenset] = None,
+    ):
+        self.name = name
+        self.opcodes = opcodes
+        self.args = args
+        self.constants = constants
+        self.names = names
+        self.varnames = varnames
+        self.slots = {name: slot for slot, name in enumerate(varnames)}
+        self.positions = positions
+        self.parameters = parameters or []
+        self.argcount = len(self.parameters)
+        self.defaults = defaults or [False] * self.argcount
+        self.return_type = return_type
+        self.callee_loads = callee_loads or frozenset() # instructions qui chargent une fonction appelée par nom
+
+    def location(self, index: int) -> Optional[SourceLocation]:
+        """Position source de l'instruction `index` (pour les messages d'erreur)"""
+        position = self.positions[index]
+        return SourceLocation(position) if position else None
+
+    def disassemble(self) -> str:
+        """Représentation textuelle du bytecode (et des fonctions imbriquées)"""
+        lines = [f"Code '{self.name}' (locals: {self.varnames})"]
+        for index, (opcode, arg) in enumerate(zip(self.opcodes, self.args)):
+            opname = OPNAMES[opcode]
+            detail = ""
+            if opcode == LOAD_CONST:
+                detail = f"({self.constants[arg]!r})"
+            elif opcode == MAKE_FUNCTION:
+                detail = f"(<code {self.constants[arg].name}>)"
+            elif opcode in (LOAD_DEREF, ASSIGN_DEREF):
+                detail = f"(depth={arg >> DEREF_SHIFT}, slot={arg & DEREF_MASK})"
+            elif opcode in JUMP_OPCODES:
+                detail = f"(-> {arg})"
+            elif opname.endswith(("_FAST", "_PARAM")):
+                detail = f"({self.varnames[arg]})"
+            elif opname.endswith(("_GLOBAL", "_ATTR")):
+                detail = f"({self.names[arg]})"
+            elif opname in ("BINARY_OP", "INPLACE_OP", "COMPOUND_SUBSCR"):
+                detail = f"({BINARY_OPERATORS[arg].value})"
+            elif opname == "UNARY_OP":
+                detail = f"({UNARY_OPERATORS[arg].value})"
+            lines.append(f"{index:>5} {opname:<22}{arg:<6}{detail}")
+
+        for constant in self.constants:
+            if isinstance(constant, CodeObject):
+                lines.append("")
+                lines.append(constant.disassemble())
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"<code {self.name}, {len(self.opcodes)} instructions>"
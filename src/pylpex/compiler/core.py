@@ -0,0 +1,362 @@
+# pylpex/compiler/core.py
+from array import array
+from typing import Any, Dict, List, Optional
+from pylpex.parser.ASTNodes import *
+from pylpex.evaluator.operators import COMPOUND_TO_BINARY
+from .opcodes import *
+from .code import CodeObject, BINARY_OPERATORS, UNARY_OPERATORS
+from pylpex.evaluator.scope import Scope
+
+# Nœuds qui gèrent eux-mêmes la valeur qu'ils laissent sur la pile
+STATEMENT_NODES = (AssignmentNode, FunctionDefNode, ReturnNode, IfNode, WhileNode, ForNode, BreakNode, ContinueNode)
+
+
+class _Loop:
+    """Contexte de compilation d'une boucle (cibles de break / continue)"""
+    def __init__(self, continue_target: int, is_for: bool):
+        self.continue_target = continue_target
+        self.is_for = is_for
+        self.breaks: List[int] = []
+
+
+class Compiler:
+    """
+    Compile un AST en CodeObject pour la machine virtuelle.
+
+    Chaque instruction laisse exactement une valeur sur la pile pour les expressions ;
+    les instructions (statements) n'en laissent une que si leur valeur est utilisée
+    (dernière instruction d'un programme, d'une fonction ou d'une branche de if).
+    """
+
+    def __init__(self, name: str = "<program>", scope: Optional[Scope] = None):
+        self.name = name
+        self.scope = scope
+        self.opcodes = array('B')
+        self.args = array('i')
+        self.positions: List[Optional[tuple[int, int]]] = []
+        self.constants: List[Any] = []
+        self.names: List[str] = []
+        self.callee_loads = set()
+        self._constant_indices: Dict[Any, int] = {}
+        self._name_indices: Dict[str, int] = {}
+        self._loops: List[_Loop] = []
+
+    def compile(self, node: ASTNode) -> CodeObject:
+        """Point d'entrée : compile un programme complet"""
+        statements = node.statements if isinstance(node, ProgramNode) else [node]
+        self.compile_block(statements, want_value=True)
+        self.emit(RETURN_VALUE)
+        return self._build()
+
+    # -------------------------------
+    # Émission
+
+    def emit(self, opcode: int, arg: int = 0, node: Optional[ASTNode] = None) -> int:
+        """Ajoute une instruction et retourne son index"""
+        self.opcodes.append(opcode)
+        self.args.append(arg)
+        self.positions.append(node.position if node is not None else None)
+        return len(self.opcodes) - 1
+
+    def patch(self, index: int, target: Optional[int] = None):
+        """Fixe la cible d'un saut (par défaut : l'instruction suivante)"""
+        self.args[index] = len(self.opcodes) if target is None else target
+
+    def constant(self, value: Any) -> int:
+        """Index d'une constante (les constantes simples sont dédupliquées)"""
+        if isinstance(value, (CodeObject, list, dict)):
+            self.constants.append(value)
+            return len(self.constants) - 1
+        key = (type(value), value)
+        if key not in self._constant_indices:
+            self._constant_indices[key] = len(self.constants)
+            self.constants.append(value)
+        return self._constant_indices[key]
+
+    def name_index(self, name: str) -> int:
+        if name not in self._name_indices:
+            self._name_indices[name] = len(self.names)
+            self.names.append(name)
+        return self._name_indices[name]
+
+    def _build(self, parameters: Optional[List[ParameterNode]] = None, return_type=None) -> CodeObject:
+        return CodeObject(
+            name=self.name,
+            opcodes=self.opcodes,
+            args=self.args,
+            constants=self.constants,
+            names=self.names,
+            varnames=self.scope.names if self.scope else [],
+            positions=self.positions,
+            parameters=[ParameterNode(name=p.name, type_annotation=p.type_annotation) for p in parameters or []],
+            defaults=[p.default_value is not None for p in parameters or []],
+            return_type=return_type,
+            callee_loads=frozenset(self.callee_loads),
+        )
+
+    # -------------------------------
+    # Variables
+
+    def load_name(self, name: str, node: ASTNode, callee: bool = False):
+        resolved = self.scope.resolve(name) if self.scope else None
+        if resolved is None:
+            index = self.emit(LOAD_GLOBAL, self.name_index(name), node)
+        elif resolved[0] == 0:
+            index = self.emit(LOAD_FAST, resolved[1], node)
+        else:
+            depth, slot = resolved
+            index = self.emit(LOAD_DEREF, (depth << DEREF_SHIFT) | slot, node)
+        if callee:
+            self.callee_loads.add(index)
+
+    def define_name(self, name: str, node: ASTNode):
+        """Définition dans la portée courante (=, for, def)"""
+        if self.scope is None:
+            self.emit(STORE_GLOBAL, self.name_index(name), node)
+        else:
+            self.emit(STORE_FAST, self.scope.slots[name], node)
+
+    def assign_name(self, name: str, node: ASTNode):
+        """Réassignation dans la portée où le nom est défini (opérateurs composés)"""
+        resolved = self.scope.resolve(name) if self.scope else None
+        if resolved is None:
+            self.emit(ASSIGN_GLOBAL, self.name_index(name), node)
+        elif resolved[0] == 0:
+            self.emit(ASSIGN_FAST, resolved[1], node)
+        else:
+            depth, slot = resolved
+            self.emit(ASSIGN_DEREF, (depth << DEREF_SHIFT) | slot, node)
+
+    # -------------------------------
+    # Dispatch
+
+    def compile_node(self, node: ASTNode, want_value: bool = True):
+        method = getattr(self, f"_compile_{type(node).__name__}", None)
+        if method is None:
+            raise NotImplementedError(f"Aucune méthode _compile_{type(node).__name__}")
+        if isinstance(node, STATEMENT_NODES):
+            method(node, want_value)
+        else:
+            method(node)
+            if not want_value:
+                self.emit(POP_TOP)
+
+    def compile_block(self, statements: List[ASTNode], want_value: bool):
+        """Compile un bloc ; si want_value, laisse la valeur de la dernière instruction"""
+        if not statements:
+            if want_value:
+                self.emit(LOAD_CONST, self.constant(None))
+            return
+        last = len(statements) - 1
+        for i, statement in enumerate(statements):
+            self.compile_node(statement, want_value and i == last)
+
+    # -------------------------------
+    # Literals
+
+    def _compile_NoneNode(self, node: NoneNode):
+        self.emit(LOAD_CONST, self.constant(None), node)
+
+    def _compile_NumberNode(self, node: NumberNode):
+        self.emit(LOAD_CONST, self.constant(node.value), node)
+
+    _compile_StringNode = _compile_NumberNode
+    _compile_BooleanNode = _compile_NumberNode
+
+    def _compile_ListNode(self, node: ListNode):
+        for element in node.elements:
+            self.compile_node(element)
+        self.emit(BUILD_LIST, len(node.elements), node)
+
+    def _compile_DictionaryNode(self, node: DictionaryNode):
+        count = 0
+        for key_node, value_node in node.pairs:
+            if not isinstance(key_node, StringNode):
+                self.compile_node(key_node)
+                self.emit(INVALID_DICT_KEY, 0, node)
+                break
+            self.emit(LOAD_CONST, self.constant(key_node.value), key_node)
+            self.compile_node(value_node)
+            count += 1
+        self.emit(BUILD_DICT, count, node)
+
+    # -------------------------------
+    # Expressions
+
+    def _compile_IdentifierNode(self, node: IdentifierNode):
+        self.load_name(node.name, node)
+
+    def _compile_BinaryOpNode(self, node: BinaryOpNode):
+        self.compile_node(node.left)
+
+        # Court-circuit pour 'and' et 'or'
+        if node.operator in (BinaryOperatorType.AND, BinaryOperatorType.OR):
+            opcode = JUMP_IF_FALSE_OR_POP if node.operator == BinaryOperatorType.AND else JUMP_IF_TRUE_OR_POP
+            jump = self.emit(opcode, 0, node)
+            self.compile_node(node.right)
+            self.patch(jump)
+            return
+
+        self.compile_node(node.right)
+        self.emit(BINARY_OP, BINARY_OPERATORS.index(node.operator), node)
+
+    def _compile_UnaryOpNode(self, node: UnaryOpNode):
+        self.compile_node(node.operand)
+        self.emit(UNARY_OP, UNARY_OPERATORS.index(node.operator), node)
+
+    def _compile_TernaryNode(self, node: TernaryNode):
+        self.compile_node(node.condition)
+        jump_else = self.emit(POP_JUMP_IF_FALSE, 0, node)
+        self.compile_node(node.true_expr)
+        jump_end = self.emit(JUMP, 0, node)
+        self.patch(jump_else)
+        self.compile_node(node.false_expr)
+        self.patch(jump_end)
+
+    def _compile_IndexNode(self, node: IndexNode):
+        self.compile_node(node.collection)
+        self.compile_node(node.index)
+        self.emit(BINARY_SUBSCR, 0, node)
+
+    def _compile_AttributeNode(self, node: AttributeNode):
+        self.compile_node(node.object)
+        self.emit(LOAD_ATTR, self.name_index(node.attribute), node)
+
+    def _compile_CallNode(self, node: CallNode):
+        if isinstance(node.function, str):
+            self.load_name(node.function, node, callee=True)
+        else:
+            self.compile_node(node.function)
+
+        for argument in node.arguments:
+            self.compile_node(argument.value)
+
+        if all(argument.name is None for argument in node.arguments):
+            self.emit(CALL, len(node.arguments), node)
+        else:
+            names = tuple(argument.name for argument in node.arguments)
+            self.emit(CALL_KW, self.constant(names), node)
+
+    # -------------------------------
+    # Statements
+
+    def _compile_AssignmentNode(self, node: AssignmentNode, want_value: bool):
+        target = node.target
+        self.compile_node(node.value)
+
+        if isinstance(target, IdentifierNode):
+            if node.operator == AssignmentOperatorType.ASSIGN:
+                if want_value:
+                    self.emit(DUP_TOP)
+                self.define_name(target.name, node)
+            else:
+                self.load_name(target.name, node)
+                self.emit(INPLACE_OP, BINARY_OPERATORS.index(COMPOUND_TO_BINARY[node.operator]), node)
+                if want_value:
+                    self.emit(DUP_TOP)
+                self.assign_name(target.name, node)
+            return
+
+        if isinstance(target, IndexNode):
+            self.compile_node(target.collection)
+            self.compile_node(target.index)
+            if node.operator == AssignmentOperatorType.ASSIGN:
+                self.emit(STORE_SUBSCR, 0, node)
+            else:
+                self.emit(COMPOUND_SUBSCR, BINARY_OPERATORS.index(COMPOUND_TO_BINARY[node.operator]), node)
+            if not want_value:
+                self.emit(POP_TOP)
+            return
+
+        self.emit(RAISE_ERROR, self.constant(f"Target d'assignation invalide: {type(target).__name__}"), node)
+
+    def _compile_FunctionDefNode(self, node: FunctionDefNode, want_value: bool):
+        compiler = Compiler(node.name, Scope.for_function(node, self.scope))
+
+        # Prologue : valeurs par défaut évaluées dans l'environnement de la fonction
+        for slot, param in enumerate(node.parameters):
+            if param.default_value is not None:
+                compiler.emit(LOAD_PARAM, slot)
+                jump = compiler.emit(BIND_DEFAULT, 0)
+                compiler.compile_node(param.default_value)
+                compiler.emit(STORE_FAST, slot)
+                compiler.patch(jump)
+
+        compiler.compile_block(node.body, want_value=True)
+        compiler.emit(RETURN_VALUE)
+        code = compiler._build(node.parameters, node.return_type)
+
+        self.emit(MAKE_FUNCTION, self.constant(code), node)
+        self.define_name(node.name, node)
+        if want_value:
+            self.emit(LOAD_CONST, self.constant(None))
+
+    def _compile_ReturnNode(self, node: ReturnNode, want_value: bool):
+        if node.value:
+            self.compile_node(node.value)
+        else:
+            self.emit(LOAD_CONST, self.constant(None), node)
+        self.emit(RETURN_VALUE, 0, node)
+
+    def _compile_IfNode(self, node: IfNode, want_value: bool):
+        self.compile_node(node.condition)
+        jump_else = self.emit(POP_JUMP_IF_FALSE, 0, node)
+        self.compile_block(node.then_block, want_value)
+
+        if node.else_block or want_value:
+            jump_end = self.emit(JUMP, 0, node)
+            self.patch(jump_else)
+            self.compile_block(node.else_block or [], want_value)
+            self.patch(jump_end)
+        else:
+            self.patch(jump_else)
+
+    def _compile_WhileNode(self, node: WhileNode, want_value: bool):
+        start = len(self.opcodes)
+        self.compile_node(node.condition)
+        jump_end = self.emit(POP_JUMP_IF_FALSE, 0, node)
+
+        loop = _Loop(start, is_for=False)
+        self._loops.append(loop)
+        self.compile_block(node.body, want_value=False)
+        self._loops.pop()
+
+        self.emit(JUMP, start, node)
+        self.patch(jump_end)
+        for jump in loop.breaks:
+            self.patch(jump)
+        if want_value:
+            self.emit(LOAD_CONST, self.constant(None))
+
+    def _compile_ForNode(self, node: ForNode, want_value: bool):
+        self.compile_node(node.iterable)
+        self.emit(GET_ITER, 0, node)
+        start = self.emit(FOR_ITER, 0, node)
+        self.define_name(node.variable, node)
+
+        loop = _Loop(start, is_for=True)
+        self._loops.append(loop)
+        self.compile_block(node.body, want_value=False)
+        self._loops.pop()
+
+        self.emit(JUMP, start, node)
+        self.patch(start)
+        for jump in loop.breaks:
+            self.patch(jump)
+        if want_value:
+            self.emit(LOAD_CONST, self.constant(None))
+
+    def _compile_BreakNode(self, node: BreakNode, want_value: bool):
+        if not self._loops:
+            self.emit(RAISE_ERROR, self.constant("'break' ne peut être utilisé qu'à l'intérieur d'une boucle"), node)
+            return
+        loop = self._loops[-1]
+        if loop.is_for:
+            self.emit(POP_TOP)  # itérateur
+        loop.breaks.append(self.emit(JUMP, 0, node))
+
+    def _compile_ContinueNode(self, node: ContinueNode, want_value: bool):
+        if not self._loops:
+            self.emit(RAISE_ERROR, self.constant("'continue' ne peut être utilisé qu'à l'intérieur d'une boucle"), node)
+            return
+        self.emit(JUMP, self._loops[-1].continue_target, node)
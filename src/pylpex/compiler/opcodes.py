@@ -0,0 +1,95 @@
+# pylpex/compiler/opcodes.py
+"""
+Jeu d'instructions de la machine virtuelle.
+Chaque instruction est un octet (opcode) associé à un argument entier
+stocké dans un tableau parallèle (cf. CodeObject).
+"""
+
+OPNAMES = [
+    # Pile
+    "LOAD_CONST",           # arg: index de constante
+    "POP_TOP",
+    "DUP_TOP",
+    # Variables
+    "LOAD_FAST",            # arg: slot local
+    "LOAD_DEREF",           # arg: (profondeur << 16) | slot
+    "LOAD_GLOBAL",          # arg: index de nom
+    "STORE_FAST",           # arg: slot local (définition)
+    "STORE_GLOBAL",         # arg: index de nom (définition)
+    "ASSIGN_FAST",          # arg: slot local (réassignation, opérateurs composés)
+    "ASSIGN_DEREF",         # arg: (profondeur << 16) | slot
+    "ASSIGN_GLOBAL",        # arg: index de nom
+    # Opérateurs
+    "BINARY_OP",            # arg: index dans BINARY_OPERATORS
+    "INPLACE_OP",           # arg: index dans BINARY_OPERATORS ([valeur, courant] → courant op valeur)
+    "UNARY_OP",             # arg: index dans UNARY_OPERATORS
+    # Sauts
+    "JUMP",                 # arg: cible
+    "POP_JUMP_IF_FALSE",    # arg: cible
+    "JUMP_IF_FALSE_OR_POP", # arg: cible
+    "JUMP_IF_TRUE_OR_POP",  # arg: cible
+    # Structures
+    "BUILD_LIST",           # arg: nombre d'éléments
+    "BUILD_DICT",           # arg: nombre de paires
+    "INVALID_DICT_KEY",
+    "BINARY_SUBSCR",
+    "STORE_SUBSCR",
+    "COMPOUND_SUBSCR",      # arg: index dans BINARY_OPERATORS
+    "LOAD_ATTR",            # arg: index de nom
+    # Boucles
+    "GET_ITER",
+    "FOR_ITER",             # arg: cible en fin d'itération
+    # Fonctions
+    "MAKE_FUNCTION",        # arg: index de constante (CodeObject)
+    "CALL",                 # arg: nombre d'arguments positionnels
+    "CALL_KW",              # arg: index de constante (noms des arguments, None si positionnel)
+    "RETURN_VALUE",
+    "BIND_DEFAULT",         # arg: cible si le paramètre est déjà lié
+    "LOAD_PARAM",           # arg: slot local (paramètre, sans repli dynamique)
+    # Erreurs
+    "RAISE_ERROR",          # arg: index de constante (message)
+]
+
+OPCODES = {name: index for index, name in enumerate(OPNAMES)}
+
+LOAD_CONST = OPCODES["LOAD_CONST"]
+POP_TOP = OPCODES["POP_TOP"]
+DUP_TOP = OPCODES["DUP_TOP"]
+LOAD_FAST = OPCODES["LOAD_FAST"]
+LOAD_DEREF = OPCODES["LOAD_DEREF"]
+LOAD_GLOBAL = OPCODES["LOAD_GLOBAL"]
+STORE_FAST = OPCODES["STORE_FAST"]
+STORE_GLOBAL = OPCODES["STORE_GLOBAL"]
+ASSIGN_FAST = OPCODES["ASSIGN_FAST"]
+ASSIGN_DEREF = OPCODES["ASSIGN_DEREF"]
+ASSIGN_GLOBAL = OPCODES["ASSIGN_GLOBAL"]
+BINARY_OP = OPCODES["BINARY_OP"]
+INPLACE_OP = OPCODES["INPLACE_OP"]
+UNARY_OP = OPCODES["UNARY_OP"]
+JUMP = OPCODES["JUMP"]
+POP_JUMP_IF_FALSE = OPCODES["POP_JUMP_IF_FALSE"]
+JUMP_IF_FALSE_OR_POP = OPCODES["JUMP_IF_FALSE_OR_POP"]
+JUMP_IF_TRUE_OR_POP = OPCODES["JUMP_IF_TRUE_OR_POP"]
+BUILD_LIST = OPCODES["BUILD_LIST"]
+BUILD_DICT = OPCODES["BUILD_DICT"]
+INVALID_DICT_KEY = OPCODES["INVALID_DICT_KEY"]
+BINARY_SUBSCR = OPCODES["BINARY_SUBSCR"]
+STORE_SUBSCR = OPCODES["STORE_SUBSCR"]
+COMPOUND_SUBSCR = OPCODES["COMPOUND_SUBSCR"]
+LOAD_ATTR = OPCODES["LOAD_ATTR"]
+GET_ITER = OPCODES["GET_ITER"]
+FOR_ITER = OPCODES["FOR_ITER"]
+MAKE_FUNCTION = OPCODES["MAKE_FUNCTION"]
+CALL = OPCODES["CALL"]
+CALL_KW = OPCODES["CALL_KW"]
+RETURN_VALUE = OPCODES["RETURN_VALUE"]
+BIND_DEFAULT = OPCODES["BIND_DEFAULT"]
+LOAD_PARAM = OPCODES["LOAD_PARAM"]
+RAISE_ERROR = OPCODES["RAISE_ERROR"]
+
+# Instructions dont l'argument est une cible de saut
+JUMP_OPCODES = {JUMP, POP_JUMP_IF_FALSE, JUMP_IF_FALSE_OR_POP, JUMP_IF_TRUE_OR_POP, FOR_ITER, BIND_DEFAULT}
+
+# Profondeur/slot encodés dans un seul argument
+DEREF_SHIFT = 16
+DEREF_MASK = (1 << DEREF_SHIFT) - 1
@@ -0,0 +1,303 @@
+# pylpex/compiler/python_engine.py
+import itertools
+from collections import OrderedDict
+from types import FunctionType, TracebackType
+from typing import Any, Optional
+from weakref import WeakValueDictionary
+from pylpex.parser.ASTNodes import *
+from pylpex.typesystem import TypeInfo, BaseType
+from pylpex.evaluator import Evaluator, ExecutionError
+from pylpex.evaluator.builtin import BuiltinFunction
+from pylpex.evaluator.environment import UNBOUND
+from .code import SourceLocation
+from .transpiler import Transpiler, TranspiledProgram, NAME, CALL, CALL_KW, BINARY, UNARY, INDEX, READ, STORE
+
+
+class _Unset:
+    """Valeur par défaut d'un paramètre non fourni (la vraie valeur est calculée à l'appel)"""
+    def __repr__(self):
+        return "<unset>"
+
+UNSET = _Unset()
+
+# Nombre de programmes traduits conservés pour être réexécutés sans nouvelle traduction
+PROGRAM_CACHE_SIZE = 128
+
+
+def binding_error(definition: FunctionDefNode, positional: int, keywords) -> Optional[str]:
+    """Message d'erreur de liaison des arguments (comme l'évaluateur), ou None si l'appel est valide"""
+    parameters = definition.parameters
+    if positional > len(parameters):
+        return f"Trop d'arguments pour '{definition.name}': attendu {len(parameters)}, reçu {positional}"
+    for param in parameters[positional:]:
+        if param.name not in keywords and param.default_value is None:
+            return f"Argument manquant pour le paramètre '{param.name}' de '{definition.name}'"
+    return None
+
+
+def pylpex_definition(value: Any) -> Optional[FunctionDefNode]:
+    """Définition Pylpex d'une fonction traduite en Python (None pour toute autre valeur)"""
+    if isinstance(value, FunctionType):
+        return getattr(value, "__pylpex__", None)
+    return None
+
+
+class PythonEvaluator(Evaluator):
+    """
+    Exécute les programmes en les traduisant en source Python (cf. Transpiler).
+
+    Les fonctions Pylpex deviennent des fonctions Python natives et les noms globaux
+    vivent directement dans le dictionnaire de l'environnement global.
+    Les erreurs Python sont retraduites en ExecutionError à partir de la trace
+    d'exécution et des tables de positions du programme traduit.
+
+    Les programmes traduits sont conservés par AST (les `PROGRAM_CACHE_SIZE` derniers) :
+    un AST réévalué, par exemple servi par le cache de l'Interpreter, n'est pas retraduit.
+    La table des programmes utilisée pour retraduire les erreurs ne garde un programme
+    que tant que ce cache ou l'une de ses fonctions le référence.
+    """
+
+    _filenames = itertools.count()
+    supports_limits = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._programs: WeakValueDictionary[str, TranspiledProgram] = WeakValueDictionary()
+        self._compiled: OrderedDict[int, tuple[ASTNode, TranspiledProgram]] = OrderedDict()
+        # Les builtins Pylpex et les helpers du code généré sont résolus comme des builtins Python
+        self.global_env.vars["__builtins__"] = {
+            **self.builtins_env.vars,
+            "__pl_UNSET": UNSET,
+            "__pl_UNBOUND": UNBOUND,
+            "__pl_function": self._runtime_function,
+            "__pl_iter": self._runtime_iter,
+            "__pl_index": self._runtime_index,
+            "__pl_attr": self._runtime_attr,
+            "__pl_callable": self._runtime_callable,
+            "__pl_call": self._runtime_call,
+            "__pl_invalid_key": self._runtime_invalid_key,
+            "__pl_none": self._runtime_none,
+            "__pl_raise": self._runtime_raise,
+        }
+
+    def transpile(self, node: ASTNode) -> TranspiledProgram:
+        """Traduit un AST en programme Python (sans l'exécuter)"""
+        program = Transpiler(f"<pylpex-{next(self._filenames)}>").transpile(node)
+        self._programs[program.filename] = program
+        return program
+
+    def _program(self, node: ASTNode) -> TranspiledProgram:
+        """Programme traduit de l'AST, traduit au premier passage (le cache garde l'AST en vie : son id reste valide)"""
+        entry = self._compiled.get(id(node))
+        if entry is not None and entry[0] is node:
+            self._compiled.move_to_end(id(node))
+            return entry[1]
+        program = self.transpile(node)
+        self._compiled[id(node)] = (node, program)
+        if len(self._compiled) > PROGRAM_CACHE_SIZE:
+            self._compiled.popitem(last=False)
+        return program
+
+    def evaluate(self, node: ASTNode) -> Any:
+        """Traduit (si nécessaire) puis exécute un AST"""
+        main = self._program(node).load(self.global_env.vars)
+        try:
+            return main()
+        except RecursionError:
+            raise
+        except Exception as e:
+            error = self._translate_error(e)
+            if error is e:
+                raise
+            raise error from None
+
+    def call_function(self, func: Any, args: list) -> Any:
+        definition = pylpex_definition(func)
+        if definition is not None:
+            message = binding_error(definition, len(args), {})
+            if message:
+                raise ExecutionError(message)
+            return func(*args)
+        return super().call_function(func, args)
+
+    def _infer_type(self, value) -> TypeInfo:
+        definition = pylpex_definition(value)
+        if definition is not None:
+            arg_types = [p.type_annotation or TypeInfo(BaseType.ANY) for p in definition.parameters]
+            return TypeInfo.callable(arg_types, definition.return_type or TypeInfo(BaseType.ANY))
+        return super()._infer_type(value)
+
+    # -------------------------------
+    # Helpers du code généré
+
+    def _runtime_function(self, definition: FunctionDefNode):
+        def decorator(func: FunctionType) -> FunctionType:
+            func.__pylpex__ = definition
+            # La fonction garde son programme en vie, pour retraduire ses erreurs
+            func.__pylpex_program__ = self._programs.get(func.__code__.co_filename)
+            return func
+        return decorator
+
+    def _runtime_iter(self, iterable: Any, node: ForNode):
+        try:
+            return iter(iterable)
+        except TypeError:
+            raise ExecutionError(f"L'objet de type '{type(iterable).__name__}' n'est pas itérable", node)
+
+    def _runtime_index(self, collection: Any, index: Any, node: IndexNode) -> Any:
+        return self._get_index(collection, index, node)
+
+    def _runtime_attr(self, obj: Any, node: AttributeNode) -> Any:
+        try:
+            return getattr(obj, node.attribute)
+        except AttributeError:
+            raise ExecutionError(
+                f"L'objet de type '{type(obj).__name__}' n'a pas d'attribut '{node.attribute}'",
+                node
+            )
+
+    def _runtime_callable(self, func: Any, node: CallNode) -> Any:
+        if isinstance(func, BuiltinFunction) or pylpex_definition(func) is not None:
+            return func
+        inner = ExecutionError(f"'{func}' n'est pas appelable", node)
+        raise ExecutionError(f"Erreur d'appel de fonction: {inner}", node)
+
+    def _runtime_call(self, meta: tuple, func: Any, *values) -> Any:
+        """Appel avec arguments nommés : les noms inconnus sont ignorés, comme dans l'évaluateur"""
+        node, keywords = meta
+        args = [value for value, name in zip(values, keywords) if name is None]
+        kwargs = {name: value for value, name in zip(values, keywords) if name is not None}
+
+        definition = pylpex_definition(func)
+        if definition is not None:
+            message = binding_error(definition, len(args), kwargs)
+            if message:
+                inner = ExecutionError(message, node)
+                raise ExecutionError(f"Erreur d'appel de fonction: {inner}", node)
+            # Noms Python des paramètres (un paramètre dupliqué est renommé, cf. python_parameters)
+            names = func.__code__.co_varnames[:len(definition.parameters)]
+            bound = {names[i]: kwargs[p.name] for i, p in enumerate(definition.parameters)
+                     if i >= len(args) and p.name in kwargs}
+            return func(*args, **bound)
+
+        if isinstance(func, BuiltinFunction):
+            try:
+                return func(*args, **kwargs)
+            except (TypeError, ExecutionError) as e:
+                raise ExecutionError(f"Erreur d'appel de fonction: {e}", node)
+
+        return self._runtime_callable(func, node)
+
+    def _runtime_invalid_key(self, node: DictionaryNode, *values):
+        key_type = self._infer_type(values[-1])
+        raise ExecutionError(f"Clé de dictionnaire non hashable pour le type: {key_type}", node)
+
+    def _runtime_none(self, left: Any, right: Any) -> None:
+        return None
+
+    def _runtime_raise(self, error: tuple):
+        message, node = error
+        raise ExecutionError(message, node)
+
+    # -------------------------------
+    # Traduction des erreurs
+
+    def _locate(self, tb: TracebackType, program: TranspiledProgram) -> tuple:
+        """Opération générée en cours d'exécution dans une frame : (nature, nœud, détail)"""
+        code = tb.tb_frame.f_code
+        lineno, end_lineno, column, end_column = list(code.co_positions())[tb.tb_lasti // 2]
+        if lineno is not None and lineno == end_lineno:
+            located = program.locate(lineno, column, end_column)
+            if located is not None:
+                return located
+        position = program.position(lineno or tb.tb_lineno)
+        return None, SourceLocation(position), None
+
+    def _translate_error(self, error: Exception) -> Exception:
+        """
+        Retraduit une exception levée par le code généré.
+        L'erreur est construite dans la frame la plus profonde du code généré, puis
+        enveloppée à chaque appel qui la propage (comme visit_CallNode).
+        """
+        frames = []
+        tb = error.__traceback__
+        while tb is not None:
+            program = self._programs.get(tb.tb_frame.f_code.co_filename)
+            if program is not None:
+                frames.append((tb, program))
+            tb = tb.tb_next
+        if not frames:
+            return error
+
+        tb, program = frames[-1]
+        result = self._translate_operation(error, tb, self._locate(tb, program))
+
+        for tb, program in reversed(frames[:-1]):
+            kind, node, _ = self._locate(tb, program)
+            if kind in (CALL, CALL_KW) and isinstance(result, (TypeError, ExecutionError)):
+                result = ExecutionError(f"Erreur d'appel de fonction: {result}", node)
+        return result
+
+    def _translate_operation(self, error: Exception, tb: TracebackType, located: tuple) -> Exception:
+        """Erreur équivalente à celle de l'évaluateur pour l'opération qui a échoué"""
+        kind, node, detail = located
+
+        if kind == NAME and isinstance(error, NameError):
+            name, callee = detail
+            return ExecutionError(f"{'Fonction' if callee else 'Variable'} '{name}' non définie", node)
+
+        if kind == BINARY:
+            if detail == BinaryOperatorType.DIV and isinstance(error, ZeroDivisionError):
+                error = ExecutionError("Division par zéro", node)
+            return ExecutionError(f"Erreur d'opération: {error}", node)
+
+        if kind == UNARY:
+            return ExecutionError(f"Erreur d'opération unaire: {error}", node)
+
+        if kind == INDEX:
+            # Opérandes sans effet de bord : réévalués pour produire le message de _get_index
+            frame = tb.tb_frame
+            try:
+                collection = eval(detail[0], frame.f_globals, frame.f_locals)
+                index = eval(detail[1], frame.f_globals, frame.f_locals)
+                self._get_index(collection, index, node)
+            except ExecutionError as e:
+                return e
+            except Exception:
+                pass
+            return ExecutionError(str(error), node)
+
+        if kind in (READ, STORE):
+            if not isinstance(error, (TypeError, KeyError, IndexError)):
+                return error
+            action = "de lecture" if kind == READ else "d'assignation"
+            return ExecutionError(f"Erreur {action}: {error}", node)
+
+        if kind == CALL:
+            if tb.tb_next is not None:
+                # Erreur levée par une fonction native
+                if isinstance(error, (TypeError, ExecutionError)):
+                    return ExecutionError(f"Erreur d'appel de fonction: {error}", node)
+                return error
+            if isinstance(error, TypeError):
+                inner = ExecutionError(self._call_error_message(error, tb, node, detail), node)
+                return ExecutionError(f"Erreur d'appel de fonction: {inner}", node)
+
+        if isinstance(error, ExecutionError) or kind == CALL_KW:
+            return error
+        return ExecutionError(str(error), node)
+
+    def _call_error_message(self, error: TypeError, tb: TracebackType, node: CallNode, callee: Optional[str]) -> str:
+        """Message d'un appel refusé par Python (fonction non appelable ou arguments invalides)"""
+        if callee is None:
+            return str(error)
+        # Le source de la fonction appelée (un nom) est réévalué sans effet de bord
+        frame = tb.tb_frame
+        try:
+            func = eval(callee, frame.f_globals, frame.f_locals)
+        except Exception:
+            return str(error)
+        definition = pylpex_definition(func)
+        if definition is None:
+            return f"'{func}' n'est pas appelable"
+        return binding_error(definition, len(node.arguments), {}) or str(error)
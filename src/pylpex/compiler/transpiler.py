@@ -0,0 +1,742 @@
+# pylpex/compiler/transpiler.py
+"""
+Traduction de l'AST Pylpex en source Python.
+
+Le programme devient une fonction `__pl_main` (les noms de premier niveau y sont
+déclarés `global` et vivent dans l'environnement global), les fonctions Pylpex
+deviennent des `def`, les boucles et `break` / `continue` sont natifs.
+Le source généré est compilé avec compile() puis exécuté par CPython.
+
+Les opérations qui peuvent échouer sont repérées par leur position dans le source
+généré (ligne, colonnes) : une erreur Python peut ainsi être retraduite en
+ExecutionError pointant vers la position Pylpex d'origine.
+"""
+import keyword
+import math
+from dataclasses import fields
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+from pylpex.parser.ASTNodes import *
+from pylpex.evaluator import ExecutionError
+from pylpex.evaluator.operators import COMPOUND_TO_BINARY
+from pylpex.evaluator.scope import collect_locals
+
+# Nature des opérations repérées dans le source généré
+NAME = "name"           # lecture d'un nom
+CALL = "call"           # appel direct f(...)
+CALL_KW = "call_kw"     # appel avec arguments nommés (via __pl_call)
+BINARY = "binary"       # opérateur binaire (ou opérateur composé)
+UNARY = "unary"         # opérateur unaire
+INDEX = "index"         # lecture collection[index]
+READ = "read"           # lecture collection[index] d'un opérateur composé
+STORE = "store"         # écriture collection[index] = valeur
+
+# Opérateurs traduits directement en Python
+PYTHON_OPERATORS = {
+    BinaryOperatorType.PLUS: "+",
+    BinaryOperatorType.MINUS: "-",
+    BinaryOperatorType.MUL: "*",
+    BinaryOperatorType.DIV: "/",
+    BinaryOperatorType.POWER: "**",
+    BinaryOperatorType.MOD: "%",
+    BinaryOperatorType.EQ: "==",
+    BinaryOperatorType.NEQ: "!=",
+    BinaryOperatorType.LT: "<",
+    BinaryOperatorType.GT: ">",
+    BinaryOperatorType.LTE: "<=",
+    BinaryOperatorType.GTE: ">=",
+    BinaryOperatorType.IN: "in",
+    BinaryOperatorType.NOT_IN: "not in",
+}
+
+PYTHON_UNARY_OPERATORS = {
+    UnaryOperatorType.POSITIVE: "+",
+    UnaryOperatorType.NEGATIVE: "-",
+    UnaryOperatorType.NOT: "not ",
+}
+
+# Préfixe réservé aux noms générés (helpers, temporaires)
+RESERVED_PREFIX = "__pl_"
+
+# Nœuds dont la réévaluation est sans effet de bord (cf. PythonEvaluator)
+PURE_NODES = (IdentifierNode, NumberNode, StringNode, BooleanNode, NoneNode)
+
+STATEMENT_NODES = (AssignmentNode, FunctionDefNode, ReturnNode, IfNode, WhileNode, ForNode, BreakNode, ContinueNode, CommentNode)
+
+
+class TranspileError(ExecutionError):
+    """Construction Pylpex qui ne peut pas être traduite en Python"""
+
+
+def collect_rebound(body: List[ASTNode]) -> List[str]:
+    """Noms réassignés par un opérateur composé dans une fonction (hors fonctions imbriquées)"""
+    names = []
+
+    def walk(statements: List[ASTNode]):
+        for statement in statements:
+            if isinstance(statement, AssignmentNode):
+                if statement.operator != AssignmentOperatorType.ASSIGN and isinstance(statement.target, IdentifierNode):
+                    if statement.target.name not in names:
+                        names.append(statement.target.name)
+            elif isinstance(statement, (ForNode, WhileNode)):
+                walk(statement.body)
+            elif isinstance(statement, IfNode):
+                walk(statement.then_block)
+                walk(statement.else_block or [])
+
+    walk(body)
+    return names
+
+
+def names_read(node: Any) -> Iterator[str]:
+    """Noms lus par une instruction ou une expression (corps des fonctions imbriquées compris)"""
+    if isinstance(node, (list, tuple)):
+        for item in node:
+            yield from names_read(item)
+        return
+    if not isinstance(node, ASTNode):
+        return
+    if isinstance(node, AssignmentNode) and isinstance(node.target, IdentifierNode):
+        if node.operator != AssignmentOperatorType.ASSIGN:
+            yield node.target.name
+        yield from names_read(node.value)
+        return
+    if isinstance(node, IdentifierNode):
+        yield node.name
+    elif isinstance(node, CallNode) and isinstance(node.function, str):
+        yield node.function
+    for f in fields(node):
+        yield from names_read(getattr(node, f.name))
+
+
+def collect_fallback(parameters: List[ParameterNode], body: List[ASTNode]) -> Set[str]:
+    """
+    Noms locaux d'une fonction qui peuvent être lus avant leur première affectation.
+    L'évaluateur lit alors la variable du même nom d'une portée englobante (cf. SlotEnvironment).
+
+    L'analyse est prudente : une affectation dans une branche ou une boucle ne compte plus
+    après celle-ci, et une fonction imbriquée lit tous ses noms dès sa définition.
+    """
+    local = set(collect_locals(parameters, body))
+    fallback = set()
+
+    def read(node: Any, assigned: Set[str]):
+        for name in names_read(node):
+            if name in local and name not in assigned:
+                fallback.add(name)
+
+    def walk(statements: List[ASTNode], assigned: Set[str]) -> Set[str]:
+        assigned = set(assigned)
+        for statement in statements:
+            if isinstance(statement, AssignmentNode):
+                read(statement.value, assigned)
+                target = statement.target
+                if isinstance(target, IdentifierNode) and statement.operator == AssignmentOperatorType.ASSIGN:
+                    assigned.add(target.name)
+                else:
+                    read(target, assigned)
+            elif isinstance(statement, FunctionDefNode):
+                read(statement, assigned)
+                assigned.add(statement.name)
+            elif isinstance(statement, IfNode):
+                read(statement.condition, assigned)
+                then_assigned = walk(statement.then_block, assigned)
+                else_assigned = walk(statement.else_block or [], assigned)
+                assigned = then_assigned & else_assigned
+            elif isinstance(statement, WhileNode):
+                read(statement.condition, assigned)
+                walk(statement.body, assigned)
+            elif isinstance(statement, ForNode):
+                read(statement.iterable, assigned)
+                walk(statement.body, assigned | {statement.variable})
+            else:
+                read(statement, assigned)
+        return assigned
+
+    parameter_names = {param.name for param in parameters}
+    read([param.default_value for param in parameters], parameter_names)
+    walk(body, parameter_names)
+    return fallback
+
+
+def python_parameters(parameters: List[ParameterNode]) -> List[str]:
+    """
+    Noms Python des paramètres. Un nom dupliqué n'est gardé que pour sa dernière occurrence,
+    qui masque les précédentes comme dans l'évaluateur : les autres reçoivent un nom réservé.
+    """
+    last = {param.name: i for i, param in enumerate(parameters)}
+    return [param.name if last[param.name] == i else f"{RESERVED_PREFIX}p{i}" for i, param in enumerate(parameters)]
+
+
+def is_pure(node: ASTNode) -> bool:
+    """Vrai si l'expression peut être réévaluée sans effet de bord"""
+    if isinstance(node, PURE_NODES):
+        return True
+    if isinstance(node, IndexNode):
+        return is_pure(node.collection) and is_pure(node.index)
+    return False
+
+
+class _FunctionScope:
+    """
+    Noms locaux d'une fonction en cours de traduction.
+    Les noms de `fallback` (cf. collect_fallback) sont stockés sous un nom réservé, initialisé
+    à UNBOUND : le nom Python d'origine reste libre pour atteindre la portée englobante.
+    """
+    def __init__(self, names: List[str], fallback: Set[str], parent: Optional['_FunctionScope']):
+        self.names = set(names)
+        self.fallback = fallback
+        self.parent = parent
+        self.depth = parent.depth + 1 if parent is not None else 1
+
+    def local(self, name: str) -> str:
+        """Nom Python d'une variable locale"""
+        return f"{RESERVED_PREFIX}{self.depth}_{name}" if name in self.fallback else name
+
+
+def defining_scope(scope: Optional[_FunctionScope], name: str) -> Optional[_FunctionScope]:
+    """Première portée de fonction (à partir de `scope`) où le nom est local, None pour un nom global"""
+    while scope is not None and name not in scope.names:
+        scope = scope.parent
+    return scope
+
+
+class TranspiledProgram:
+    """
+    Programme traduit en Python.
+
+    `line_map` associe chaque ligne du source généré à la position (ligne, colonne)
+    de l'instruction Pylpex correspondante ; `spans` associe la position exacte
+    (ligne, colonne de début, colonne de fin) d'une opération générée au nœud d'origine.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        filename: str,
+        constants: List[Any],
+        line_map: Dict[int, Optional[tuple[int, int]]],
+        spans: Dict[tuple[int, int, int], tuple],
+    ):
+        self.source = source
+        self.filename = filename
+        self.constants = constants
+        self.line_map = line_map
+        self.spans = spans
+        try:
+            self.code = compile(source, filename, "exec")
+        except SyntaxError as e:
+            raise TranspileError(f"Source Python généré invalide: {e}", None)
+
+    def position(self, lineno: int) -> Optional[tuple[int, int]]:
+        """Position Pylpex de la ligne `lineno` du source généré"""
+        return self.line_map.get(lineno)
+
+    def locate(self, lineno: int, column: int, end_column: int) -> Optional[tuple]:
+        """Opération générée à cette position : (nature, nœud, détail) ou None"""
+        return self.spans.get((lineno, column, end_column))
+
+    def load(self, global_vars: dict) -> Callable[[], Any]:
+        """Exécute la définition du module et retourne la fonction principale"""
+        namespace = {}
+        exec(self.code, global_vars, namespace)
+        return namespace["__pl_module"](self.constants)
+
+    def __repr__(self):
+        return f"<transpiled {self.filename}, {len(self.line_map)} lignes>"
+
+
+class Transpiler:
+    """
+    Traduit un AST Pylpex en source Python.
+
+    Toute expression composée est générée entre parenthèses : le source ne dépend
+    jamais des priorités d'opérateurs Python (ni des comparaisons chaînées).
+
+    Comme dans l'évaluateur, une variable locale lue avant sa première affectation se
+    replie sur la variable englobante du même nom : ces lectures testent la variable
+    locale avant de lire le nom englobant (cf. collect_fallback, _read_name).
+    """
+
+    def __init__(self, filename: str = "<pylpex>"):
+        self.filename = filename
+        self.lines: List[str] = []
+        self.line_map: Dict[int, Optional[tuple[int, int]]] = {}
+        self.spans: Dict[tuple[int, int, int], tuple] = {}
+        self.constants: List[Any] = []
+        self._parts: List[str] = []
+        self._column = 0
+        self._indent = 0
+        self._position: Optional[tuple[int, int]] = None
+        self._scope: Optional[_FunctionScope] = None # None : programme principal
+        self._loop_depth = 0
+
+    def transpile(self, node: ASTNode) -> TranspiledProgram:
+        """Point d'entrée : traduit un programme complet"""
+        statements = node.statements if isinstance(node, ProgramNode) else [node]
+
+        self._line("def __pl_module(__pl_k):")
+        self._indent += 1
+        self._line("def __pl_main():")
+        self._indent += 1
+        names = collect_locals([], statements)
+        names += [name for name in collect_rebound(statements) if name not in names]
+        for name in names:
+            self._check_name(name, node)
+        if names:
+            self._line(f"global {', '.join(names)}")
+        self._block(statements, tail=True)
+        self._indent -= 1
+        self._line("return __pl_main")
+        self._flush()
+
+        source = "\n".join(self.lines) + "\n"
+        return TranspiledProgram(source, self.filename, self.constants, self.line_map, self.spans)
+
+    # -------------------------------
+    # Émission
+
+    def _flush(self):
+        if self._parts:
+            self.lines[-1] = "".join(self._parts)
+            self._parts = []
+
+    def _line(self, text: str = "", node: Optional[ASTNode] = None):
+        """Commence une nouvelle ligne (associée à la position du nœud ou de l'instruction courante)"""
+        self._flush()
+        if node is not None and node.position:
+            self._position = node.position
+        self.lines.append("")
+        self.line_map[len(self.lines)] = self._position
+        indent = "    " * self._indent
+        self._parts = [indent]
+        self._column = len(indent)
+        self.write(text)
+
+    def write(self, text: str):
+        """Ajoute du texte à la ligne courante (les colonnes Python sont en octets UTF-8)"""
+        self._parts.append(text)
+        self._column += len(text.encode("utf-8"))
+
+    def _span(self, kind: str, node: ASTNode, start: int, detail: Any = None):
+        """Enregistre l'opération générée entre la colonne `start` et la colonne courante"""
+        self.spans[(len(self.lines), start, self._column)] = (kind, node, detail)
+
+    def constant(self, value: Any) -> str:
+        """Référence vers une constante du programme"""
+        self.constants.append(value)
+        return f"__pl_k[{len(self.constants) - 1}]"
+
+    def _check_name(self, name: str, node: ASTNode):
+        if not name.isidentifier() or keyword.iskeyword(name) or name.startswith(RESERVED_PREFIX) or name == "__builtins__":
+            raise TranspileError(f"Le nom '{name}' ne peut pas être traduit en Python", node)
+
+    def _local(self, name: str) -> str:
+        """Nom Python d'une variable définie dans la portée courante"""
+        return self._scope.local(name) if self._scope is not None else name
+
+    def _read_name(self, name: str, node: ASTNode, callee: bool):
+        """
+        Lecture d'un nom. Chaque variable locale peut-être non affectée rencontrée en remontant
+        les portées est testée, avant le premier nom sûrement défini (ou global)
+        """
+        scope = defining_scope(self._scope, name)
+        opened = 0
+        while scope is not None and name in scope.fallback:
+            local = scope.local(name)
+            self.write(f"({local} if {local} is not __pl_UNBOUND else ")
+            opened += 1
+            scope = defining_scope(scope.parent, name)
+        start = self._column
+        self.write(name)
+        self._span(NAME, node, start, (name, callee))
+        self.write(")" * opened)
+
+    def _assigned_names(self, name: str) -> List[tuple[Optional[_FunctionScope], str]]:
+        """
+        Variables (portée, nom Python) que peut modifier un opérateur composé sur `name`,
+        dans l'ordre où l'évaluateur les essaie : la première déjà affectée est modifiée
+        """
+        targets = []
+        scope = defining_scope(self._scope, name)
+        while scope is not None and name in scope.fallback:
+            targets.append((scope, scope.local(name)))
+            scope = defining_scope(scope.parent, name)
+        targets.append((scope, name))
+        return targets
+
+    # -------------------------------
+    # Instructions
+
+    def _block(self, statements: List[ASTNode], tail: bool):
+        """
+        Traduit une suite d'instructions.
+        Si `tail` est vrai, la valeur de la dernière instruction est retournée
+        (dernière instruction d'un programme, d'une fonction ou d'une branche de if en fin de bloc).
+        """
+        if not statements:
+            self._line("pass")
+            return
+        last = len(statements) - 1
+        for i, statement in enumerate(statements):
+            self._statement(statement, tail and i == last)
+
+    def _statement(self, node: ASTNode, tail: bool):
+        if isinstance(node, STATEMENT_NODES):
+            getattr(self, f"_statement_{type(node).__name__}")(node, tail)
+        elif tail:
+            self._line("return ", node)
+            self._expression(node)
+        else:
+            self._line("", node)
+            self._expression(node)
+
+    def _statement_CommentNode(self, node: CommentNode, tail: bool):
+        self._line("pass", node)
+
+    def _statement_AssignmentNode(self, node: AssignmentNode, tail: bool):
+        target = node.target
+
+        if isinstance(target, IdentifierNode):
+            self._check_name(target.name, node)
+            if node.operator == AssignmentOperatorType.ASSIGN:
+                local = self._local(target.name)
+                self._line(f"{local} = ", node)
+                self._expression(node.value)
+                if tail:
+                    self._line(f"return {local}")
+                return
+
+            # x = x op valeur (pas d'opérateur en place : les listes ne sont pas modifiées)
+            targets = self._assigned_names(target.name)
+            self._line("__pl_v = " if len(targets) > 1 else f"{targets[0][1]} = ", node)
+            start = self._column
+            self._read_name(target.name, node, False)
+            self.write(f" {PYTHON_OPERATORS[COMPOUND_TO_BINARY[node.operator]]} ")
+            self._expression(node.value)
+            self._span(BINARY, node, start, COMPOUND_TO_BINARY[node.operator])
+            if len(targets) > 1:
+                for i, (_, local) in enumerate(targets[:-1]):
+                    self._line(f"{'elif' if i else 'if'} {local} is not __pl_UNBOUND: {local} = __pl_v")
+                self._line(f"else: {targets[-1][1]} = __pl_v")
+            if tail:
+                self._line(f"return {'__pl_v' if len(targets) > 1 else targets[0][1]}")
+
+        elif isinstance(target, IndexNode):
+            self._line("", node)
+            if node.operator == AssignmentOperatorType.ASSIGN and not tail:
+                # Python évalue aussi la valeur, puis la collection et l'index
+                start = self._column
+                self._expression(target.collection)
+                self.write("[")
+                self._expression(target.index)
+                self.write("]")
+                self._span(STORE, node, start)
+                self.write(" = ")
+                self._expression(node.value)
+            else:
+                # Valeur, collection puis index sont évalués une seule fois, dans cet ordre
+                self.write("__pl_v = ")
+                self._expression(node.value)
+                self.write("; __pl_c = ")
+                self._expression(target.collection)
+                self.write("; __pl_i = ")
+                self._expression(target.index)
+                if node.operator != AssignmentOperatorType.ASSIGN:
+                    self.write("; __pl_v = ")
+                    start = self._column
+                    self.write("__pl_c[__pl_i]")
+                    self._span(READ, node, start)
+                    self.write(f" {PYTHON_OPERATORS[COMPOUND_TO_BINARY[node.operator]]} __pl_v")
+                    self._span(BINARY, node, start, COMPOUND_TO_BINARY[node.operator])
+                self.write("; ")
+                start = self._column
+                self.write("__pl_c[__pl_i]")
+                self._span(STORE, node, start)
+                self.write(" = __pl_v")
+                if tail:
+                    self._line("return __pl_v")
+
+        else:
+            # La valeur est évaluée avant l'erreur, comme dans l'évaluateur
+            self._line("", node)
+            self._expression(node.value)
+            message = f"Target d'assignation invalide: {type(target).__name__}"
+            self.write(f"; __pl_raise({self.constant((message, node))})")
+
+    def _statement_FunctionDefNode(self, node: FunctionDefNode, tail: bool):
+        self._check_name(node.name, node)
+        self._line(f"@__pl_function({self.constant(node)})", node)
+
+        # Les valeurs par défaut sont évaluées à l'appel, dans la portée de la fonction
+        parameters, prologue, has_default = [], [], False
+        for param, name in zip(node.parameters, python_parameters(node.parameters)):
+            self._check_name(param.name, node)
+            if param.default_value is not None:
+                has_default = True
+                if isinstance(param.default_value, (NumberNode, StringNode, BooleanNode, NoneNode)):
+                    parameters.append(f"{name}={self._literal(param.default_value)}")
+                    continue
+            elif not has_default:
+                parameters.append(name)
+                continue
+            parameters.append(f"{name}=__pl_UNSET")
+            prologue.append((param, name))
+        self._line(f"def {self._local(node.name)}({', '.join(parameters)}):")
+
+        outer_scope, outer_loops = self._scope, self._loop_depth
+        names = collect_locals(node.parameters, node.body)
+        self._scope = _FunctionScope(names, collect_fallback(node.parameters, node.body), outer_scope)
+        self._loop_depth = 0
+        self._indent += 1
+
+        # Variables des portées englobantes modifiées par un opérateur composé
+        nonlocals, globals_ = [], []
+        for name in collect_rebound(node.body):
+            self._check_name(name, node)
+            for scope, local in self._assigned_names(name):
+                if scope is None and local not in globals_:
+                    globals_.append(local)
+                elif scope is not None and scope is not self._scope and local not in nonlocals:
+                    nonlocals.append(local)
+        if nonlocals:
+            self._line(f"nonlocal {', '.join(nonlocals)}")
+        if globals_:
+            self._line(f"global {', '.join(globals_)}")
+        if self._scope.fallback:
+            unbound = sorted(self._scope.local(name) for name in self._scope.fallback)
+            self._line(f"{' = '.join(unbound)} = __pl_UNBOUND")
+
+        for param, name in prologue:
+            self._line(f"if {name} is __pl_UNSET:", param)
+            self._indent += 1
+            if param.default_value is not None:
+                self._line(f"{name} = ")
+                self._expression(param.default_value)
+            else:
+                message = f"Argument manquant pour le paramètre '{param.name}' de '{node.name}'"
+                self._line(f"__pl_raise({self.constant((message, None))})")
+            self._indent -= 1
+
+        self._block(node.body, tail=True)
+
+        self._indent -= 1
+        self._scope, self._loop_depth = outer_scope, outer_loops
+
+    def _statement_ReturnNode(self, node: ReturnNode, tail: bool):
+        self._line("return ", node)
+        if node.value is not None:
+            self._expression(node.value)
+        else:
+            self.write("None")
+
+    def _statement_IfNode(self, node: IfNode, tail: bool):
+        self._line("if ", node)
+        self._expression(node.condition)
+        self.write(":")
+        self._indent += 1
+        self._block(node.then_block, tail)
+        self._indent -= 1
+        if node.else_block:
+            self._line("else:", node)
+            self._indent += 1
+            self._block(node.else_block, tail)
+            self._indent -= 1
+
+    def _statement_WhileNode(self, node: WhileNode, tail: bool):
+        self._line("while ", node)
+        self._expression(node.condition)
+        self.write(":")
+        self._loop_body(node.body)
+
+    def _statement_ForNode(self, node: ForNode, tail: bool):
+        self._check_name(node.variable, node)
+        self._line(f"for {self._local(node.variable)} in __pl_iter(", node)
+        self._expression(node.iterable)
+        self.write(f", {self.constant(node)}):")
+        self._loop_body(node.body)
+
+    def _loop_body(self, body: List[ASTNode]):
+        self._indent += 1
+        self._loop_depth += 1
+        self._block(body, tail=False)
+        self._loop_depth -= 1
+        self._indent -= 1
+
+    def _statement_BreakNode(self, node: BreakNode, tail: bool):
+        if self._loop_depth:
+            self._line("break", node)
+        else:
+            message = "'break' ne peut être utilisé qu'à l'intérieur d'une boucle"
+            self._line(f"__pl_raise({self.constant((message, node))})", node)
+
+    def _statement_ContinueNode(self, node: ContinueNode, tail: bool):
+        if self._loop_depth:
+            self._line("continue", node)
+        else:
+            message = "'continue' ne peut être utilisé qu'à l'intérieur d'une boucle"
+            self._line(f"__pl_raise({self.constant((message, node))})", node)
+
+    # -------------------------------
+    # Expressions
+
+    def _expression(self, node: ASTNode):
+        method = getattr(self, f"_expression_{type(node).__name__}", None)
+        if method is None:
+            raise TranspileError(f"Nœud non supporté par la traduction Python: {type(node).__name__}", node)
+        method(node)
+
+    def _capture(self, node: ASTNode) -> str:
+        """Traduit une expression et retourne le texte généré"""
+        first = len(self._parts)
+        self._expression(node)
+        return "".join(self._parts[first:])
+
+    def _literal(self, node: ASTNode) -> str:
+        if isinstance(node, NumberNode):
+            if isinstance(node.value, float) and not math.isfinite(node.value):
+                return self.constant(node.value)
+            return repr(node.value)
+        if isinstance(node, StringNode):
+            return ascii(node.value)
+        if isinstance(node, BooleanNode):
+            return "True" if node.value else "False"
+        return "None"
+
+    def _expression_NoneNode(self, node: NoneNode):
+        self.write("None")
+
+    def _expression_NumberNode(self, node: NumberNode):
+        self.write(self._literal(node))
+
+    def _expression_StringNode(self, node: StringNode):
+        self.write(self._literal(node))
+
+    def _expression_BooleanNode(self, node: BooleanNode):
+        self.write(self._literal(node))
+
+    def _expression_ListNode(self, node: ListNode):
+        self.write("[")
+        for i, element in enumerate(node.elements):
+            if i:
+                self.write(", ")
+            self._expression(element)
+        self.write("]")
+
+    def _expression_DictionaryNode(self, node: DictionaryNode):
+        invalid = next((i for i, (key, _) in enumerate(node.pairs) if not isinstance(key, StringNode)), None)
+        if invalid is None:
+            self.write("{")
+            for i, (key, value) in enumerate(node.pairs):
+                if i:
+                    self.write(", ")
+                self.write(f"{self._literal(key)}: ")
+                self._expression(value)
+            self.write("}")
+            return
+
+        # Les valeurs précédant la clé invalide sont évaluées, puis la clé elle-même
+        self.write(f"__pl_invalid_key({self.constant(node)}")
+        for _, value in node.pairs[:invalid]:
+            self.write(", ")
+            self._expression(value)
+        self.write(", ")
+        self._expression(node.pairs[invalid][0])
+        self.write(")")
+
+    def _expression_IdentifierNode(self, node: IdentifierNode):
+        self._check_name(node.name, node)
+        self._read_name(node.name, node, False)
+
+    def _expression_BinaryOpNode(self, node: BinaryOpNode):
+        if node.operator in (BinaryOperatorType.AND, BinaryOperatorType.OR):
+            self.write("(")
+            self._expression(node.left)
+            self.write(f" {node.operator.value} ")
+            self._expression(node.right)
+            self.write(")")
+            return
+
+        if node.operator not in PYTHON_OPERATORS:
+            # 'is' / 'is not' : opérandes évalués, résultat None (comme l'évaluateur)
+            self.write("__pl_none(")
+            self._expression(node.left)
+            self.write(", ")
+            self._expression(node.right)
+            self.write(")")
+            return
+
+        self.write("(")
+        start = self._column
+        self._expression(node.left)
+        self.write(f" {PYTHON_OPERATORS[node.operator]} ")
+        self._expression(node.right)
+        self._span(BINARY, node, start, node.operator)
+        self.write(")")
+
+    def _expression_UnaryOpNode(self, node: UnaryOpNode):
+        self.write("(")
+        start = self._column
+        self.write(PYTHON_UNARY_OPERATORS[node.operator])
+        self._expression(node.operand)
+        self._span(UNARY, node, start)
+        self.write(")")
+
+    def _expression_TernaryNode(self, node: TernaryNode):
+        self.write("(")
+        self._expression(node.true_expr)
+        self.write(" if ")
+        self._expression(node.condition)
+        self.write(" else ")
+        self._expression(node.false_expr)
+        self.write(")")
+
+    def _expression_IndexNode(self, node: IndexNode):
+        if is_pure(node.collection) and is_pure(node.index):
+            # Indexation native : en cas d'erreur, les opérandes sont réévalués pour le message
+            start = self._column
+            collection = self._capture(node.collection)
+            self.write("[")
+            index = self._capture(node.index)
+            self.write("]")
+            self._span(INDEX, node, start, (collection, index))
+        else:
+            self.write("__pl_index(")
+            self._expression(node.collection)
+            self.write(", ")
+            self._expression(node.index)
+            self.write(f", {self.constant(node)})")
+
+    def _expression_AttributeNode(self, node: AttributeNode):
+        self.write("__pl_attr(")
+        self._expression(node.object)
+        self.write(f", {self.constant(node)})")
+
+    def _expression_CallNode(self, node: CallNode):
+        start = self._column
+        keywords = tuple(arg.name for arg in node.arguments)
+        has_keywords = any(name is not None for name in keywords)
+        if has_keywords:
+            self.write(f"__pl_call({self.constant((node, keywords))}, ")
+
+        callee = None  # source de la fonction appelée, si c'est un nom
+        if isinstance(node.function, str):
+            self._check_name(node.function, node)
+            first = len(self._parts)
+            self._read_name(node.function, node, True)
+            callee = "".join(self._parts[first:])
+        else:
+            self.write("__pl_callable(")
+            self._expression(node.function)
+            self.write(f", {self.constant(node)})")
+
+        self.write(", " if has_keywords else "(")
+        for i, arg in enumerate(node.arguments):
+            if i:
+                self.write(", ")
+            self._expression(arg.value)
+        self.write(")")
+
+        if has_keywords:
+            self._span(CALL_KW, node, start)
+        else:
+            self._span(CALL, node, start, callee)
@@ -0,0 +1,455 @@
+# pylpex/compiler/vm.py
+from typing import Any, List, Optional, Union
+from pylpex.parser.ASTNodes import ASTNode, BinaryOperatorType
+from pylpex.evaluator import Evaluator, Environment, ExecutionError
+from pylpex.evaluator.core import Function
+from pylpex.evaluator.builtin import BuiltinFunction, MemoizedFunction, MISSING
+from pylpex.evaluator.operators import BINARY_OPERATIONS, UNARY_OPERATIONS
+from .opcodes import *
+from .code import CodeObject, BINARY_OPERATORS, UNARY_OPERATORS
+from .core import Compiler
+
+
+class _Unbound:
+    """Valeur d'un slot local pas encore défini"""
+    def __repr__(self):
+        return "<unbound>"
+
+UNBOUND = _Unbound()
+
+DIVISION = BINARY_OPERATORS.index(BinaryOperatorType.DIV)
+
+def _divide(left, right):
+    if right == 0:
+        raise ZeroDivisionError
+    return left / right
+
+# Opérations indexées comme BINARY_OPERATORS / UNARY_OPERATORS (None : opérateur sans implémentation)
+BINARY_FUNCTIONS = [
+    _divide if operator == BinaryOperatorType.DIV else BINARY_OPERATIONS.get(operator)
+    for operator in BINARY_OPERATORS
+]
+UNARY_FUNCTIONS = [UNARY_OPERATIONS[operator] for operator in UNARY_OPERATORS]
+
+
+class Locals:
+    """Portée d'exécution d'un appel de fonction : valeurs indexées par slot"""
+    __slots__ = ("values", "parent", "code")
+
+    def __init__(self, values: List[Any], parent: Union['Locals', Environment], code: CodeObject):
+        self.values = values
+        self.parent = parent
+        self.code = code
+
+
+class VMFunction(Function):
+    """Fonction utilisateur compilée en bytecode"""
+    def __init__(self, code: CodeObject, closure: Union[Locals, Environment]):
+        super().__init__(code.name, code.parameters, [], closure, code.return_type)
+        self.code = code
+
+
+class VirtualMachine(Evaluator):
+    """
+    Machine virtuelle à pile qui exécute les CodeObject produits par le Compiler.
+
+    La boucle d'exécution est plate : un appel de fonction utilisateur empile une frame
+    au lieu de récurser en Python, la profondeur n'est donc limitée que par la mémoire.
+    """
+
+    supports_limits = False
+
+    def evaluate(self, node: ASTNode) -> Any:
+        """Compile puis exécute un AST"""
+        return self.execute(Compiler().compile(node))
+
+    def execute(self, code: CodeObject) -> Any:
+        """Exécute un programme compilé dans l'environnement global"""
+        return self._run(code, None)
+
+    # -------------------------------
+    # Résolution dynamique (slots non liés)
+
+    def _unbound_error(self, name: str, code: CodeObject, index: int) -> ExecutionError:
+        kind = "Fonction" if index in code.callee_loads else "Variable"
+        return ExecutionError(f"{kind} '{name}' non définie", code.location(index))
+
+    def _lookup_name(self, scope: Union[Locals, Environment], name: str, code: CodeObject, index: int) -> Any:
+        """Recherche par nom à partir d'une portée (comme Environment.lookup)"""
+        while isinstance(scope, Locals):
+            slot = scope.code.slots.get(name)
+            if slot is not None and scope.values[slot] is not UNBOUND:
+                return scope.values[slot]
+            scope = scope.parent
+        try:
+            return scope.lookup(name)
+        except ExecutionError:
+            raise self._unbound_error(name, code, index)
+
+    def _assign_name(self, scope: Union[Locals, Environment], name: str, value: Any):
+        """Réassigne un nom dans la première portée qui le définit (comme Environment.assign)"""
+        while isinstance(scope, Locals):
+            slot = scope.code.slots.get(name)
+            if slot is not None and scope.values[slot] is not UNBOUND:
+                scope.values[slot] = value
+                return
+            scope = scope.parent
+        scope.assign(name, value)
+
+    # -------------------------------
+    # Appels
+
+    def _bind_arguments(self, func: VMFunction, args: list, kwargs: dict, code: CodeObject, index: int) -> List[Any]:
+        """Lie les arguments aux slots de la fonction (les valeurs par défaut restent à lier par le prologue)"""
+        fcode = func.code
+        if len(args) > fcode.argcount:
+            raise ExecutionError(
+                f"Trop d'arguments pour '{func.name}': attendu {fcode.argcount}, reçu {len(args)}",
+                code.location(index)
+            )
+        values = args + [UNBOUND] * (len(fcode.varnames) - len(args))
+        for slot in range(len(args), fcode.argcount):
+            name = fcode.varnames[slot]
+            if name in kwargs:
+                values[slot] = kwargs[name]
+            elif not fcode.defaults[slot]:
+                raise ExecutionError(
+                    f"Argument manquant pour le paramètre '{name}' de '{func.name}'",
+                    code.location(index)
+                )
+        return values
+
+    # -------------------------------
+    # Boucle d'exécution
+
+    def _run(self, code: CodeObject, scope: Optional[Locals]) -> Any:
+        global_env = self.global_env
+        global_vars = global_env.vars
+        get_index = self._get_index
+
+        frames = []  # frames appelantes suspendues (et appel mémoïsé à mettre en cache au retour)
+        opcodes, args, constants, names = code.opcodes, code.args, code.constants, code.names
+        values = scope.values if scope is not None else None
+        stack = []
+        push, pop = stack.append, stack.pop
+        pc = 0
+
+        try:
+            while True:
+                op = opcodes[pc]
+                arg = args[pc]
+                pc += 1
+
+                if op == LOAD_FAST:
+                    value = values[arg]
+                    if value is UNBOUND:
+                        value = self._lookup_name(scope.parent, code.varnames[arg], code, pc - 1)
+                    push(value)
+
+                elif op == LOAD_CONST:
+                    push(constants[arg])
+
+                elif op == STORE_FAST:
+                    values[arg] = pop()
+
+                elif op == LOAD_GLOBAL:
+                    name = names[arg]
+                    if name in global_vars:
+                        push(global_vars[name])
+                    else:
+                        push(self._lookup_name(global_env, name, code, pc - 1))
+
+                elif op == BINARY_OP:
+                    right = pop()
+                    left = stack[-1]
+                    operation = BINARY_FUNCTIONS[arg]
+                    if operation is None:
+                        stack[-1] = None
+                        continue
+                    try:
+                        stack[-1] = operation(left, right)
+                    except Exception as e:
+                        if arg == DIVISION and isinstance(e, ZeroDivisionError):
+                            e = ExecutionError("Division par zéro", code.location(pc - 1))
+                        raise ExecutionError(f"Erreur d'opération: {e}", code.location(pc - 1))
+
+                elif op == POP_JUMP_IF_FALSE:
+                    if not pop():
+                        pc = arg
+
+                elif op == JUMP:
+                    pc = arg
+
+                elif op == CALL:
+                    if arg:
+                        call_args = stack[-arg:]
+                        del stack[-arg:]
+                    else:
+                        call_args = []
+                    func = pop()
+                    memo = None
+                    if func.__class__ is MemoizedFunction and func.function.__class__ is VMFunction:
+                        memo = self._memo_lookup(func, call_args, {}, code, pc - 1)
+                        if memo[1] is not MISSING:
+                            push(memo[1])
+                            continue
+                        func = func.function
+                    if isinstance(func, VMFunction):
+                        fcode = func.code
+                        try:
+                            if arg == fcode.argcount:
+                                call_args.extend([UNBOUND] * (len(fcode.varnames) - arg))
+                            else:
+                                call_args = self._bind_arguments(func, call_args, {}, code, pc - 1)
+                        except ExecutionError as e:
+                            raise ExecutionError(f"Erreur d'appel de fonction: {e}", code.location(pc - 1))
+                        frames.append((code, pc, stack, scope, memo))
+                        code = fcode
+                        opcodes, args, constants, names = code.opcodes, code.args, code.constants, code.names
+                        values = call_args
+                        scope = Locals(values, func.closure, code)
+                        stack = []
+                        push, pop = stack.append, stack.pop
+                        pc = 0
+                    else:
+                        push(self._call_native(func, call_args, {}, code, pc - 1))
+
+                elif op == RETURN_VALUE:
+                    value = pop()
+                    if not frames:
+                        return value
+                    code, pc, stack, scope, memo = frames.pop()
+                    if memo is not None:
+                        memo[0].store(memo[2], value)
+                    opcodes, args, constants, names = code.opcodes, code.args, code.constants, code.names
+                    values = scope.values if scope is not None else None
+                    push, pop = stack.append, stack.pop
+                    push(value)
+
+                elif op == INPLACE_OP:
+                    current = pop()
+                    try:
+                        stack[-1] = BINARY_FUNCTIONS[arg](current, stack[-1])
+                    except Exception as e:
+                        if arg == DIVISION and isinstance(e, ZeroDivisionError):
+                            e = ExecutionError("Division par zéro", code.location(pc - 1))
+                        raise ExecutionError(f"Erreur d'opération: {e}", code.location(pc - 1))
+
+                elif op == ASSIGN_FAST:
+                    value = pop()
+                    if values[arg] is UNBOUND:
+                        self._assign_name(scope.parent, code.varnames[arg], value)
+                    else:
+                        values[arg] = value
+
+                elif op == STORE_GLOBAL:
+                    global_vars[names[arg]] = pop()
+
+                elif op == ASSIGN_GLOBAL:
+                    global_env.assign(names[arg], pop())
+
+                elif op == FOR_ITER:
+                    value = next(stack[-1], UNBOUND)
+                    if value is UNBOUND:
+                        pop()
+                        pc = arg
+                    else:
+                        push(value)
+
+                elif op == BINARY_SUBSCR:
+                    index = pop()
+                    collection = stack[-1]
+                    if type(collection) is list and type(index) is int and -len(collection) <= index < len(collection):
+                        stack[-1] = collection[index]
+                    else:
+                        stack[-1] = get_index(collection, index, code.location(pc - 1))
+
+                elif op == POP_TOP:
+                    pop()
+
+                elif op == DUP_TOP:
+                    push(stack[-1])
+
+                elif op == LOAD_DEREF:
+                    target = scope
+                    for _ in range(arg >> DEREF_SHIFT):
+                        target = target.parent
+                    value = target.values[arg & DEREF_MASK]
+                    if value is UNBOUND:
+                        value = self._lookup_name(target.parent, target.code.varnames[arg & DEREF_MASK], code, pc - 1)
+                    push(value)
+
+                elif op == ASSIGN_DEREF:
+                    target = scope
+                    for _ in range(arg >> DEREF_SHIFT):
+                        target = target.parent
+                    value = pop()
+                    if target.values[arg & DEREF_MASK] is UNBOUND:
+                        self._assign_name(target.parent, target.code.varnames[arg & DEREF_MASK], value)
+                    else:
+                        target.values[arg & DEREF_MASK] = value
+
+                elif op == JUMP_IF_FALSE_OR_POP:
+                    if not stack[-1]:
+                        pc = arg
+                    else:
+                        pop()
+
+                elif op == JUMP_IF_TRUE_OR_POP:
+                    if stack[-1]:
+                        pc = arg
+                    else:
+                        pop()
+
+                elif op == UNARY_OP:
+                    try:
+                        stack[-1] = UNARY_FUNCTIONS[arg](stack[-1])
+                    except Exception as e:
+                        raise ExecutionError(f"Erreur d'opération unaire: {e}", code.location(pc - 1))
+
+                elif op == GET_ITER:
+                    iterable = stack[-1]
+                    try:
+                        stack[-1] = iter(iterable)
+                    except TypeError:
+                        raise ExecutionError(
+                            f"L'objet de type '{type(iterable).__name__}' n'est pas itérable",
+                            code.location(pc - 1)
+                        )
+
+                elif op == BUILD_LIST:
+                    if arg:
+                        items = stack[-arg:]
+                        del stack[-arg:]
+                    else:
+                        items = []
+                    push(items)
+
+                elif op == BUILD_DICT:
+                    if arg:
+                        items = stack[-2 * arg:]
+                        del stack[-2 * arg:]
+                        push(dict(zip(items[::2], items[1::2])))
+                    else:
+                        push({})
+
+                elif op == STORE_SUBSCR:
+                    index = pop()
+                    collection = pop()
+                    try:
+                        collection[index] = stack[-1]
+                    except (TypeError, KeyError, IndexError) as e:
+                        raise ExecutionError(f"Erreur d'assignation: {e}", code.location(pc - 1))
+
+                elif op == COMPOUND_SUBSCR:
+                    index = pop()
+                    collection = pop()
+                    location = code.location(pc - 1)
+                    try:
+                        current = collection[index]
+                    except (TypeError, KeyError, IndexError) as e:
+                        raise ExecutionError(f"Erreur de lecture: {e}", location)
+                    try:
+                        value = BINARY_FUNCTIONS[arg](current, stack[-1])
+                    except Exception as e:
+                        if arg == DIVISION and isinstance(e, ZeroDivisionError):
+                            e = ExecutionError("Division par zéro", location)
+                        raise ExecutionError(f"Erreur d'opération: {e}", location)
+                    try:
+                        collection[index] = value
+                    except (TypeError, KeyError, IndexError) as e:
+                        raise ExecutionError(f"Erreur d'assignation: {e}", location)
+                    stack[-1] = value
+
+                elif op == LOAD_ATTR:
+                    obj = stack[-1]
+                    try:
+                        stack[-1] = getattr(obj, names[arg])
+                    except AttributeError:
+                        raise ExecutionError(
+                            f"L'objet de type '{type(obj).__name__}' n'a pas d'attribut '{names[arg]}'",
+                            code.location(pc - 1)
+                        )
+
+                elif op == MAKE_FUNCTION:
+                    push(VMFunction(constants[arg], scope if scope is not None else global_env))
+
+                elif op == CALL_KW:
+                    argument_names = constants[arg]
+                    count = len(argument_names)
+                    items = stack[-count:]
+                    del stack[-count:]
+                    func = pop()
+                    call_args = [value for name, value in zip(argument_names, items) if name is None]
+                    kwargs = {name: value for name, value in zip(argument_names, items) if name is not None}
+                    memo = None
+                    if func.__class__ is MemoizedFunction and func.function.__class__ is VMFunction:
+                        memo = self._memo_lookup(func, call_args, kwargs, code, pc - 1)
+                        if memo[1] is not MISSING:
+                            push(memo[1])
+                            continue
+                        func = func.function
+                    if isinstance(func, VMFunction):
+                        try:
+                            call_args = self._bind_arguments(func, call_args, kwargs, code, pc - 1)
+                        except ExecutionError as e:
+                            raise ExecutionError(f"Erreur d'appel de fonction: {e}", code.location(pc - 1))
+                        frames.append((code, pc, stack, scope, memo))
+                        code = func.code
+                        opcodes, args, constants, names = code.opcodes, code.args, code.constants, code.names
+                        values = call_args
+                        scope = Locals(values, func.closure, code)
+                        stack = []
+                        push, pop = stack.append, stack.pop
+                        pc = 0
+                    else:
+                        push(self._call_native(func, call_args, kwargs, code, pc - 1))
+
+                elif op == LOAD_PARAM:
+                    push(values[arg])
+
+                elif op == BIND_DEFAULT:
+                    if pop() is not UNBOUND:
+                        pc = arg
+
+                elif op == INVALID_DICT_KEY:
+                    key_type = self._infer_type(pop())
+                    raise ExecutionError(f"Clé de dictionnaire non hashable pour le type: {key_type}", code.location(pc - 1))
+
+                elif op == RAISE_ERROR:
+                    raise ExecutionError(constants[arg], code.location(pc - 1))
+
+                else:
+                    raise RuntimeError(f"Opcode inconnu: {op}")
+
+        except Exception as error:
+            # Remonte les frames appelantes comme le ferait visit_CallNode
+            while frames:
+                caller, caller_pc, _, _, _ = frames.pop()
+                if isinstance(error, (TypeError, ExecutionError)):
+                    error = ExecutionError(f"Erreur d'appel de fonction: {error}", caller.location(caller_pc - 1))
+            raise error
+
+    def call_function(self, func: Any, args: list) -> Any:
+        if isinstance(func, VMFunction):
+            # Nouvelle boucle d'exécution : le prologue de la fonction lie les valeurs par défaut
+            values = self._bind_arguments(func, list(args), {}, func.code, 0)
+            return self._run(func.code, Locals(values, func.closure, func.code))
+        return super().call_function(func, args)
+
+    def _memo_lookup(self, func: MemoizedFunction, args: list, kwargs: dict, code: CodeObject, index: int) -> tuple:
+        """Consulte le cache d'une fonction mémoïsée : (fonction, résultat ou MISSING, clé)"""
+        try:
+            key = func.key(args, kwargs)
+            return func, func.get(key), key
+        except ExecutionError as e:
+            raise ExecutionError(f"Erreur d'appel de fonction: {e}", code.location(index))
+
+    def _call_native(self, func: Any, args: list, kwargs: dict, code: CodeObject, index: int) -> Any:
+        """Appelle une fonction qui n'est pas compilée en bytecode (builtin)"""
+        try:
+            if isinstance(func, BuiltinFunction):
+                return func(*args, **kwargs)
+            raise ExecutionError(f"'{func}' n'est pas appelable", code.location(index))
+        except (TypeError, ExecutionError) as e:
+            raise ExecutionError(f"Erreur d'appel de fonction: {e}", code.location(index))
@@ -1,9 +1,22 @@
 from .core import Evaluator
+from .closure import ClosureEvaluator
+from .stack import StackEvaluator
+from .profiler import ProfilingEvaluator, Profile
+from .tracer import TracingEvaluator, CallTrace
 from .environment import Environment
-from .exception import ExecutionError
+from .exception import ExecutionError, LimitExceededError
+from .limits import ExecutionLimits
 
 __all__ = [
     "Evaluator",
+    "ClosureEvaluator",
+    "StackEvaluator",
+    "ProfilingEvaluator",
+    "Profile",
+    "TracingEvaluator",
+    "CallTrace",
     "Environment",
-    "ExecutionError"
+    "ExecutionError",
+    "LimitExceededError",
+    "ExecutionLimits"
 ]
\ No newline at end of file
@@ -1,8 +1,11 @@
 
-from typing import List, Optional, Callable
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from functools import wraps
 from pylpex.typesystem import TypeInfo, BaseType
+from .environment import BuiltinsEnvironment
 from .exception import ExecutionError
+from .range import Range
 
 class BuiltinFunction:
     """Représente une fonction builtin (native) avec typage statique connu."""
@@ -25,6 +28,86 @@ class BuiltinFunction:
         return f"<builtin-function {self.name}>"
 
 
+# Absence de résultat dans le cache d'une MemoizedFunction (none est un résultat valide)
+MISSING = object()
+
+
+class MemoizedFunction(BuiltinFunction):
+    """
+    Fonction retournée par le builtin memoize : les résultats sont conservés dans un
+    cache LRU borné, indexé par les valeurs (hashables) des arguments et par leurs types
+    (1, true et 1.0 sont des entrées distinctes). Les arguments nommés sont refusés.
+
+    Les évaluateurs "stack" et "bytecode" appellent eux-mêmes la fonction mémoïsée
+    (cf. key, get et store) : la profondeur de récursion est la même que sans memoize.
+    Ailleurs, chaque appel non mis en cache passe par Evaluator.call_function et
+    reste limité par la pile Python (RecursionError vers 3000 appels imbriqués).
+    """
+    def __init__(
+        self,
+        function: Any,
+        call: Callable[[Any, list], Any],
+        maxsize: Optional[int],
+        arg_types: Optional[List[TypeInfo]] = None,
+        return_type: Optional[TypeInfo] = None
+    ):
+        super().__init__("memoize", self._call, arg_types, return_type)
+        self.function = function
+        self._call_function = call  # appel d'une fonction Pylpex par l'évaluateur (cf. Evaluator.call_function)
+        self.maxsize = maxsize
+        self.cache: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, args: Tuple, kwargs: dict) -> Tuple:
+        """Clé de cache d'un appel"""
+        if kwargs:
+            raise ExecutionError(f"{self!r}: les arguments nommés ne sont pas supportés")
+        return tuple(args) + tuple(type(arg) for arg in args)
+
+    def get(self, key: Tuple) -> Any:
+        """Résultat en cache pour une clé, ou MISSING"""
+        try:
+            result = self.cache.get(key, MISSING)
+        except TypeError:
+            raise ExecutionError(f"{self!r}: les arguments doivent être hashables (pas de liste ni de dictionnaire)")
+        if result is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.cache.move_to_end(key)
+        return result
+
+    def store(self, key: Tuple, result: Any):
+        """Met en cache le résultat d'un appel"""
+        self.cache[key] = result
+        if self.maxsize is not None and len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+            self.evictions += 1
+
+    def _call(self, *args, **kwargs):
+        key = self.key(args, kwargs)
+        result = self.get(key)
+        if result is MISSING:
+            result = self._call_function(self.function, list(args))
+            self.store(key, result)
+        return result
+
+    def cache_info(self) -> dict:
+        """Statistiques du cache"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.cache),
+            "maxsize": self.maxsize,
+        }
+
+    def __repr__(self) -> str:
+        return f"<memoized {self.function!r}>"
+
+
 # Décorateur pour définir facilement des builtins
 def builtin(
     name: str = None,
@@ -48,25 +131,45 @@ def builtin(
 class BuiltinMixin:
 
     def _setup_builtins(self):
-        """Enregistre automatiquement toutes les fonctions built-in."""
-        
-        # Collecte automatique de toutes les fonctions décorées avec @builtin
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            
-            # Vérifier si c'est une méthode avec métadonnées builtin
-            if callable(attr) and hasattr(attr, '_builtin_meta'):
-                meta = attr._builtin_meta
+        """
+        Crée la portée des builtins de l'évaluateur et y rattache l'environnement global.
+
+        Les fonctions décorées avec @builtin sont collectées une seule fois par classe
+        (cf. _builtin_specs) : créer un évaluateur ne fait plus que lier chacune d'elles.
+        """
+        self.builtins_env = BuiltinsEnvironment({
+            meta['name']: BuiltinFunction(
+                name=meta['name'],
+                func=func.__get__(self),  # méthode bindée : les builtins peuvent utiliser l'évaluateur
+                arg_types=meta['arg_types'],
+                return_type=meta['return_type']
+            )
+            for func, meta in self._builtin_specs()
+        })
 
-                # Créer un BuiltinFunction avec la méthode déjà bindée à self
-                builtin_func = BuiltinFunction(
-                    name=meta['name'],
-                    func=attr,  # attr est déjà une méthode bindée (self est capturé)
-                    arg_types=meta['arg_types'],
-                    return_type=meta['return_type']
-                )
-                
-                self.global_env.define(meta['name'], builtin_func)
+        # La portée des builtins devient la racine de l'environnement global
+        # (en remplaçant celle d'un éventuel évaluateur précédent)
+        env = self.global_env
+        while env.parent is not None and not isinstance(env.parent, BuiltinsEnvironment):
+            env = env.parent
+        env.parent = self.builtins_env
+
+    @classmethod
+    def _builtin_specs(cls) -> List[Tuple[Callable, Dict[str, Any]]]:
+        """Fonctions @builtin (non liées) de la classe et leurs métadonnées, collectées au premier appel"""
+        specs = cls.__dict__.get('_builtins')
+        if specs is None:
+            functions = {}
+            # Des classes de base vers la classe : une redéfinition remplace la méthode héritée
+            for klass in reversed(cls.__mro__):
+                for attr_name, attr in vars(klass).items():
+                    if callable(attr) and hasattr(attr, '_builtin_meta'):
+                        functions[attr_name] = attr
+                    else:
+                        functions.pop(attr_name, None)
+            specs = [(func, func._builtin_meta) for func in functions.values()]
+            cls._builtins = specs
+        return specs
 
     # =========================================================================
     # Type introspection
@@ -215,16 +318,23 @@ class BuiltinMixin:
         return_type=TypeInfo(BaseType.INTEGER)
     )
     def _builtin_len(self, x):
-        if isinstance(x, (str, list)):
+        if isinstance(x, (str, list, Range)):
             return len(x)
         raise ExecutionError(f"len() s'attend à un argument de type string ou list, a reçu {self._infer_type(x)}")
     
+    def _check_mutable(self, lst):
+        if isinstance(lst, Range):
+            raise ExecutionError("Un range ne peut pas être modifié, utilisez copy() pour obtenir une liste")
+
     @builtin(
         name="append",
         arg_types=[TypeInfo(BaseType.LIST), TypeInfo(BaseType.ANY)],
         return_type=TypeInfo(BaseType.NONE)
     )
     def _builtin_append(self, lst, x):
+        self._check_mutable(lst)
+        if self._max_collection_size is not None:
+            self._check_size(len(lst) + 1)
         lst.append(x)
         return None
     
@@ -234,6 +344,7 @@ class BuiltinMixin:
         return_type=TypeInfo(BaseType.ANY)
     )
     def _builtin_pop(self, lst):
+        self._check_mutable(lst)
         return lst.pop()
     
     @builtin(
@@ -242,6 +353,8 @@ class BuiltinMixin:
         return_type=TypeInfo(BaseType.LIST)
     )
     def _builtin_copy(self, lst):
+        if self._max_collection_size is not None:
+            self._check_size(len(lst))
         return lst.copy()
     
     @builtin(
@@ -250,6 +363,7 @@ class BuiltinMixin:
         return_type=TypeInfo(BaseType.NONE)
     )
     def _builtin_reverse(self, lst):
+        self._check_mutable(lst)
         lst.reverse()
         return None
     
@@ -259,6 +373,7 @@ class BuiltinMixin:
         return_type=TypeInfo(BaseType.NONE)
     )
     def _builtin_sort(self, lst):
+        self._check_mutable(lst)
         lst.sort()
         return None
     
@@ -270,4 +385,32 @@ class BuiltinMixin:
     def _builtin_range(self, start, end):
         if not isinstance(start, int) or not isinstance(end, int):
             raise ExecutionError("range() attend deux entiers")
-        return list(range(start, end + 1))
+        return Range(start, end)
+
+    # =========================================================================
+    # Functions
+    # =========================================================================
+    
+    @builtin(
+        name="memoize",
+        arg_types=[TypeInfo(BaseType.CALLABLE), TypeInfo(BaseType.OPTIONAL, TypeInfo(BaseType.INTEGER))],
+        return_type=TypeInfo(BaseType.CALLABLE)
+    )
+    def _builtin_memoize(self, f, maxsize=128):
+        function_type = self._infer_type(f)
+        if function_type.base != BaseType.CALLABLE:
+            raise ExecutionError(f"memoize() attend une fonction, a reçu {function_type}")
+        if maxsize is not None and (not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize < 1):
+            raise ExecutionError("memoize() attend une taille de cache entière strictement positive (ou none)")
+        arg_types, return_type = function_type.subtypes
+        return MemoizedFunction(f, self.call_function, maxsize, arg_types.subtypes, return_type)
+
+    @builtin(
+        name="cache_info",
+        arg_types=[TypeInfo(BaseType.CALLABLE)],
+        return_type=TypeInfo(BaseType.DICTIONARY, [TypeInfo(BaseType.STRING), TypeInfo(BaseType.INTEGER)])
+    )
+    def _builtin_cache_info(self, f):
+        if not isinstance(f, MemoizedFunction):
+            raise ExecutionError("cache_info() attend une fonction retournée par memoize()")
+        return f.cache_info()
@@ -0,0 +1,538 @@
+from typing import Any, Callable, List, Optional
+from pylpex.parser.ASTNodes import *
+from pylpex.typesystem import TypeInfo
+from .environment import Environment
+from .exception import ExecutionError
+from .builtin import BuiltinFunction
+from .operators import BINARY_OPERATIONS, UNARY_OPERATIONS, COMPOUND_TO_BINARY
+from .core import Evaluator, Function
+
+
+# Code compilé : une fermeture qui prend l'environnement courant et retourne une valeur
+Code = Callable[[Environment], Any]
+
+# Signaux de contrôle (remplacent les exceptions return / break / continue)
+_NORMAL = 0
+_BREAK = 1
+_CONTINUE = 2
+_RETURN = 3
+
+_EMPTY_KWARGS = {}
+
+CONSTANT_NODES = (NoneNode, NumberNode, StringNode, BooleanNode)
+
+
+def _division(node: ASTNode) -> Callable[[Any, Any], Any]:
+    """Division avec le même message d'erreur que l'évaluateur arborescent"""
+    def divide(left, right):
+        if right == 0:
+            raise ExecutionError("Division par zéro", node)
+        return left / right
+    return divide
+
+
+def has_control_flow(statement: ASTNode) -> bool:
+    """Indique si un statement peut émettre un signal return / break / continue"""
+    if isinstance(statement, (ReturnNode, BreakNode, ContinueNode)):
+        return True
+    if isinstance(statement, IfNode):
+        return any(has_control_flow(s) for s in statement.then_block) or \
+            any(has_control_flow(s) for s in statement.else_block or [])
+    if isinstance(statement, (WhileNode, ForNode)):
+        return any(has_control_flow(s) for s in statement.body)
+    return False
+
+
+class CompiledFunction(Function):
+    """Fonction utilisateur dont le corps et les valeurs par défaut sont déjà compilés"""
+    def __init__(self, name: str, parameters: List[ParameterNode], body: List[ASTNode], closure: Environment,
+                 return_type: Optional[TypeInfo], code: Code, defaults: List[Optional[Code]]):
+        super().__init__(name, parameters, body, closure, return_type)
+        self.code = code
+        self.defaults = defaults
+        self.names = [param.name for param in parameters]
+
+
+class ClosureEvaluator(Evaluator):
+    """
+    Évaluateur qui compile l'AST une seule fois en un arbre de fermetures Python.
+    Chaque nœud devient une fonction `code(env)` dont l'opérateur et les sous-nœuds
+    sont déjà résolus : l'exécution ne passe plus par `visit` ni par les chaînes de if.
+    Les instructions return / break / continue sont signalées par une valeur de contrôle.
+    """
+
+    supports_limits = False
+
+    def __init__(self, global_env: Optional[Environment] = None, strict_typing = False):
+        super().__init__(global_env, strict_typing)
+        self._control = [_NORMAL, None]  # [signal, valeur de retour]
+
+    def evaluate(self, node: ASTNode) -> Any:
+        """Compile puis exécute un AST dans l'environnement courant"""
+        code = self.compile(node)
+        control = self._control
+        control[0] = _NORMAL
+        result = code(self.current_env)
+        if control[0] == _RETURN:
+            result = control[1]
+        control[0], control[1] = _NORMAL, None
+        return result
+
+    def compile(self, node: ASTNode) -> Code:
+        """Compile un nœud en fermeture"""
+        method = getattr(self, f"_compile_{type(node).__name__}", None)
+        if method is None:
+            raise NotImplementedError(f"Aucune méthode _compile_{type(node).__name__}")
+        return method(node)
+
+    def _compile_block(self, statements: List[ASTNode]) -> Code:
+        """Compile une suite d'instructions qui retourne la valeur de la dernière"""
+        codes = [self.compile(statement) for statement in statements]
+        control = self._control
+
+        if not codes:
+            return lambda env: None
+        if len(codes) == 1:
+            return codes[0]
+
+        if any(has_control_flow(statement) for statement in statements):
+            def block(env):
+                result = None
+                for code in codes:
+                    result = code(env)
+                    if control[0]:
+                        break
+                return result
+        else:
+            def block(env):
+                result = None
+                for code in codes:
+                    result = code(env)
+                return result
+        return block
+
+    # -------------------------------
+    # Program structure
+
+    def _compile_ProgramNode(self, node: ProgramNode) -> Code:
+        return self._compile_block(node.statements)
+
+    # -------------------------------
+    # Literals
+
+    def _compile_constant(self, node: ASTNode) -> Code:
+        value = None if isinstance(node, NoneNode) else node.value
+        return lambda env: value
+
+    _compile_NoneNode = _compile_constant
+    _compile_NumberNode = _compile_constant
+    _compile_StringNode = _compile_constant
+    _compile_BooleanNode = _compile_constant
+
+    def _compile_ListNode(self, node: ListNode) -> Code:
+        elements = [self.compile(element) for element in node.elements]
+        return lambda env: [element(env) for element in elements]
+
+    def _compile_DictionaryNode(self, node: DictionaryNode) -> Code:
+        entries = []
+        for key_node, value_node in node.pairs:
+            if isinstance(key_node, StringNode):
+                entries.append((key_node.value, self.compile(value_node), None))
+            else:
+                entries.append((None, None, self.compile(key_node)))
+        infer_type = self._infer_type
+
+        def dictionary(env):
+            result = {}
+            for key, value, invalid_key in entries:
+                if invalid_key is not None:
+                    key_type = infer_type(invalid_key(env))
+                    raise ExecutionError(f"Clé de dictionnaire non hashable pour le type: {key_type}", node)
+                result[key] = value(env)
+            return result
+        return dictionary
+
+    # -------------------------------
+    # Variables
+
+    def _compile_IdentifierNode(self, node: IdentifierNode) -> Code:
+        name = node.name
+
+        def identifier(env):
+            while env is not None:
+                variables = env.vars
+                if name in variables:
+                    return variables[name]
+                env = env.parent
+            raise ExecutionError(f"Variable '{name}' non définie", node)
+        return identifier
+
+    def _compile_operation(self, operator_type: BinaryOperatorType, node: ASTNode) -> Callable[[Any, Any], Any]:
+        """Résout l'opération Python associée à un opérateur binaire"""
+        if operator_type == BinaryOperatorType.DIV:
+            return _division(node)
+        return BINARY_OPERATIONS.get(operator_type)
+
+    def _compile_AssignmentNode(self, node: AssignmentNode) -> Code:
+        value_code = self.compile(node.value)
+        target = node.target
+
+        if isinstance(target, IdentifierNode):
+            name = target.name
+
+            if node.operator == AssignmentOperatorType.ASSIGN:
+                def assign(env):
+                    value = value_code(env)
+                    env.vars[name] = value
+                    return value
+                return assign
+
+            operation = self._compile_operation(COMPOUND_TO_BINARY[node.operator], node)
+
+            def compound_assign(env):
+                value = value_code(env)
+                scope = env
+                while scope is not None and name not in scope.vars:
+                    scope = scope.parent
+                if scope is None:
+                    raise ExecutionError(f"Variable '{name}' non définie", node)
+                try:
+                    value = operation(scope.vars[name], value)
+                except Exception as e:
+                    raise ExecutionError(f"Erreur d'opération: {e}", node)
+                scope.vars[name] = value
+                return value
+            return compound_assign
+
+        if isinstance(target, IndexNode):
+            collection_code = self.compile(target.collection)
+            index_code = self.compile(target.index)
+
+            if node.operator == AssignmentOperatorType.ASSIGN:
+                def assign_index(env):
+                    value = value_code(env)
+                    collection = collection_code(env)
+                    index = index_code(env)
+                    try:
+                        collection[index] = value
+                    except (TypeError, KeyError, IndexError) as e:
+                        raise ExecutionError(f"Erreur d'assignation: {e}", node)
+                    return value
+                return assign_index
+
+            operation = self._compile_operation(COMPOUND_TO_BINARY[node.operator], node)
+
+            def compound_assign_index(env):
+                value = value_code(env)
+                collection = collection_code(env)
+                index = index_code(env)
+                try:
+                    current = collection[index]
+                except (TypeError, KeyError, IndexError) as e:
+                    raise ExecutionError(f"Erreur de lecture: {e}", node)
+                try:
+                    value = operation(current, value)
+                except Exception as e:
+                    raise ExecutionError(f"Erreur d'opération: {e}", node)
+                try:
+                    collection[index] = value
+                except (TypeError, KeyError, IndexError) as e:
+                    raise ExecutionError(f"Erreur d'assignation: {e}", node)
+                return value
+            return compound_assign_index
+
+        def invalid_target(env):
+            value_code(env)
+            raise ExecutionError(f"Target d'assignation invalide: {type(target).__name__}", node)
+        return invalid_target
+
+    # -------------------------------
+    # Operators
+
+    def _compile_BinaryOpNode(self, node: BinaryOpNode) -> Code:
+        left = self.compile(node.left)
+        right = self.compile(node.right)
+
+        # Court-circuit pour 'and' et 'or'
+        if node.operator == BinaryOperatorType.AND:
+            return lambda env: left(env) and right(env)
+        if node.operator == BinaryOperatorType.OR:
+            return lambda env: left(env) or right(env)
+
+        operation = self._compile_operation(node.operator, node)
+        if operation is None:
+            # Opérateur sans implémentation (is, is not) : même résultat que l'évaluateur arborescent
+            def unsupported(env):
+                left(env)
+                right(env)
+                return None
+            return unsupported
+
+        # Opérande droite constante : évite un appel de fermeture
+        if isinstance(node.right, CONSTANT_NODES):
+            constant = None if isinstance(node.right, NoneNode) else node.right.value
+
+            def binary_constant(env):
+                left_value = left(env)
+                try:
+                    return operation(left_value, constant)
+                except Exception as e:
+                    raise ExecutionError(f"Erreur d'opération: {e}", node)
+            return binary_constant
+
+        def binary(env):
+            left_value = left(env)
+            right_value = right(env)
+            try:
+                return operation(left_value, right_value)
+            except Exception as e:
+                raise ExecutionError(f"Erreur d'opération: {e}", node)
+        return binary
+
+    def _compile_UnaryOpNode(self, node: UnaryOpNode) -> Code:
+        operand = self.compile(node.operand)
+        operation = UNARY_OPERATIONS[node.operator]
+
+        def unary(env):
+            value = operand(env)
+            try:
+                return operation(value)
+            except Exception as e:
+                raise ExecutionError(f"Erreur d'opération unaire: {e}", node)
+        return unary
+
+    def _compile_TernaryNode(self, node: TernaryNode) -> Code:
+        condition = self.compile(node.condition)
+        true_expr = self.compile(node.true_expr)
+        false_expr = self.compile(node.false_expr)
+        return lambda env: true_expr(env) if condition(env) else false_expr(env)
+
+    # -------------------------------
+    # Expressions
+
+    def _compile_IndexNode(self, node: IndexNode) -> Code:
+        collection_code = self.compile(node.collection)
+        index_code = self.compile(node.index)
+        get_index = self._get_index
+
+        def index(env):
+            collection = collection_code(env)
+            index = index_code(env)
+            # Chemin rapide : liste indexée par un entier dans les bornes
+            if type(collection) is list and type(index) is int and -len(collection) <= index < len(collection):
+                return collection[index]
+            return get_index(collection, index, node)
+        return index
+
+    def _compile_AttributeNode(self, node: AttributeNode) -> Code:
+        object_code = self.compile(node.object)
+        attribute = node.attribute
+
+        def attribute_access(env):
+            obj = object_code(env)
+            try:
+                return getattr(obj, attribute)
+            except AttributeError:
+                raise ExecutionError(
+                    f"L'objet de type '{type(obj).__name__}' n'a pas d'attribut '{attribute}'",
+                    node
+                )
+        return attribute_access
+
+    # -------------------------------
+    # Fonctions
+
+    def _compile_CallNode(self, node: CallNode) -> Code:
+        if isinstance(node.function, str):
+            name = node.function
+
+            def callee(env):
+                while env is not None:
+                    variables = env.vars
+                    if name in variables:
+                        return variables[name]
+                    env = env.parent
+                raise ExecutionError(f"Fonction '{name}' non définie", node)
+        else:
+            callee = self.compile(node.function)
+
+        arguments = [(arg.name, self.compile(arg.value)) for arg in node.arguments]
+        call_function = self._call_compiled_function
+
+        if all(name is None for name, _ in arguments):
+            positional = [code for _, code in arguments]
+
+            def call(env):
+                func = callee(env)
+                args = [arg(env) for arg in positional]
+                try:
+                    if isinstance(func, CompiledFunction):
+                        return call_function(func, args, _EMPTY_KWARGS, node)
+                    elif isinstance(func, BuiltinFunction):
+                        return func(*args)
+                    else:
+                        raise ExecutionError(f"'{func}' n'est pas appelable", node)
+                except (TypeError, ExecutionError) as e:
+                    raise ExecutionError(f"Erreur d'appel de fonction: {e}", node)
+            return call
+
+        def call_with_keywords(env):
+            func = callee(env)
+            args = []
+            kwargs = {}
+            for name, code in arguments:
+                if name is None:
+                    args.append(code(env))
+                else:
+                    kwargs[name] = code(env)
+            try:
+                if isinstance(func, CompiledFunction):
+                    return call_function(func, args, kwargs, node)
+                elif isinstance(func, BuiltinFunction):
+                    return func(*args, **kwargs)
+                else:
+                    raise ExecutionError(f"'{func}' n'est pas appelable", node)
+            except (TypeError, ExecutionError) as e:
+                raise ExecutionError(f"Erreur d'appel de fonction: {e}", node)
+        return call_with_keywords
+
+    def call_function(self, func: Any, args: list) -> Any:
+        if isinstance(func, CompiledFunction):
+            return self._call_compiled_function(func, args, _EMPTY_KWARGS, None)
+        return super().call_function(func, args)
+
+    def _call_compiled_function(self, func: CompiledFunction, args: list, kwargs: dict, node: ASTNode) -> Any:
+        """Appelle une fonction compilée"""
+        names = func.names
+        if len(args) > len(names):
+            raise ExecutionError(
+                f"Trop d'arguments pour '{func.name}': attendu {len(names)}, reçu {len(args)}",
+                node
+            )
+
+        func_env = Environment(parent=func.closure)
+        variables = func_env.vars
+        for name, value in zip(names, args):
+            variables[name] = value
+
+        # Arguments nommés et valeurs par défaut
+        for i in range(len(args), len(names)):
+            name = names[i]
+            if name in kwargs:
+                variables[name] = kwargs[name]
+            elif func.defaults[i] is not None:
+                variables[name] = func.defaults[i](func_env)
+            else:
+                raise ExecutionError(
+                    f"Argument manquant pour le paramètre '{name}' de '{func.name}'",
+                    node
+                )
+
+        result = func.code(func_env)
+        control = self._control
+        if control[0] == _RETURN:
+            result = control[1]
+            control[0], control[1] = _NORMAL, None
+        return result
+
+    def _compile_FunctionDefNode(self, node: FunctionDefNode) -> Code:
+        code = self._compile_block(node.body)
+        defaults = [
+            self.compile(param.default_value) if param.default_value is not None else None
+            for param in node.parameters
+        ]
+
+        def define_function(env):
+            func = CompiledFunction(node.name, node.parameters, node.body, env, node.return_type, code, defaults)
+            env.vars[node.name] = func
+            return None
+        return define_function
+
+    def _compile_ReturnNode(self, node: ReturnNode) -> Code:
+        value_code = self.compile(node.value) if node.value else (lambda env: None)
+        control = self._control
+
+        def return_statement(env):
+            control[1] = value_code(env)
+            control[0] = _RETURN
+            return None
+        return return_statement
+
+    # -------------------------------
+    # Statements
+
+    def _compile_IfNode(self, node: IfNode) -> Code:
+        condition = self.compile(node.condition)
+        then_block = self._compile_block(node.then_block)
+        else_block = self._compile_block(node.else_block) if node.else_block else (lambda env: None)
+        return lambda env: then_block(env) if condition(env) else else_block(env)
+
+    def _compile_BreakNode(self, node: BreakNode) -> Code:
+        control = self._control
+
+        def break_statement(env):
+            control[0] = _BREAK
+            return None
+        return break_statement
+
+    def _compile_ContinueNode(self, node: ContinueNode) -> Code:
+        control = self._control
+
+        def continue_statement(env):
+            control[0] = _CONTINUE
+            return None
+        return continue_statement
+
+    def _compile_WhileNode(self, node: WhileNode) -> Code:
+        condition = self.compile(node.condition)
+        body = self._compile_block(node.body)
+        control = self._control
+
+        if not any(has_control_flow(statement) for statement in node.body):
+            def simple_loop(env):
+                while condition(env):
+                    body(env)
+                return None
+            return simple_loop
+
+        def loop(env):
+            while condition(env):
+                body(env)
+                signal = control[0]
+                if signal:
+                    if signal == _RETURN:
+                        return None
+                    control[0] = _NORMAL
+                    if signal == _BREAK:
+                        break
+            return None
+        return loop
+
+    def _compile_ForNode(self, node: ForNode) -> Code:
+        iterable_code = self.compile(node.iterable)
+        body = self._compile_block(node.body)
+        name = node.variable
+        control = self._control
+        signals = any(has_control_flow(statement) for statement in node.body)
+
+        def loop(env):
+            iterable = iterable_code(env)
+            try:
+                iter(iterable)
+            except TypeError:
+                raise ExecutionError(f"L'objet de type '{type(iterable).__name__}' n'est pas itérable", node)
+
+            variables = env.vars
+            for value in iterable:
+                variables[name] = value
+                body(env)
+                if signals:
+                    signal = control[0]
+                    if signal:
+                        if signal == _RETURN:
+                            return None
+                        control[0] = _NORMAL
+                        if signal == _BREAK:
+                            break
+            return None
+        return loop
@@ -2,33 +2,37 @@
 from typing import Optional
 from pylpex.parser.ASTNodes import *
 from pylpex.typesystem import TypeInfo, BaseType
-from .environment import Environment
-from .exception import ExecutionError
+from .environment import Environment, SlotEnvironment
+from .exception import ExecutionError, LimitExceededError
 from .visitor import ASTVisitor
 # mixins
 from .builtin import BuiltinMixin, BuiltinFunction
+from .range import Range
 from .expressions import ExpressionsMixin
 from .variables import VariablesMixin
-from .statements import StatementsMixin
+from .statements import StatementsMixin, NORMAL, RETURN, TAIL_CALL
 from .operators import OperatorsMixin
+from .limits import LimitsMixin
+from .resolver import Resolver
 
 
 
 
-class ReturnException(Exception):
-    """Exception pour gérer l'instruction return"""
-    def __init__(self, value):
-        self.value = value
-
-
 class Function:
     """Représente une fonction définie par l'utilisateur"""
-    def __init__(self, name: str, parameters: List[ParameterNode], body: List[ASTNode], closure: Environment, return_type: Optional[TypeInfo] = None):
+    def __init__(self, name: str, parameters: List[ParameterNode], body: List[ASTNode], closure: Environment, return_type: Optional[TypeInfo] = None, local_names: Optional[List[str]] = None):
         self.name = name
         self.parameters = parameters
         self.body = body
         self.closure = closure
         self.return_type = return_type
+        # Noms locaux résolus statiquement (cf. Resolver) : les appels utilisent un SlotEnvironment
+        self.local_names = local_names
+        self.local_slots = {name: slot for slot, name in enumerate(local_names)} if local_names is not None else None
+        # Plan de liaison des paramètres, calculé une fois pour tous les appels
+        self.arity = len(parameters)
+        self.parameter_names = [param.name for param in parameters]
+        self.default_values = [param.default_value for param in parameters]
     
     def __repr__(self):
         return f"<function {self.name}>"
@@ -38,7 +42,8 @@ mixins = [
     ExpressionsMixin,
     VariablesMixin,
     StatementsMixin,
-    OperatorsMixin
+    OperatorsMixin,
+    LimitsMixin
 ]
 
 # TODO faire un mode strict pour les types
@@ -62,21 +67,31 @@ class Evaluator(ASTVisitor, *mixins):
         self.global_env = global_env or Environment()
         self.current_env = self.global_env
         self.strict_typing = strict_typing
+        # Signal de contrôle en cours (cf. statements) et valeur du dernier return
+        self._signal = NORMAL
+        self._return_value = None
+        self._tail_call = None  # (fonction, args, kwargs, nœud) d'un appel récursif terminal
+        self.set_limits(None)
         self._setup_builtins()
 
     def evaluate(self, node: ASTNode) -> Any:
         """Point d'entrée principal pour évaluer un AST"""
-        return self.visit(node)
+        Resolver().resolve(node)
+        self._signal = NORMAL
+        self._start_limits()
+        result = self.visit(node)
+        if self._signal == RETURN:
+            # return au niveau du programme : il s'arrête et retourne la valeur
+            result = self._return_value
+        self._signal, self._return_value = NORMAL, None
+        return result
     
     # -------------------------------
     # Program structure
 
     def visit_ProgramNode(self, node: ProgramNode) -> Any:
         """Évalue un programme complet"""
-        result = None
-        for statement in node.statements:
-            result = self.visit(statement)
-        return result
+        return self._execute_block(node.statements, node)
     
     # -------------------------------
     # Type annotations
@@ -108,6 +123,9 @@ class Evaluator(ASTVisitor, *mixins):
                 subtype = TypeInfo.union(*subtypes)
             return TypeInfo(BaseType.LIST, subtype)
         
+        if isinstance(value, Range):
+            return TypeInfo(BaseType.LIST, TypeInfo(BaseType.INTEGER if value else BaseType.ANY))
+        
         if isinstance(value, dict):
             # Inférer types des clés et valeurs
             if not value:
@@ -145,9 +163,12 @@ class Evaluator(ASTVisitor, *mixins):
     def visit_IndexNode(self, node: IndexNode) -> Any:
         collection = self.visit(node.collection)
         index = self.visit(node.index)
-        
+        return self._get_index(collection, index, node)
+
+    def _get_index(self, collection: Any, index: Any, node: ASTNode) -> Any:
+        """Lit collection[index] avec les vérifications du langage"""
         # Vérifications selon le type de collection
-        if isinstance(collection, list):
+        if isinstance(collection, (list, Range)):
             # Pour les listes : l'index doit être un entier
             if not isinstance(index, int):
                 index_type = self._infer_type(index)
@@ -232,10 +253,15 @@ class Evaluator(ASTVisitor, *mixins):
     # Fonctions
         
     def visit_CallNode(self, node: CallNode) -> Any:
+        func, args, kwargs = self._prepare_call(node)
+        return self._invoke(func, args, kwargs, node)
+
+    def _prepare_call(self, node: CallNode) -> tuple[Any, list, dict]:
+        """Résout la fonction appelée et évalue les arguments"""
         # Résoudre la fonction
         if isinstance(node.function, str):
             try:
-                func = self.current_env.lookup(node.function)
+                func = self._lookup_resolved(node.function, node._slot)
             except ExecutionError:
                 raise ExecutionError(f"Fonction '{node.function}' non définie", node)
         else:
@@ -251,8 +277,10 @@ class Evaluator(ASTVisitor, *mixins):
                 args.append(value)
             else:
                 kwargs[arg_node.name] = value
+        return func, args, kwargs
 
-        # Appeler la fonction
+    def _invoke(self, func: Any, args: list, kwargs: dict, node: CallNode) -> Any:
+        """Appelle une fonction avec des arguments déjà évalués"""
         try:
             if isinstance(func, BuiltinFunction):
                 # Fonction built-in ou Python native
@@ -262,11 +290,19 @@ class Evaluator(ASTVisitor, *mixins):
                 return self._call_user_function(func, args, kwargs, node)
             else:
                 raise ExecutionError(f"'{func}' n'est pas appelable", node)
-        except ReturnException as e:
-            return e.value
+        except LimitExceededError:
+            raise
         except (TypeError, ExecutionError) as e:
             raise ExecutionError(f"Erreur d'appel de fonction: {e}", node)
     
+    def call_function(self, func: Any, args: list) -> Any:
+        """Appelle une fonction Pylpex (utilisateur ou built-in) depuis du code Python, par exemple un builtin"""
+        if isinstance(func, BuiltinFunction):
+            return func(*args)
+        if isinstance(func, Function):
+            return self._call_user_function(func, args, {}, None)
+        raise ExecutionError(f"'{func}' n'est pas appelable")
+
     def _call_builtin_function(self, func: BuiltinFunction, args: list, kwargs: dict, node: ASTNode) -> Any:
         """Appelle une fonction built-in"""
         return func(*args, **kwargs)
@@ -274,72 +310,114 @@ class Evaluator(ASTVisitor, *mixins):
         #         Faire des vérifications sur les arguments pour avoir des erreurs non-python/personnalisées
 
     def _call_user_function(self, func: Function, args: list, kwargs: dict, node: ASTNode) -> Any:
-        """Appelle une fonction définie par l'utilisateur"""
-        # Créer un nouvel environnement pour la fonction
-        func_env = Environment(parent=func.closure)
-        
-        # Lier les paramètres
-        positional_params = []
-        default_params = {}
-        
-        for param in func.parameters:
-            if param.default_value is None:
-                positional_params.append(param.name)
+        """
+        Appelle une fonction définie par l'utilisateur.
+        Un appel récursif terminal (`return f(...)` dans f) ne crée pas d'appel Python
+        imbriqué : le corps est réexécuté en boucle avec les nouveaux arguments.
+        """
+        while True:
+            # Créer un nouvel environnement pour la fonction
+            if func.local_names is not None:
+                func_env = SlotEnvironment(func.local_names, func.local_slots, parent=func.closure)
             else:
-                default_params[param.name] = param.default_value
-        
-        # Assigner les arguments positionnels
-        if len(args) > len(func.parameters):
-            raise ExecutionError(
-                f"Trop d'arguments pour '{func.name}': attendu {len(func.parameters)}, reçu {len(args)}",
-                node
-            )
-        
-        for i, arg_value in enumerate(args):
-            param_name = func.parameters[i].name
-            func_env.define(param_name, arg_value)
+                func_env = Environment(parent=func.closure)
+            
+            # Lier les paramètres
+            nargs = len(args)
+            if nargs > func.arity:
+                raise ExecutionError(
+                    f"Trop d'arguments pour '{func.name}': attendu {func.arity}, reçu {nargs}",
+                    node
+                )
+            
+            if nargs == func.arity and func.local_names is not None:
+                # Cas courant : tous les arguments sont positionnels, et les paramètres
+                # occupent les premiers slots (cf. collect_locals)
+                func_env.values[:nargs] = args
+            else:
+                self._bind_parameters(func, func_env, args, kwargs, node)
+            
+            # Exécuter le corps de la fonction (limites d'exécution : cf. LimitsMixin)
+            self._countdown -= len(func.body) + 1  # l'appel et les instructions du corps
+            if self._countdown < 0:
+                self._check_limits(node)
+            self._depth += 1
+            if self._depth > self._max_depth:
+                self._depth -= 1
+                raise self._depth_error(node)
+            old_env = self.current_env
+            self.current_env = func_env
+            
+            try:
+                result = None
+                for statement in func.body:
+                    result = self.visit(statement)
+                    if self._signal:
+                        break
+            finally:
+                self.current_env = old_env
+                self._depth -= 1
+            
+            signal = self._signal
+            if signal == RETURN:
+                result = self._return_value
+                self._signal, self._return_value = NORMAL, None
+            if signal != TAIL_CALL:
+                return result
+            
+            # Appel récursif terminal
+            callee, args, kwargs, node = self._tail_call
+            self._signal, self._tail_call = NORMAL, None
+            if callee is not func:
+                # Le nom de la fonction a été redéfini : appel ordinaire
+                return self._invoke(callee, args, kwargs, node)
+    
+    def _bind_parameters(self, func: Function, func_env: Environment, args: list, kwargs: dict, node: ASTNode) -> None:
+        """Lie les arguments positionnels, nommés et les valeurs par défaut dans l'environnement d'appel"""
+        names = func.parameter_names
+        for name, arg_value in zip(names, args):
+            func_env.define(name, arg_value)
         
         # Assigner les arguments nommés et valeurs par défaut
-        for param in func.parameters[len(args):]:
-            if param.name in kwargs:
-                func_env.define(param.name, kwargs[param.name])
-            elif param.default_value is not None:
+        for i in range(len(args), func.arity):
+            name = names[i]
+            if name in kwargs:
+                func_env.define(name, kwargs[name])
+            elif func.default_values[i] is not None:
                 # Évaluer la valeur par défaut dans l'environnement de la fonction
                 old_env = self.current_env
                 self.current_env = func_env
-                default_val = self.visit(param.default_value)
-                self.current_env = old_env
-                func_env.define(param.name, default_val)
+                try:
+                    default_val = self.visit(func.default_values[i])
+                finally:
+                    self.current_env = old_env
+                func_env.define(name, default_val)
             else:
                 raise ExecutionError(
-                    f"Argument manquant pour le paramètre '{param.name}' de '{func.name}'",
+                    f"Argument manquant pour le paramètre '{name}' de '{func.name}'",
                     node
                 )
-        
-        # Exécuter le corps de la fonction
-        old_env = self.current_env
-        self.current_env = func_env
-        
-        try:
-            result = None
-            for statement in func.body:
-                result = self.visit(statement)
-            return result
-        except ReturnException as e:
-            return e.value
-        finally:
-            self.current_env = old_env
     
     # -------------------------------
     # Fonctions
 
     def visit_FunctionDefNode(self, node: FunctionDefNode) -> None:
         """Définit une fonction"""
-        func = Function(node.name, node.parameters, node.body, self.current_env, node.return_type)
-        self.current_env.define(node.name, func)
+        func = Function(node.name, node.parameters, node.body, self.current_env, node.return_type, node._locals)
+        self._define_resolved(node.name, node._slot, func)
         return None
 
     def visit_ReturnNode(self, node: ReturnNode) -> None:
         """Gère l'instruction return"""
-        value = self.visit(node.value) if node.value else None
-        raise ReturnException(value)
+        if node._tail_call:
+            # L'appel est exécuté par _call_user_function, une fois le corps quitté
+            func, args, kwargs = self._prepare_call(node.value)
+            if isinstance(func, Function):
+                self._tail_call = (func, args, kwargs, node.value)
+                self._signal = TAIL_CALL
+                return None
+            self._return_value = self._invoke(func, args, kwargs, node.value)
+        else:
+            self._return_value = self.visit(node.value) if node.value else None
+        self._signal = RETURN
+        return None
@@ -1,3 +1,4 @@
+from typing import Dict, List
 from .exception import ExecutionError
 
 class Environment:
@@ -38,3 +39,83 @@ class Environment:
         
     def __repr__(self):
         return f"Environment({self.vars}, parent={self.parent})"
+
+
+class BuiltinsEnvironment(Environment):
+    """
+    Portée des fonctions builtins, parente de l'environnement global.
+
+    Elle est remplie une fois à la création de l'évaluateur puis ne change plus :
+    un programme peut masquer un builtin en définissant le même nom dans l'environnement
+    global, mais pas le redéfinir ni le réassigner dans cette portée.
+    """
+    def __init__(self, builtins: Dict[str, object]):
+        super().__init__()
+        self.vars = builtins
+
+    def define(self, name: str, value):
+        raise ExecutionError(f"Impossible de définir '{name}' dans la portée des builtins")
+
+    def assign(self, name: str, value):
+        if name in self.vars:
+            raise ExecutionError(f"Le builtin '{name}' ne peut pas être réassigné")
+        raise ExecutionError(f"Variable '{name}' non définie")
+
+    def __repr__(self):
+        return f"BuiltinsEnvironment({sorted(self.vars)})"
+
+
+class _Unbound:
+    """Valeur d'un slot dont la variable n'est pas encore définie"""
+    def __repr__(self):
+        return "<unbound>"
+
+UNBOUND = _Unbound()
+
+
+class SlotEnvironment(Environment):
+    """
+    Environnement d'un appel de fonction dont les noms locaux ont été résolus statiquement
+    (cf. Resolver) : les valeurs sont stockées dans une liste indexée par slot.
+
+    Un slot non encore défini (UNBOUND) se replie sur les portées englobantes,
+    comme un nom absent d'un Environment.
+    """
+    def __init__(self, names: List[str], slots: Dict[str, int], parent: Environment = None):
+        super().__init__(parent)
+        self.names = names
+        self.slots = slots
+        self.values = [UNBOUND] * len(names)
+
+    def define(self, name: str, value):
+        slot = self.slots.get(name)
+        if slot is None:
+            self.vars[name] = value
+        else:
+            self.values[slot] = value
+
+    def assign(self, name: str, value):
+        slot = self.slots.get(name)
+        if slot is not None and self.values[slot] is not UNBOUND:
+            self.values[slot] = value
+        elif name in self.vars:
+            self.vars[name] = value
+        elif self.parent:
+            self.parent.assign(name, value)
+        else:
+            raise ExecutionError(f"Variable '{name}' non définie")
+
+    def lookup(self, name: str):
+        slot = self.slots.get(name)
+        if slot is not None and self.values[slot] is not UNBOUND:
+            return self.values[slot]
+        elif name in self.vars:
+            return self.vars[name]
+        elif self.parent:
+            return self.parent.lookup(name)
+        else:
+            raise ExecutionError(f"Variable '{name}' non définie")
+
+    def __repr__(self):
+        bound = {name: value for name, value in zip(self.names, self.values) if value is not UNBOUND}
+        return f"SlotEnvironment({bound | self.vars}, parent={self.parent})"
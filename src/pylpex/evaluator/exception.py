@@ -7,4 +7,14 @@ class ExecutionError(Exception):
             line, col = node.position
             super().__init__(f"Erreur à la ligne {line}, colonne {col}: {message}")
         else:
-            super().__init__(message)
\ No newline at end of file
+            super().__init__(message)
+
+
+class LimitExceededError(ExecutionError):
+    """
+    Exécution interrompue parce qu'une limite (cf. ExecutionLimits) a été dépassée.
+    `limit` est le nom de la limite : "max_steps", "max_depth", "timeout" ou "max_collection_size".
+    """
+    def __init__(self, limit: str, message: str, node: Optional[ASTNode] = None):
+        super().__init__(message, node)
+        self.limit = limit
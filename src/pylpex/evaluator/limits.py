@@ -0,0 +1,126 @@
+# pylpex/evaluator/limits.py
+import sys
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Optional
+from pylpex.parser.ASTNodes import ASTNode, BinaryOperatorType
+from .exception import LimitExceededError
+from .range import Range
+
+# Nombre maximal d'instructions exécutées entre deux lectures de l'horloge (limite de temps)
+CHECK_INTERVAL = 1000
+
+# Compte à rebours sans limite d'instructions ni de temps : jamais atteint en pratique
+UNLIMITED = sys.maxsize
+
+
+@dataclass
+class ExecutionLimits:
+    """
+    Limites d'une évaluation (chaque appel à `evaluate` dispose du budget complet).
+    None désactive la limite correspondante.
+
+    Attributes:
+        max_steps: Nombre d'instructions exécutées : chaque instruction d'un bloc, chaque
+                   itération de boucle et chaque appel de fonction utilisateur compte pour un
+                   pas (les instructions d'un bloc sont décomptées à son entrée)
+        max_depth: Profondeur d'appels de fonctions utilisateur imbriqués
+        timeout: Durée maximale de l'évaluation, en secondes (horloge murale). Elle est vérifiée
+                 toutes les CHECK_INTERVAL instructions : un builtin très long n'est pas interrompu
+        max_collection_size: Nombre d'éléments (ou de caractères) d'une liste, d'un dictionnaire
+                             ou d'une chaîne créés ou agrandis par le programme
+    """
+    max_steps: Optional[int] = None
+    max_depth: Optional[int] = None
+    timeout: Optional[float] = None
+    max_collection_size: Optional[int] = None
+
+
+class LimitsMixin:
+    """
+    Application des ExecutionLimits par l'évaluateur.
+
+    L'entrée dans un bloc, chaque itération de boucle et chaque appel de fonction décrémentent
+    un compte à rebours (`_countdown`) du nombre de pas consommés : c'est le seul coût ajouté
+    à l'exécution. Quand il passe sous zéro, `_check_limits` compte les pas du lot écoulé,
+    vérifie le budget et l'horloge, puis réarme le compte à rebours. Sans limite
+    d'instructions ni de temps, il n'atteint jamais zéro.
+    """
+
+    # Les moteurs qui compilent l'AST (closure, bytecode, python) n'appliquent pas les limites
+    supports_limits = True
+
+    def set_limits(self, limits: Optional[ExecutionLimits]):
+        """Configure les limites des prochaines évaluations (None : aucune limite)"""
+        if limits is not None and not self.supports_limits:
+            raise ValueError(f"Le moteur {type(self).__name__} n'applique pas les limites d'exécution")
+        self.limits = limits
+        self._max_depth = UNLIMITED
+        self._max_collection_size = None
+        if limits is not None:
+            if limits.max_depth is not None:
+                self._max_depth = limits.max_depth
+            self._max_collection_size = limits.max_collection_size
+        self._depth = 0
+        self._start_limits()
+
+    def _start_limits(self):
+        """Réarme le budget au début d'une évaluation"""
+        limits = self.limits
+        self._steps_done = 0  # instructions des lots déjà écoulés
+        self._deadline = None
+        if limits is not None and limits.timeout is not None:
+            self._deadline = perf_counter() + limits.timeout
+        self._batch = self._next_batch()
+        self._countdown = self._batch
+
+    def _next_batch(self) -> int:
+        """Nombre d'instructions avant la prochaine vérification"""
+        limits = self.limits
+        if limits is None:
+            return UNLIMITED
+        batch = CHECK_INTERVAL if self._deadline is not None else UNLIMITED
+        if limits.max_steps is not None:
+            batch = min(batch, limits.max_steps - self._steps_done)
+        return batch
+
+    def _check_limits(self, node: Optional[ASTNode]):
+        """Appelé quand le compte à rebours passe sous zéro"""
+        limits = self.limits
+        self._steps_done += self._batch - self._countdown
+        if limits.max_steps is not None and self._steps_done > limits.max_steps:
+            raise LimitExceededError(
+                "max_steps", f"Limite de {limits.max_steps} instructions exécutées dépassée", node
+            )
+        if self._deadline is not None and perf_counter() > self._deadline:
+            raise LimitExceededError(
+                "timeout", f"Limite de temps d'exécution de {limits.timeout} s dépassée", node
+            )
+        self._batch = self._countdown = self._next_batch()
+
+    def _depth_error(self, node: Optional[ASTNode]) -> LimitExceededError:
+        """Erreur d'un appel de fonction qui dépasserait la profondeur maximale"""
+        return LimitExceededError(
+            "max_depth", f"Limite de {self._max_depth} appels de fonctions imbriqués atteinte", node
+        )
+
+    def _check_size(self, size: int, node: Optional[ASTNode] = None):
+        """Vérifie la taille d'une collection avant de la créer ou de l'agrandir"""
+        if size > self._max_collection_size:
+            raise LimitExceededError(
+                "max_collection_size",
+                f"Collection de {size} éléments : la limite est de {self._max_collection_size}",
+                node
+            )
+
+    def _check_operation_size(self, operator: BinaryOperatorType, left: Any, right: Any, node: ASTNode):
+        """Vérifie la taille du résultat d'une concaténation ou d'une répétition avant de le calculer"""
+        sized = (str, list, Range)
+        if operator == BinaryOperatorType.PLUS:
+            if isinstance(left, sized) and isinstance(right, sized):
+                self._check_size(len(left) + len(right), node)
+        elif operator == BinaryOperatorType.MUL:
+            if isinstance(right, sized):
+                left, right = right, left
+            if isinstance(left, sized) and isinstance(right, int):
+                self._check_size(len(left) * right, node)
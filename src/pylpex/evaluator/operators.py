@@ -1,12 +1,46 @@
 
+import operator
 from typing import Any
 from pylpex.parser.ASTNodes import (
     UnaryOpNode, UnaryOperatorType,
     BinaryOpNode, BinaryOperatorType, 
-    TernaryNode
+    TernaryNode, AssignmentOperatorType
 )
 from .exception import ExecutionError
 
+# Opérations Python associées aux opérateurs (hors division, 'and' et 'or')
+BINARY_OPERATIONS = {
+    BinaryOperatorType.PLUS: operator.add,
+    BinaryOperatorType.MINUS: operator.sub,
+    BinaryOperatorType.MUL: operator.mul,
+    BinaryOperatorType.POWER: operator.pow,
+    BinaryOperatorType.MOD: operator.mod,
+    BinaryOperatorType.EQ: operator.eq,
+    BinaryOperatorType.NEQ: operator.ne,
+    BinaryOperatorType.LT: operator.lt,
+    BinaryOperatorType.GT: operator.gt,
+    BinaryOperatorType.LTE: operator.le,
+    BinaryOperatorType.GTE: operator.ge,
+    BinaryOperatorType.IN: lambda left, right: left in right,
+    BinaryOperatorType.NOT_IN: lambda left, right: left not in right,
+}
+
+UNARY_OPERATIONS = {
+    UnaryOperatorType.POSITIVE: operator.pos,
+    UnaryOperatorType.NEGATIVE: operator.neg,
+    UnaryOperatorType.NOT: operator.not_,
+}
+
+# Opérateur binaire équivalent à chaque opérateur d'assignation composé
+COMPOUND_TO_BINARY = {
+    AssignmentOperatorType.PLUS: BinaryOperatorType.PLUS,
+    AssignmentOperatorType.MINUS: BinaryOperatorType.MINUS,
+    AssignmentOperatorType.MUL: BinaryOperatorType.MUL,
+    AssignmentOperatorType.DIV: BinaryOperatorType.DIV,
+    AssignmentOperatorType.POWER: BinaryOperatorType.POWER,
+    AssignmentOperatorType.MOD: BinaryOperatorType.MOD,
+}
+
 
 class OperatorsMixin:
 
@@ -27,6 +61,8 @@ class OperatorsMixin:
             return self.visit(node.right)
         
         right = self.visit(node.right)
+        if self._max_collection_size is not None:
+            self._check_operation_size(node.operator, left, right, node)
         
         try:
             if node.operator == BinaryOperatorType.PLUS:
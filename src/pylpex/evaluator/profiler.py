@@ -0,0 +1,198 @@
+# pylpex/evaluator/profiler.py
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+from pylpex.parser.ASTNodes import ASTNode, ProgramNode, NO_POSITION, unpack_position
+from .builtin import BuiltinFunction
+from .core import Evaluator, Function
+
+
+class ProfileEntry:
+    """
+    Mesures d'un élément profilé (nœud, position, ligne ou fonction) : nombre d'exécutions,
+    temps propre (hors sous-nœuds ou appels imbriqués) et temps total.
+
+    Le temps total d'un élément exécuté récursivement (une ligne d'une fonction récursive,
+    un nœud qui s'englobe lui-même) n'est compté qu'une fois, pour l'exécution la plus externe.
+    """
+    __slots__ = ("key", "label", "count", "self_time", "total", "_active")
+
+    def __init__(self, key: Any, label: str):
+        self.key = key
+        self.label = label
+        self.count = 0
+        self.self_time = 0.0
+        self.total = 0.0
+        self._active = 0
+
+    def _exit(self, elapsed: float, self_time: float):
+        self._active -= 1
+        self.count += 1
+        self.self_time += self_time
+        if not self._active:
+            self.total += elapsed
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"key": self.key, "label": self.label, "count": self.count,
+                "self_time": self.self_time, "total": self.total}
+
+    def __repr__(self) -> str:
+        return (f"ProfileEntry({self.label!r}, count={self.count}, "
+                f"self={self.self_time * 1000:.3f}ms, total={self.total * 1000:.3f}ms)")
+
+
+class Profile:
+    """
+    Profil d'exécution collecté par un ProfilingEvaluator : mesures par nœud d'AST, par
+    position `(line, column)` du source, par ligne et par fonction (utilisateur ou builtin).
+    """
+
+    def __init__(self):
+        self.nodes: Dict[int, ProfileEntry] = {}
+        self.positions: Dict[Tuple[int, int], ProfileEntry] = {}
+        self.lines: Dict[int, ProfileEntry] = {}
+        self.functions: Dict[str, ProfileEntry] = {}
+        # Entrées mises à jour par la visite de chaque nœud (indexé par id du nœud)
+        self._node_entries: Dict[int, Tuple[ProfileEntry, ...]] = {}
+        self._nodes: List[ASTNode] = []  # garde les nœuds profilés en vie (leur id reste valide)
+
+    def clear(self):
+        self.__init__()
+
+    def _entries_for(self, node: ASTNode) -> Tuple[ProfileEntry, ...]:
+        """Entrées du nœud, de sa position et de sa ligne (créées au premier passage)"""
+        label = type(node).__name__
+        entry = ProfileEntry(id(node), label)
+        self.nodes[id(node)] = entry
+        self._nodes.append(node)
+        entries = (entry,)
+        # Le programme (positionné sur sa première instruction) n'est attribué à aucune ligne
+        if node._position != NO_POSITION and not isinstance(node, ProgramNode):
+            position = unpack_position(node._position)
+            line = position[0]
+            if position not in self.positions:
+                self.positions[position] = ProfileEntry(position, label)
+            if line not in self.lines:
+                self.lines[line] = ProfileEntry(line, f"ligne {line}")
+            entries += (self.positions[position], self.lines[line])
+        self._node_entries[id(node)] = entries
+        return entries
+
+    def _function_entry(self, name: str, builtin: bool) -> ProfileEntry:
+        key = f"{name} (builtin)" if builtin else name
+        entry = self.functions.get(key)
+        if entry is None:
+            entry = self.functions[key] = ProfileEntry(key, key)
+        return entry
+
+    # -------------------------------
+    # Consultation
+
+    @staticmethod
+    def _sorted(entries, sort: str, limit: Optional[int]) -> List[ProfileEntry]:
+        if sort not in ("self_time", "total", "count"):
+            raise ValueError(f"Tri inconnu '{sort}', attendu parmi: self_time, total, count")
+        result = sorted(entries, key=lambda entry: getattr(entry, sort), reverse=True)
+        return result[:limit] if limit is not None else result
+
+    def hot_lines(self, limit: Optional[int] = 10, sort: str = "self_time") -> List[ProfileEntry]:
+        """Lignes du source triées par coût décroissant"""
+        return self._sorted(self.lines.values(), sort, limit)
+
+    def hot_positions(self, limit: Optional[int] = 10, sort: str = "self_time") -> List[ProfileEntry]:
+        """Positions (line, column) du source triées par coût décroissant"""
+        return self._sorted(self.positions.values(), sort, limit)
+
+    def hot_functions(self, limit: Optional[int] = 10, sort: str = "self_time") -> List[ProfileEntry]:
+        """Fonctions (utilisateur et builtins) triées par coût décroissant"""
+        return self._sorted(self.functions.values(), sort, limit)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "lines": [entry.as_dict() for entry in self.hot_lines(None)],
+            "positions": [entry.as_dict() for entry in self.hot_positions(None)],
+            "functions": [entry.as_dict() for entry in self.hot_functions(None)],
+        }
+
+    def report(self, limit: int = 10, sort: str = "self_time", source: Optional[str] = None) -> str:
+        """
+        Rapport texte des lignes et des fonctions les plus coûteuses.
+
+        Args:
+            limit: Nombre de lignes et de fonctions affichées
+            sort: Critère de tri ("self_time", "total" ou "count")
+            source: Code source profilé, pour afficher le texte de chaque ligne
+        """
+        source_lines = source.splitlines() if source is not None else None
+        out = [f"{'Ligne':>7} {'Visites':>10} {'Propre (ms)':>12} {'Total (ms)':>12}  Code"]
+        for entry in self.hot_lines(limit, sort):
+            code = ""
+            if source_lines is not None and 0 < entry.key <= len(source_lines):
+                code = source_lines[entry.key - 1].strip()
+            out.append(f"{entry.key:>7} {entry.count:>10} {entry.self_time * 1000:>12.3f} "
+                       f"{entry.total * 1000:>12.3f}  {code}")
+        out.append("")
+        out.append(f"{'Fonction':<24} {'Appels':>10} {'Propre (ms)':>12} {'Total (ms)':>12}")
+        for entry in self.hot_functions(limit, sort):
+            out.append(f"{entry.label:<24} {entry.count:>10} {entry.self_time * 1000:>12.3f} "
+                       f"{entry.total * 1000:>12.3f}")
+        return "\n".join(out)
+
+
+class ProfilingEvaluator(Evaluator):
+    """
+    Évaluateur "tree" instrumenté : chaque visite de nœud et chaque appel de fonction est
+    chronométré, et les mesures sont accumulées dans `profile` (cf. Profile) par nœud,
+    par position du source, par ligne et par fonction.
+
+    Le temps propre d'un nœud exclut celui de ses sous-nœuds ; celui d'une fonction exclut
+    les appels de fonctions qu'elle fait. Un appel récursif terminal (exécuté en boucle par
+    l'évaluateur, cf. _call_user_function) compte comme un seul appel.
+    Les mesures incluent le coût de l'instrumentation : elles servent à comparer les parties
+    d'un programme entre elles, pas à mesurer sa durée réelle.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.profile = Profile()
+        # Durée des sous-nœuds de chaque visite en cours, et des appels imbriqués de chaque appel en cours
+        self._children: List[float] = [0.0]
+        self._callees: List[float] = [0.0]
+
+    def visit(self, node: ASTNode) -> Any:
+        entries = self.profile._node_entries.get(id(node))
+        if entries is None:
+            entries = self.profile._entries_for(node)
+        for entry in entries:
+            entry._active += 1
+        children = self._children
+        children.append(0.0)
+        start = perf_counter()
+        try:
+            return Evaluator.visit(self, node)
+        finally:
+            elapsed = perf_counter() - start
+            self_time = elapsed - children.pop()
+            children[-1] += elapsed
+            for entry in entries:
+                entry._exit(elapsed, self_time)
+
+    def _profile_call(self, entry: ProfileEntry, call, *args) -> Any:
+        entry._active += 1
+        callees = self._callees
+        callees.append(0.0)
+        start = perf_counter()
+        try:
+            return call(*args)
+        finally:
+            elapsed = perf_counter() - start
+            self_time = elapsed - callees.pop()
+            callees[-1] += elapsed
+            entry._exit(elapsed, self_time)
+
+    def _call_user_function(self, func: Function, args: list, kwargs: dict, node: ASTNode) -> Any:
+        entry = self.profile._function_entry(func.name, builtin=False)
+        return self._profile_call(entry, super()._call_user_function, func, args, kwargs, node)
+
+    def _call_builtin_function(self, func: BuiltinFunction, args: list, kwargs: dict, node: ASTNode) -> Any:
+        entry = self.profile._function_entry(func.name, builtin=True)
+        return self._profile_call(entry, super()._call_builtin_function, func, args, kwargs, node)
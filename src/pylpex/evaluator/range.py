@@ -0,0 +1,79 @@
+# pylpex/evaluator/range.py
+from collections.abc import Sequence
+from typing import Any, Iterator
+
+
+class Range(Sequence):
+    """
+    Suite d'entiers de `start` à `end` inclus, retournée par le builtin range.
+
+    Les valeurs ne sont pas matérialisées : l'itération est paresseuse et len, l'indexation
+    et `in` sont en O(1), quelle que soit la longueur. Un range est immuable ; il est égal
+    à la liste de ses valeurs, s'affiche comme elle et peut lui être concaténé ou être répété
+    (le résultat est une liste). Côté Python, `evaluate` retourne le Range lui-même : utiliser
+    copy() ou list() pour obtenir une vraie liste.
+    """
+    __slots__ = ("start", "end", "_values")
+
+    def __init__(self, start: int, end: int):
+        self.start = start
+        self.end = end
+        self._values = range(start, end + 1)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._values)
+
+    def __reversed__(self) -> Iterator[int]:
+        return reversed(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> int:
+        if not isinstance(index, int):
+            raise TypeError(f"les indices de range doivent être des entiers, pas '{type(index).__name__}'")
+        return self._values[index]
+
+    def __contains__(self, value: Any) -> bool:
+        if isinstance(value, int):
+            return value in self._values
+        if isinstance(value, float):
+            # range de Python parcourt toutes les valeurs pour un flottant
+            return value.is_integer() and int(value) in self._values
+        return False
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Range):
+            return self._values == other._values
+        if isinstance(other, list):
+            return len(other) == len(self._values) and all(a == b for a, b in zip(self._values, other))
+        return NotImplemented
+
+    __hash__ = None  # comme les listes
+
+    def __add__(self, other: Any) -> list:
+        if isinstance(other, (list, Range)):
+            return list(self._values) + list(other)
+        return NotImplemented
+
+    def __radd__(self, other: Any) -> list:
+        if isinstance(other, list):
+            return other + list(self._values)
+        return NotImplemented
+
+    def __mul__(self, other: Any) -> list:
+        if isinstance(other, int):
+            return list(self._values) * other
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __setitem__(self, index: Any, value: Any):
+        raise TypeError("Un range ne peut pas être modifié, utilisez copy() pour obtenir une liste")
+
+    def copy(self) -> list:
+        """Liste (modifiable) des valeurs"""
+        return list(self._values)
+
+    def __repr__(self) -> str:
+        return repr(list(self._values))
@@ -0,0 +1,90 @@
+# pylpex/evaluator/resolver.py
+from dataclasses import fields
+from typing import Dict, Optional, Tuple
+from pylpex.parser.ASTNodes import *
+from .scope import Scope
+
+# Champs de chaque classe de nœud, calculés au premier passage (fields() est coûteux)
+_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+class Resolver:
+    """
+    Passe de résolution statique des noms.
+
+    Annote chaque IdentifierNode (et les noms portés par CallNode, ForNode et
+    FunctionDefNode) avec un couple (profondeur, slot) : la profondeur est le nombre
+    de portées de fonction à remonter depuis la portée courante, le slot l'index du nom
+    dans la portée trouvée. Un nom qui n'est local à aucune fonction englobante est
+    annoté (profondeur, None) : la profondeur mène alors à l'environnement global.
+
+    Marque aussi les appels récursifs terminaux : un `return f(...)` dans le corps
+    de la fonction `f` (hors fonctions imbriquées).
+
+    Les annotations ne dépendent que de l'AST : un programme déjà résolu (par exemple servi
+    par le cache de l'Interpreter) est marqué `_resolved` et n'est pas reparcouru.
+    """
+
+    def resolve(self, node: ASTNode) -> ASTNode:
+        """Annote l'AST en place et le retourne"""
+        if isinstance(node, ProgramNode):
+            if node._resolved:
+                return node
+            self._visit(node)
+            node._resolved = True
+            return node
+        self._visit(node)
+        return node
+
+    @staticmethod
+    def _locate(name: str, scope: Optional[Scope]) -> tuple[int, Optional[int]]:
+        depth = 0
+        while scope is not None:
+            slot = scope.slots.get(name)
+            if slot is not None:
+                return depth, slot
+            scope, depth = scope.parent, depth + 1
+        return depth, None
+
+    def _visit(self, root: ASTNode):
+        """
+        Parcourt l'AST avec une pile explicite de (valeur, portée, fonction englobante),
+        sans récursion Python : la profondeur de l'AST n'est limitée que par la mémoire.
+        Chaque nœud n'a besoin que de sa portée, l'ordre de parcours est donc indifférent.
+        """
+        locate = self._locate
+        pending = [(root, None, None)]
+        while pending:
+            node, scope, function = pending.pop()
+            if isinstance(node, (list, tuple)):
+                pending.extend((item, scope, function) for item in node)
+                continue
+            if not isinstance(node, ASTNode):
+                continue
+
+            if isinstance(node, IdentifierNode):
+                node._slot = locate(node.name, scope)
+            elif isinstance(node, CallNode) and isinstance(node.function, str):
+                node._slot = locate(node.function, scope)
+            elif isinstance(node, ForNode):
+                node._slot = locate(node.variable, scope)
+            elif isinstance(node, ReturnNode):
+                node._tail_call = function is not None and isinstance(node.value, CallNode) \
+                    and node.value.function == function.name
+            elif isinstance(node, FunctionDefNode):
+                # Le corps et les valeurs par défaut sont résolus dans la portée de la fonction
+                node._slot = locate(node.name, scope)
+                inner = Scope.for_function(node, scope)
+                node._locals = inner.names
+                pending.extend((param.default_value, inner, node) for param in node.parameters)
+                pending.append((node.body, inner, node))
+                continue
+
+            cls = node.__class__
+            names = _FIELDS.get(cls)
+            if names is None:
+                names = _FIELDS[cls] = tuple(f.name for f in fields(cls))
+            for name in names:
+                value = getattr(node, name)
+                if isinstance(value, (ASTNode, list, tuple)):
+                    pending.append((value, scope, function))
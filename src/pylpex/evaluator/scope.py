@@ -0,0 +1,70 @@
+# pylpex/evaluator/scope.py
+"""
+Analyse statique des portées.
+
+En Pylpex, seules les fonctions créent une portée : une variable est locale à une
+fonction si elle y est définie (paramètre, affectation `=`, variable de boucle `for`
+ou nom de fonction imbriquée). Toute autre lecture remonte les portées englobantes
+jusqu'à l'environnement global.
+"""
+from typing import Dict, List, Optional
+from pylpex.parser.ASTNodes import *
+
+
+def collect_locals(parameters: List[ParameterNode], body: List[ASTNode]) -> List[str]:
+    """Retourne les noms locaux d'une fonction : paramètres d'abord, puis noms définis dans le corps"""
+    names = [param.name for param in parameters]
+    seen = set(names)
+
+    def add(name: str):
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+
+    def walk(statements: List[ASTNode]):
+        for statement in statements:
+            if isinstance(statement, AssignmentNode):
+                if statement.operator == AssignmentOperatorType.ASSIGN and isinstance(statement.target, IdentifierNode):
+                    add(statement.target.name)
+            elif isinstance(statement, FunctionDefNode):
+                add(statement.name)  # le corps est une autre portée
+            elif isinstance(statement, ForNode):
+                add(statement.variable)
+                walk(statement.body)
+            elif isinstance(statement, WhileNode):
+                walk(statement.body)
+            elif isinstance(statement, IfNode):
+                walk(statement.then_block)
+                walk(statement.else_block or [])
+
+    walk(body)
+    return names
+
+
+class Scope:
+    """Portée statique d'une fonction : noms locaux indexés par slot"""
+
+    def __init__(self, names: List[str], parent: Optional['Scope'] = None):
+        self.names = names
+        self.slots: Dict[str, int] = {name: slot for slot, name in enumerate(names)}
+        self.parent = parent
+
+    @classmethod
+    def for_function(cls, node: FunctionDefNode, parent: Optional['Scope'] = None) -> 'Scope':
+        return cls(collect_locals(node.parameters, node.body), parent)
+
+    def resolve(self, name: str) -> Optional[tuple[int, int]]:
+        """
+        Résout un nom en (profondeur, slot).
+        Retourne None si le nom n'est local à aucune fonction englobante (nom global).
+        """
+        scope, depth = self, 0
+        while scope is not None:
+            slot = scope.slots.get(name)
+            if slot is not None:
+                return depth, slot
+            scope, depth = scope.parent, depth + 1
+        return None
+
+    def __repr__(self):
+        return f"Scope({self.names}, parent={self.parent})"
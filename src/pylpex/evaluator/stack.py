@@ -0,0 +1,383 @@
+# pylpex/evaluator/stack.py
+from typing import Any, Callable, Dict, Generator, List, Optional, Type
+from pylpex.parser.ASTNodes import *
+from .environment import Environment, SlotEnvironment
+from .exception import ExecutionError, LimitExceededError
+from .builtin import BuiltinFunction, MemoizedFunction, MISSING
+from .operators import BINARY_OPERATIONS, UNARY_OPERATIONS
+from .statements import NORMAL, BREAK, RETURN, TAIL_CALL
+from .core import Evaluator, Function
+
+
+# Étape d'évaluation d'un nœud : générateur qui produit (yield) les sous-nœuds à évaluer,
+# reçoit leur valeur en retour et se termine (return) avec la valeur du nœud
+Step = Generator[ASTNode, Any, Any]
+
+
+class StackEvaluator(Evaluator):
+    """
+    Évaluateur arborescent sans récursion Python.
+
+    Chaque nœud qui a des sous-nœuds est évalué par une étape `_step_<NomDuNœud>` (un
+    générateur) ; `visit` les exécute avec une pile explicite d'étapes suspendues au lieu
+    d'appels Python imbriqués. La profondeur des expressions et des appels de fonction
+    n'est donc limitée que par la mémoire, sans modifier sys.setrecursionlimit.
+    Les nœuds feuilles (littéraux, variables, définitions de fonction...) sont évalués
+    directement par les méthodes visit_* de l'Evaluator.
+
+    Plus lent que l'évaluateur "tree", mais mêmes résultats et mêmes erreurs.
+    """
+
+    # Tables de la classe : type de nœud -> étape (générateur) ou méthode visit_* d'un nœud feuille
+    _steps: Dict[Type[ASTNode], Callable[..., Step]] = {}
+    _leaves: Dict[Type[ASTNode], Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._steps = {}
+        cls._leaves = {}
+
+    def visit(self, node: ASTNode) -> Any:
+        """Évalue un nœud avec une pile explicite d'étapes"""
+        leaf = self._leaves.get(node.__class__)
+        if leaf is not None:
+            return leaf(self, node)
+        step = self._start(node)
+        if step is None:
+            return self._leaves[node.__class__](self, node)
+
+        stack: List[Step] = []
+        value = None
+        error = None
+        while True:
+            # Reprendre l'étape courante avec la valeur (ou l'erreur) de son dernier sous-nœud
+            try:
+                if error is None:
+                    child = step.send(value)
+                else:
+                    child, error = step.throw(error), None
+            except StopIteration as stop:
+                if not stack:
+                    return stop.value
+                step, value = stack.pop(), stop.value
+                continue
+            except Exception as e:
+                if not stack:
+                    raise
+                step, error = stack.pop(), e
+                continue
+
+            # Évaluer le sous-nœud demandé
+            leaf = self._leaves.get(child.__class__)
+            if leaf is None:
+                child_step = self._start(child)
+                if child_step is not None:
+                    stack.append(step)
+                    step, value = child_step, None
+                    continue
+                leaf = self._leaves[child.__class__]
+            try:
+                value = leaf(self, child)
+            except Exception as e:
+                error = e
+
+    def _start(self, node: ASTNode) -> Optional[Step]:
+        """Étape d'évaluation d'un nœud, ou None pour un nœud feuille (enregistré dans _leaves)"""
+        cls = node.__class__
+        step = self._steps.get(cls)
+        if step is None:
+            step = getattr(type(self), f"_step_{cls.__name__}", None)
+            if step is None:
+                self._leaves[cls] = self._resolve_visitor(cls)
+                return None
+            self._steps[cls] = step
+        return step(self, node)
+
+    # -------------------------------
+    # Blocs et structure du programme
+
+    def _step_block(self, statements: List[ASTNode], owner: ASTNode) -> Step:
+        """Exécute une suite d'instructions (cf. StatementsMixin._execute_block)"""
+        self._countdown -= len(statements)
+        if self._countdown < 0:
+            self._check_limits(owner)
+        result = None
+        for statement in statements:
+            result = yield statement
+            if self._signal:
+                break
+        return result
+
+    def _step_ProgramNode(self, node: ProgramNode) -> Step:
+        return (yield from self._step_block(node.statements, node))
+
+    # -------------------------------
+    # Expressions
+
+    def _step_ListNode(self, node: ListNode) -> Step:
+        elements = []
+        for element in node.elements:
+            elements.append((yield element))
+        return elements
+
+    def _step_DictionaryNode(self, node: DictionaryNode) -> Step:
+        result = {}
+        for key_node, value_node in node.pairs:
+            if isinstance(key_node, StringNode):
+                result[key_node.value] = yield value_node
+            else:
+                key = yield key_node
+                key_type = self._infer_type(key)
+                raise ExecutionError(f"Clé de dictionnaire non hashable pour le type: {key_type}", node)
+        return result
+
+    def _step_IndexNode(self, node: IndexNode) -> Step:
+        collection = yield node.collection
+        index = yield node.index
+        return self._get_index(collection, index, node)
+
+    def _step_AttributeNode(self, node: AttributeNode) -> Step:
+        obj = yield node.object
+        try:
+            return getattr(obj, node.attribute)
+        except AttributeError:
+            raise ExecutionError(
+                f"L'objet de type '{type(obj).__name__}' n'a pas d'attribut '{node.attribute}'",
+                node
+            )
+
+    # -------------------------------
+    # Opérateurs
+
+    def _step_BinaryOpNode(self, node: BinaryOpNode) -> Step:
+        left = yield node.left
+        operator = node.operator
+
+        # Court-circuit pour 'and' et 'or'
+        if operator == BinaryOperatorType.AND:
+            return left if not left else (yield node.right)
+        if operator == BinaryOperatorType.OR:
+            return left if left else (yield node.right)
+
+        right = yield node.right
+        if self._max_collection_size is not None:
+            self._check_operation_size(operator, left, right, node)
+        try:
+            if operator == BinaryOperatorType.DIV:
+                if right == 0:
+                    raise ExecutionError("Division par zéro", node)
+                return left / right
+            operation = BINARY_OPERATIONS.get(operator)
+            return operation(left, right) if operation is not None else None
+        except Exception as e:
+            raise ExecutionError(f"Erreur d'opération: {e}", node)
+
+    def _step_UnaryOpNode(self, node: UnaryOpNode) -> Step:
+        operand = yield node.operand
+        try:
+            return UNARY_OPERATIONS[node.operator](operand)
+        except Exception as e:
+            raise ExecutionError(f"Erreur d'opération unaire: {e}", node)
+
+    def _step_TernaryNode(self, node: TernaryNode) -> Step:
+        condition = yield node.condition
+        return (yield node.true_expr if condition else node.false_expr)
+
+    # -------------------------------
+    # Variables
+
+    def _step_AssignmentNode(self, node: AssignmentNode) -> Step:
+        value = yield node.value
+
+        if isinstance(node.target, IdentifierNode):
+            return self._assign_identifier(node, value)
+        elif isinstance(node.target, IndexNode):
+            collection = yield node.target.collection
+            index = yield node.target.index
+            return self._assign_index(node, collection, index, value)
+        else:
+            raise ExecutionError(f"Target d'assignation invalide: {type(node.target).__name__}", node)
+
+    # -------------------------------
+    # Instructions
+
+    def _step_IfNode(self, node: IfNode) -> Step:
+        condition = yield node.condition
+        if condition:
+            return (yield from self._step_block(node.then_block, node))
+        elif node.else_block:
+            return (yield from self._step_block(node.else_block, node))
+        return None
+
+    def _step_WhileNode(self, node: WhileNode) -> Step:
+        while (yield node.condition):
+            self._countdown -= 1
+            if self._countdown < 0:
+                self._check_limits(node)
+            yield from self._step_block(node.body, node)
+            signal = self._signal
+            if signal:
+                if signal >= RETURN:
+                    return None
+                self._signal = NORMAL
+                if signal == BREAK:
+                    break
+        return None
+
+    def _step_ForNode(self, node: ForNode) -> Step:
+        iterable = yield node.iterable
+
+        try:
+            iter(iterable)
+        except TypeError:
+            raise ExecutionError(f"L'objet de type '{type(iterable).__name__}' n'est pas itérable", node)
+
+        for value in iterable:
+            self._countdown -= 1
+            if self._countdown < 0:
+                self._check_limits(node)
+            self._define_resolved(node.variable, node._slot, value)
+            yield from self._step_block(node.body, node)
+            signal = self._signal
+            if signal:
+                if signal >= RETURN:
+                    return None
+                self._signal = NORMAL
+                if signal == BREAK:
+                    break
+        return None
+
+    def _step_ReturnNode(self, node: ReturnNode) -> Step:
+        if node._tail_call:
+            # Comme l'évaluateur "tree" : l'appel est exécuté par l'appel de fonction en cours
+            func, args, kwargs = yield from self._step_arguments(node.value)
+            if isinstance(func, Function):
+                self._tail_call = (func, args, kwargs, node.value)
+                self._signal = TAIL_CALL
+                return None
+            value = yield from self._step_invoke(func, args, kwargs, node.value)
+        else:
+            value = (yield node.value) if node.value else None
+        self._return_value = value
+        self._signal = RETURN
+        return None
+
+    # -------------------------------
+    # Fonctions
+
+    def _step_CallNode(self, node: CallNode) -> Step:
+        func, args, kwargs = yield from self._step_arguments(node)
+        return (yield from self._step_invoke(func, args, kwargs, node))
+
+    def _step_arguments(self, node: CallNode) -> Step:
+        """Résout la fonction appelée et évalue les arguments"""
+        if isinstance(node.function, str):
+            try:
+                func = self._lookup_resolved(node.function, node._slot)
+            except ExecutionError:
+                raise ExecutionError(f"Fonction '{node.function}' non définie", node)
+        else:
+            func = yield node.function
+
+        args = []
+        kwargs = {}
+        for arg_node in node.arguments:
+            value = yield arg_node.value
+            if arg_node.name is None:
+                args.append(value)
+            else:
+                kwargs[arg_node.name] = value
+        return func, args, kwargs
+
+    def _step_invoke(self, func: Any, args: list, kwargs: dict, node: CallNode) -> Step:
+        """Appelle une fonction avec des arguments déjà évalués"""
+        try:
+            if isinstance(func, MemoizedFunction) and isinstance(func.function, Function):
+                # Appel mémoïsé exécuté sur la pile d'étapes plutôt que par call_function
+                key = func.key(args, kwargs)
+                result = func.get(key)
+                if result is MISSING:
+                    result = yield from self._step_user_function(func.function, args, kwargs, node)
+                    func.store(key, result)
+                return result
+            if isinstance(func, BuiltinFunction):
+                return self._call_builtin_function(func, args, kwargs, node)
+            elif isinstance(func, Function):
+                return (yield from self._step_user_function(func, args, kwargs, node))
+            else:
+                raise ExecutionError(f"'{func}' n'est pas appelable", node)
+        except LimitExceededError:
+            raise
+        except (TypeError, ExecutionError) as e:
+            raise ExecutionError(f"Erreur d'appel de fonction: {e}", node)
+
+    def _step_user_function(self, func: Function, args: list, kwargs: dict, node: ASTNode) -> Step:
+        """Appelle une fonction définie par l'utilisateur (cf. Evaluator._call_user_function)"""
+        while True:
+            if func.local_names is not None:
+                func_env = SlotEnvironment(func.local_names, func.local_slots, parent=func.closure)
+            else:
+                func_env = Environment(parent=func.closure)
+
+            nargs = len(args)
+            if nargs > func.arity:
+                raise ExecutionError(
+                    f"Trop d'arguments pour '{func.name}': attendu {func.arity}, reçu {nargs}",
+                    node
+                )
+            if nargs == func.arity and func.local_names is not None:
+                func_env.values[:nargs] = args
+            else:
+                yield from self._step_bind_parameters(func, func_env, args, kwargs, node)
+
+            self._countdown -= 1  # l'appel (le corps est décompté par _step_block)
+            if self._countdown < 0:
+                self._check_limits(node)
+            self._depth += 1
+            if self._depth > self._max_depth:
+                self._depth -= 1
+                raise self._depth_error(node)
+            old_env = self.current_env
+            self.current_env = func_env
+            try:
+                result = yield from self._step_block(func.body, node)
+            finally:
+                self.current_env = old_env
+                self._depth -= 1
+
+            signal = self._signal
+            if signal == RETURN:
+                result = self._return_value
+                self._signal, self._return_value = NORMAL, None
+            if signal != TAIL_CALL:
+                return result
+
+            # Appel récursif terminal
+            callee, args, kwargs, node = self._tail_call
+            self._signal, self._tail_call = NORMAL, None
+            if callee is not func:
+                return (yield from self._step_invoke(callee, args, kwargs, node))
+
+    def _step_bind_parameters(self, func: Function, func_env: Environment, args: list, kwargs: dict, node: ASTNode) -> Step:
+        """Lie les arguments et évalue les valeurs par défaut (cf. Evaluator._bind_parameters)"""
+        names = func.parameter_names
+        for name, arg_value in zip(names, args):
+            func_env.define(name, arg_value)
+
+        for i in range(len(args), func.arity):
+            name = names[i]
+            if name in kwargs:
+                func_env.define(name, kwargs[name])
+            elif func.default_values[i] is not None:
+                old_env = self.current_env
+                self.current_env = func_env
+                try:
+                    default_val = yield func.default_values[i]
+                finally:
+                    self.current_env = old_env
+                func_env.define(name, default_val)
+            else:
+                raise ExecutionError(
+                    f"Argument manquant pour le paramètre '{name}' de '{func.name}'",
+                    node
+                )
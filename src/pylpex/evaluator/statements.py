@@ -1,60 +1,80 @@
 
-from typing import Any
+from typing import Any, List
 from pylpex.parser.ASTNodes import *
 from .exception import ExecutionError
 
 
-class BreakException(Exception):
-    """Exception pour gérer l'instruction break"""
-    pass
-
-
-class ContinueException(Exception):
-    """Exception pour gérer l'instruction continue"""
-    pass
+# Signaux de contrôle des instructions return / break / continue.
+# Une instruction de contrôle positionne le signal de l'évaluateur au lieu de lever une
+# exception : les blocs s'interrompent dès qu'un signal est actif, les boucles consomment
+# break et continue, l'appel de fonction (ou le programme) consomme return.
+# TAIL_CALL est un return d'appel récursif terminal, exécuté par l'appel en cours.
+NORMAL = 0
+BREAK = 1
+CONTINUE = 2
+RETURN = 3
+TAIL_CALL = 4
 
 
 class StatementsMixin:
 
+    def _execute_block(self, statements: List[ASTNode], owner: ASTNode) -> Any:
+        """
+        Exécute une suite d'instructions jusqu'à la fin ou jusqu'à un signal de contrôle.
+        `owner` est le nœud qui contient le bloc (position d'un dépassement de limite).
+        """
+        # Compte à rebours des limites d'exécution (cf. LimitsMixin)
+        self._countdown -= len(statements)
+        if self._countdown < 0:
+            self._check_limits(owner)
+        result = None
+        for statement in statements:
+            result = self.visit(statement)
+            if self._signal:
+                break
+        return result
+
     def visit_IfNode(self, node: IfNode) -> Any:
         """Évalue une condition if/else"""
         condition = self.visit(node.condition)
         
         if condition:
-            result = None
-            for statement in node.then_block:
-                result = self.visit(statement)
-            return result
+            return self._execute_block(node.then_block, node)
         elif node.else_block:
-            result = None
-            for statement in node.else_block:
-                result = self.visit(statement)
-            return result
+            return self._execute_block(node.else_block, node)
         
         return None
     
 
     def visit_BreakNode(self, node: BreakNode) -> None:
         """Gère l'instruction break"""
-        raise BreakException()
+        self._signal = BREAK
     
 
     def visit_ContinueNode(self, node: ContinueNode) -> None:
         """Gère l'instruction continue"""
-        raise ContinueException()
+        self._signal = CONTINUE
     
 
     def visit_WhileNode(self, node: WhileNode) -> None:
         """Évalue une boucle while"""
-        try:
-            while self.visit(node.condition):
-                try:
-                    for statement in node.body:
-                        self.visit(statement)
-                except ContinueException:
-                    continue
-        except BreakException:
-            pass
+        visit = self.visit
+        cost = len(node.body) + 1  # l'itération et les instructions du corps
+        while visit(node.condition):
+            self._countdown -= cost
+            if self._countdown < 0:
+                self._check_limits(node)
+            for statement in node.body:
+                visit(statement)
+                if self._signal:
+                    break
+            signal = self._signal
+            if signal:
+                if signal >= RETURN:
+                    return None
+                self._signal = NORMAL
+                if signal == BREAK:
+                    break
         
         return None
     
@@ -68,15 +88,23 @@ class StatementsMixin:
         except TypeError:
             raise ExecutionError(f"L'objet de type '{type(iterable).__name__}' n'est pas itérable", node)
         
-        try:
-            for value in iterable:
-                self.current_env.define(node.variable, value)
-                try:
-                    for statement in node.body:
-                        self.visit(statement)
-                except ContinueException:
-                    continue
-        except BreakException:
-            pass
+        visit = self.visit
+        cost = len(node.body) + 1  # l'itération et les instructions du corps
+        for value in iterable:
+            self._countdown -= cost
+            if self._countdown < 0:
+                self._check_limits(node)
+            self._define_resolved(node.variable, node._slot, value)
+            for statement in node.body:
+                visit(statement)
+                if self._signal:
+                    break
+            signal = self._signal
+            if signal:
+                if signal >= RETURN:
+                    return None
+                self._signal = NORMAL
+                if signal == BREAK:
+                    break
         
-        return None
\ No newline at end of file
+        return None
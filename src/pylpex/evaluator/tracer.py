@@ -0,0 +1,142 @@
+# pylpex/evaluator/tracer.py
+import json
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+from pylpex.parser.ASTNodes import ASTNode
+from .builtin import BuiltinFunction
+from .core import Evaluator, Function
+
+# Frame racine : le code de premier niveau du programme, hors de toute fonction
+ROOT_FRAME = "<programme>"
+
+OPEN, CLOSE = "O", "C"
+
+
+class CallTrace:
+    """
+    Trace des appels de fonctions Pylpex (fonctions utilisateur et builtins) : chaque entrée
+    et sortie de fonction est enregistrée avec son instant, ce qui permet de reconstruire la
+    pile d'appels Pylpex à tout moment de l'exécution.
+
+    La trace s'exporte en piles repliées (une ligne `a;b;c durée` par pile, format des outils
+    flamegraph.pl, inferno...) ou en profil speedscope (https://www.speedscope.app).
+    Chaque appel ajoute deux événements : la mémoire croît avec le nombre d'appels tracés.
+    """
+
+    def __init__(self):
+        self.frames: List[str] = []  # noms des frames, indexés par les événements
+        self.events: List[Tuple[str, int, float]] = []  # (OPEN ou CLOSE, frame, secondes depuis le début)
+        self._frame_index: Dict[str, int] = {}
+        self._start: Optional[float] = None
+
+    def clear(self):
+        self.__init__()
+
+    def _frame(self, name: str) -> int:
+        index = self._frame_index.get(name)
+        if index is None:
+            index = self._frame_index[name] = len(self.frames)
+            self.frames.append(name)
+        return index
+
+    def _open(self, frame: int):
+        now = perf_counter()
+        if self._start is None:
+            self._start = now
+        self.events.append((OPEN, frame, now - self._start))
+
+    def _close(self, frame: int):
+        self.events.append((CLOSE, frame, perf_counter() - self._start))
+
+    # -------------------------------
+    # Export
+
+    def collapsed_stacks(self) -> Dict[Tuple[str, ...], float]:
+        """Temps propre (en secondes) passé dans chaque pile d'appels"""
+        stacks: Dict[Tuple[str, ...], float] = {}
+        stack: List[str] = []
+        last = 0.0
+        for kind, frame, at in self.events:
+            if stack:
+                key = tuple(stack)
+                stacks[key] = stacks.get(key, 0.0) + (at - last)
+            if kind == OPEN:
+                stack.append(self.frames[frame])
+            else:
+                stack.pop()
+            last = at
+        return stacks
+
+    def to_collapsed(self) -> str:
+        """Piles repliées, pondérées par leur temps propre en microsecondes"""
+        lines = []
+        for stack, seconds in self.collapsed_stacks().items():
+            weight = round(seconds * 1e6)
+            if weight > 0:
+                lines.append(f"{';'.join(stack)} {weight}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def to_speedscope(self, name: str = "pylpex") -> Dict[str, Any]:
+        """Profil speedscope ("evented") : instants en microsecondes depuis le début de la trace"""
+        events = [{"type": kind, "frame": frame, "at": at * 1e6} for kind, frame, at in self.events]
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": [{"name": frame} for frame in self.frames]},
+            "profiles": [{
+                "type": "evented",
+                "name": name,
+                "unit": "microseconds",
+                "startValue": 0,
+                "endValue": events[-1]["at"] if events else 0,
+                "events": events,
+            }],
+            "name": name,
+            "activeProfileIndex": 0,
+            "exporter": "pylpex",
+        }
+
+    def write_collapsed(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_collapsed())
+
+    def write_speedscope(self, path: str, name: str = "pylpex"):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_speedscope(name), f)
+
+    def __repr__(self) -> str:
+        return f"CallTrace({len(self.frames)} frames, {len(self.events)} événements)"
+
+
+class TracingEvaluator(Evaluator):
+    """
+    Évaluateur "tree" qui enregistre la pile des appels de fonctions Pylpex dans `trace`
+    (cf. CallTrace), pour produire un flame graph du programme plutôt que des frames Python
+    de l'interpréteur.
+
+    Seuls les appels de fonctions sont tracés (pas chaque nœud) : le surcoût est bien moindre
+    que celui du ProfilingEvaluator. Un appel récursif terminal (exécuté en boucle par
+    l'évaluateur, cf. _call_user_function) apparaît comme un seul appel.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.trace = CallTrace()
+
+    def evaluate(self, node: ASTNode) -> Any:
+        return self._traced(self.trace._frame(ROOT_FRAME), super().evaluate, node)
+
+    def _traced(self, frame: int, call, *args) -> Any:
+        trace = self.trace
+        trace._open(frame)
+        try:
+            return call(*args)
+        finally:
+            trace._close(frame)
+
+    def _call_user_function(self, func: Function, args: list, kwargs: dict, node: ASTNode) -> Any:
+        frame = self.trace._frame(func.name)
+        return self._traced(frame, super()._call_user_function, func, args, kwargs, node)
+
+    def _call_builtin_function(self, func: BuiltinFunction, args: list, kwargs: dict, node: ASTNode) -> Any:
+        frame = self.trace._frame(f"{func.name} (builtin)")
+        return self._traced(frame, super()._call_builtin_function, func, args, kwargs, node)
@@ -1,18 +1,56 @@
 
-from typing import Any
+from typing import Any, Optional
 from pylpex.parser.ASTNodes import *
+from .environment import UNBOUND
 from .exception import ExecutionError
+from .operators import COMPOUND_TO_BINARY
 
 class VariablesMixin:
 
+    def _lookup_resolved(self, name: str, resolved: Optional[tuple[int, Optional[int]]]) -> Any:
+        """Lit un nom à partir de sa résolution statique (profondeur, slot), cf. Resolver"""
+        env = self.current_env
+        if resolved is not None:
+            depth, slot = resolved
+            while depth:
+                env = env.parent
+                depth -= 1
+            if slot is not None:
+                value = env.values[slot]
+                if value is not UNBOUND:
+                    return value
+                # Slot pas encore défini : repli sur les portées englobantes
+                env = env.parent
+        return env.lookup(name)
+
+    def _define_resolved(self, name: str, resolved: Optional[tuple[int, Optional[int]]], value: Any):
+        """Définit un nom dans la portée courante (slot local si résolu)"""
+        if resolved is not None and resolved[1] is not None:
+            self.current_env.values[resolved[1]] = value
+        else:
+            self.current_env.define(name, value)
+
     def visit_IdentifierNode(self, node: IdentifierNode) -> Any:
+        resolved = node._slot
+        if resolved is not None and resolved[1] is not None:
+            # Chemin rapide : lecture directe du slot
+            depth, slot = resolved
+            env = self.current_env
+            while depth:
+                env = env.parent
+                depth -= 1
+            value = env.values[slot]
+            if value is not UNBOUND:
+                return value
         try:
-            return self.current_env.lookup(node.name)
+            return self._lookup_resolved(node.name, resolved)
         except ExecutionError:
             raise ExecutionError(f"Variable '{node.name}' non définie", node)
 
     def _apply_compound_operator(self, operator: AssignmentOperatorType, current: Any, value: Any, node: ASTNode) -> Any:
         """Applique un opérateur composé (+=, -=, etc.) et retourne la nouvelle valeur"""
+        if self._max_collection_size is not None and operator in COMPOUND_TO_BINARY:
+            self._check_operation_size(COMPOUND_TO_BINARY[operator], current, value, node)
         try:
             if operator == AssignmentOperatorType.PLUS:
                 return current + value
@@ -38,45 +76,69 @@ class VariablesMixin:
 
         if isinstance(node.target, IdentifierNode):
             # Assignation à une variable: x = 5 ou x += 5
-            if node.operator == AssignmentOperatorType.ASSIGN:
-                self.current_env.define(node.target.name, value)
-            else:
-                # Opérateurs composés: +=, -=, etc.
-                try:
-                    current = self.current_env.lookup(node.target.name)
-                except ExecutionError:
-                    raise ExecutionError(f"Variable '{node.target.name}' non définie", node)
-                
-                value = self._apply_compound_operator(node.operator, current, value, node)
-                self.current_env.assign(node.target.name, value)
+            return self._assign_identifier(node, value)
         
         elif isinstance(node.target, IndexNode):
             # Assignation à un index: lst[0] = 5 ou lst[0] += 5
             collection = self.visit(node.target.collection)
             index = self.visit(node.target.index)
-            
-            if node.operator == AssignmentOperatorType.ASSIGN:
-                try:
-                    collection[index] = value
-                except (TypeError, KeyError, IndexError) as e:
-                    raise ExecutionError(f"Erreur d'assignation: {e}", node)
-            else:
-                # Opérateurs composés
-                try:
-                    current = collection[index]
-                except (TypeError, KeyError, IndexError) as e:
-                    raise ExecutionError(f"Erreur de lecture: {e}", node)
-                
-                value = self._apply_compound_operator(node.operator, current, value, node)
-                
-                try:
-                    collection[index] = value
-                except (TypeError, KeyError, IndexError) as e:
-                    raise ExecutionError(f"Erreur d'assignation: {e}", node)
-            
+            return self._assign_index(node, collection, index, value)
         
         # TODO : Ajouter le cas pour les attributs (x.y = 5) 
         else:
             raise ExecutionError(f"Target d'assignation invalide: {type(node.target).__name__}", node)
+
+    def _assign_identifier(self, node: AssignmentNode, value: Any) -> Any:
+        """Assigne une valeur déjà évaluée à la variable cible et retourne la valeur assignée"""
+        if node.operator == AssignmentOperatorType.ASSIGN:
+            self._define_resolved(node.target.name, node.target._slot, value)
+            return value
+        
+        # Opérateurs composés: +=, -=, etc.
+        resolved = node.target._slot
+        if resolved is not None and resolved[1] is not None:
+            # Accès direct au slot de la portée qui définit le nom
+            depth, slot = resolved
+            env = self.current_env
+            while depth:
+                env = env.parent
+                depth -= 1
+            current = env.values[slot]
+            if current is not UNBOUND:
+                value = self._apply_compound_operator(node.operator, current, value, node)
+                env.values[slot] = value
+                return value
+
+        try:
+            current = self._lookup_resolved(node.target.name, resolved)
+        except ExecutionError:
+            raise ExecutionError(f"Variable '{node.target.name}' non définie", node)
+        
+        value = self._apply_compound_operator(node.operator, current, value, node)
+        self.current_env.assign(node.target.name, value)
+        return value
+
+    def _assign_index(self, node: AssignmentNode, collection: Any, index: Any, value: Any) -> Any:
+        """Assigne une valeur déjà évaluée à collection[index] et retourne la valeur assignée"""
+        if node.operator == AssignmentOperatorType.ASSIGN:
+            try:
+                if self._max_collection_size is not None and isinstance(collection, dict) and index not in collection:
+                    self._check_size(len(collection) + 1, node)
+                collection[index] = value
+            except (TypeError, KeyError, IndexError) as e:
+                raise ExecutionError(f"Erreur d'assignation: {e}", node)
+        else:
+            # Opérateurs composés
+            try:
+                current = collection[index]
+            except (TypeError, KeyError, IndexError) as e:
+                raise ExecutionError(f"Erreur de lecture: {e}", node)
+            
+            value = self._apply_compound_operator(node.operator, current, value, node)
+            
+            try:
+                collection[index] = value
+            except (TypeError, KeyError, IndexError) as e:
+                raise ExecutionError(f"Erreur d'assignation: {e}", node)
         
-        return value
\ No newline at end of file
+        return value
@@ -1,11 +1,36 @@
-
+from typing import Callable, Dict, Type
 from pylpex.parser.ASTNodes import ASTNode
 
 class ASTVisitor:
+    """
+    Visiteur d'AST : `visit` appelle la méthode `visit_<NomDuNœud>` du visiteur,
+    ou `generic_visit` s'il n'en a pas.
+
+    La méthode associée à chaque type de nœud est cherchée une seule fois par classe
+    de visiteur puis conservée dans une table de dispatch : `visit` ne construit plus
+    de nom de méthode ni n'appelle getattr à chaque nœud.
+    """
+
+    # Table de dispatch de la classe : type de nœud -> fonction visit_* (non liée).
+    # Chaque sous-classe reçoit sa propre table (cf. __init_subclass__)
+    _dispatch: Dict[Type[ASTNode], Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {}
+
     def visit(self, node: ASTNode):
-        method_name = f"visit_{type(node).__name__}"
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+        visitor = self._dispatch.get(node.__class__)
+        if visitor is None:
+            visitor = self._resolve_visitor(node.__class__)
+        return visitor(self, node)
+
+    @classmethod
+    def _resolve_visitor(cls, node_type: Type[ASTNode]) -> Callable:
+        """Méthode de visite d'un type de nœud, cherchée puis enregistrée dans la table de la classe"""
+        visitor = getattr(cls, f"visit_{node_type.__name__}", cls.generic_visit)
+        cls._dispatch[node_type] = visitor
+        return visitor
 
     def generic_visit(self, node):
-        raise NotImplementedError(f"Aucune méthode visit_{type(node).__name__}")
\ No newline at end of file
+        raise NotImplementedError(f"Aucune méthode visit_{type(node).__name__}")
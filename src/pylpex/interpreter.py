@@ -1,7 +1,25 @@
-from typing import List, Optional, Any
-from .lexer import Lexer, Token
+from contextlib import nullcontext
+from typing import ContextManager, Iterable, List, Optional, Any
+from .lexer import Lexer, StreamLexer, Token, LEXERS
 from .parser import Parser, ASTNode
-from .evaluator import Evaluator
+from .parser.ASTNodes import ProgramNode
+from .evaluator import Evaluator, ClosureEvaluator, StackEvaluator, ProfilingEvaluator, TracingEvaluator
+from .evaluator import ExecutionLimits
+from .compiler import VirtualMachine, PythonEvaluator
+from .optimizer import Optimizer, count_nodes
+from .cache import ParseCache, load_program
+from .stats import InterpreterStats
+
+# Moteurs d'exécution disponibles
+ENGINES = {
+    "tree": Evaluator,           # parcours de l'AST (visiteur)
+    "closure": ClosureEvaluator, # AST compilé en fermetures Python
+    "bytecode": VirtualMachine,  # AST compilé en bytecode exécuté par une machine virtuelle à pile
+    "python": PythonEvaluator,   # AST traduit en source Python, compilé et exécuté par CPython
+    "stack": StackEvaluator,     # parcours de l'AST avec une pile explicite (sans récursion Python)
+    "profile": ProfilingEvaluator, # moteur "tree" instrumenté : temps par nœud, ligne et fonction
+    "trace": TracingEvaluator,   # moteur "tree" qui trace la pile des appels Pylpex (flame graph)
+}
 
 class Interpreter:
     """
@@ -9,14 +27,39 @@ class Interpreter:
     Peut être utilisé pour des exécutions multiples avec un état partagé.
     """
     
-    def __init__(self, reset_on_error: bool = False):
+    def __init__(self, reset_on_error: bool = False, engine: str = "tree", optimize: bool = False, cache_size: int = 128,
+                 lexer: str = "scanner", stats: bool = False, limits: Optional[ExecutionLimits] = None):
         """
         Initialise l'interpréteur.
         
         Args:
             reset_on_error: Si True, réinitialise l'environnement en cas d'erreur
+            engine: Moteur d'exécution ("tree", "closure", "bytecode", "python", "stack", "profile" ou "trace")
+            optimize: Si True, optimise l'AST entre le parsing et l'évaluation (cf. Optimizer) ;
+                      l'AST d'origine n'est pas modifié
+            cache_size: Nombre d'AST conservés par `evaluate` pour éviter de reparser un code
+                        déjà exécuté (0 pour désactiver le cache)
+            lexer: Implémentation du lexer ("scanner" ou "regex", cf. LEXERS)
+            stats: Si True, mesure le temps de chaque phase et compte tokens, nœuds et
+                   nœuds visités (cf. InterpreterStats, disponible dans `stats`)
+            limits: Limites de chaque évaluation (instructions, profondeur d'appel, durée,
+                    taille des collections) ; leur dépassement lève LimitExceededError.
+                    Appliquées par les moteurs "tree", "stack", "profile" et "trace"
         """
-        self.evaluator = Evaluator()
+        if engine not in ENGINES:
+            raise ValueError(f"Moteur inconnu '{engine}', attendu parmi: {', '.join(ENGINES)}")
+        if lexer not in LEXERS:
+            raise ValueError(f"Lexer inconnu '{lexer}', attendu parmi: {', '.join(LEXERS)}")
+        self.lexer = LEXERS[lexer]
+        self.engine = engine
+        self.stats = InterpreterStats() if stats else None
+        self.limits = limits
+        self.evaluator = self._new_evaluator()
+        self.optimizer = None
+        if optimize:
+            # Les chaînes plus longues que la limite ne sont pas repliées : leur taille est vérifiée à l'exécution
+            self.optimizer = Optimizer(limits.max_collection_size if limits is not None else None)
+        self.cache = ParseCache(cache_size)
         self.reset_on_error = reset_on_error
 
     def tokenize(self, code: str) -> List[Token]:
@@ -29,7 +72,7 @@ class Interpreter:
         Returns:
             Liste de tokens
         """
-        lexer = Lexer(code)
+        lexer = self.lexer(code)
         return lexer.tokenize()
     
     def parse(self, code: str) -> ASTNode:
@@ -42,10 +85,106 @@ class Interpreter:
         Returns:
             Arbre syntaxique abstrait (AST)
         """
-        tokens = self.tokenize(code)
-        parser = Parser(tokens)
-        return parser.parse()
+        if self.stats is None:
+            # Les tokens sont produits au fil du parsing, sans matérialiser leur liste
+            parser = Parser(self.lexer(code).iter_tokens())
+            return parser.parse()
+
+        # Statistiques : tokenisation puis parsing, mesurés séparément
+        with self.stats.phase("tokenize"):
+            tokens = self.tokenize(code)
+        self.stats.count("tokens", len(tokens))
+        with self.stats.phase("parse"):
+            ast = Parser(iter(tokens)).parse()
+        self.stats.count("nodes", count_nodes(ast))
+        return ast
     
+    def parse_file(self, path: str, write_cache: bool = True) -> ASTNode:
+        """
+        Parse un fichier source, en réutilisant son fichier compilé `.pylc` s'il est à jour.
+        
+        Args:
+            path: Chemin du fichier source
+            write_cache: Si True, (ré)écrit le `.pylc` à côté de la source après un parsing
+            
+        Returns:
+            Arbre syntaxique abstrait (AST)
+        """
+        with self._phase("parse"):
+            ast = load_program(path, write=write_cache, lexer=self.lexer)
+        if self.stats is not None:
+            self.stats.count("nodes", count_nodes(ast))
+        return ast
+
+    def optimize(self, ast: ASTNode) -> ASTNode:
+        """
+        Optimise un AST si l'optimiseur est activé.
+        Le nombre de nœuds supprimés est disponible dans `optimizer.nodes_removed`.
+        
+        Args:
+            ast: Arbre syntaxique à optimiser
+            
+        Returns:
+            AST optimisé (une copie partielle : `ast` n'est pas modifié), ou `ast` lui-même
+        """
+        if self.optimizer is None:
+            return ast
+        with self._phase("optimize"):
+            return self.optimizer.optimize(ast)
+    
+    def compile(self, code: str) -> ASTNode:
+        """
+        Parse et optimise le code source, en passant par le cache des AST.
+        L'AST retourné peut être partagé avec le cache : il ne doit pas être modifié.
+        
+        Args:
+            code: Code source à compiler
+            
+        Returns:
+            AST prêt à être évalué
+        """
+        ast = self.cache.get(code)
+        if ast is None:
+            ast = self.optimize(self.parse(code))
+            self.cache.put(code, ast)
+        elif self.stats is not None:
+            self.stats.mark_cached()
+        return ast
+
+    # ----------------------------------------------------------
+    # Statistiques
+
+    def _new_evaluator(self):
+        evaluator = ENGINES[self.engine]()
+        if self.limits is not None:
+            evaluator.set_limits(self.limits)
+        if self.stats is not None:
+            self.stats.instrument(evaluator)
+        return evaluator
+
+    def _call(self) -> ContextManager:
+        """Enregistre un appel dans les statistiques (si elles sont activées)"""
+        return self.stats.call() if self.stats is not None else nullcontext()
+
+    def _phase(self, name: str) -> ContextManager:
+        """Chronomètre une phase dans les statistiques (si elles sont activées)"""
+        return self.stats.phase(name) if self.stats is not None else nullcontext()
+
+    def _run(self, ast: ASTNode) -> Any:
+        """Exécute un AST prêt à être évalué"""
+        with self._phase("evaluate"):
+            return self.evaluator.evaluate(ast)
+
+    @property
+    def cache_hits(self) -> int:
+        """Nombre d'évaluations dont l'AST a été trouvé dans le cache"""
+        return self.cache.hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Nombre d'évaluations ayant nécessité un parsing"""
+        return self.cache.misses
+
     def evaluate(self, code: str) -> Any:
         """
         Évalue le code source et retourne le résultat.
@@ -58,12 +197,61 @@ class Interpreter:
             Résultat de l'évaluation
         """
         try:
-            ast = self.parse(code)
-            return self.evaluator.evaluate(ast)
+            with self._call():
+                return self._run(self.compile(code))
+        except Exception as e:
+            if self.reset_on_error:
+                self.reset()
+            raise
+
+    def evaluate_file(self, path: str, write_cache: bool = True) -> Any:
+        """
+        Évalue un fichier source (cf. parse_file pour le cache `.pylc`).
+        
+        Args:
+            path: Chemin du fichier source
+            write_cache: Si True, écrit le `.pylc` lorsque la source a été parsée
+            
+        Returns:
+            Résultat de l'évaluation
+        """
+        with self._call():
+            try:
+                ast = self.parse_file(path, write_cache)
+            except Exception as e:
+                if self.reset_on_error:
+                    self.reset()
+                raise
+            return self.eval_ast(ast)
+
+    def evaluate_stream(self, lines: Iterable[str]) -> Any:
+        """
+        Évalue un source lu au fil de l'eau (fichier ouvert, sys.stdin...) : chaque
+        instruction de premier niveau est exécutée dès qu'elle est parsée, puis son AST
+        est libéré. La mémoire ne dépend pas de la taille du source et les premiers
+        résultats sont produits sans attendre la fin de la lecture. En contrepartie,
+        une erreur de syntaxe n'est levée qu'après l'exécution des instructions qui la précèdent.
+        
+        Args:
+            lines: Lignes du code source (un objet fichier convient)
+            
+        Returns:
+            Résultat de la dernière instruction
+        """
+        result = None
+        try:
+            with self._call():
+                # Lexing et parsing entrelacés avec l'exécution : seules l'optimisation et
+                # l'évaluation sont mesurées
+                parser = Parser(StreamLexer(lines, self.lexer).iter_tokens())
+                for statement in parser.iter_statements():
+                    program = ProgramNode(statements=[statement], position=statement.position)
+                    result = self._run(self.optimize(program))
         except Exception as e:
             if self.reset_on_error:
                 self.reset()
             raise
+        return result
 
     def eval_ast(self, ast: ASTNode) -> Any:
         """
@@ -76,7 +264,8 @@ class Interpreter:
             Résultat de l'évaluation
         """
         try:
-            return self.evaluator.eval(ast)
+            with self._call():
+                return self._run(self.optimize(ast))
         except Exception as e:
             if self.reset_on_error:
                 self.reset()
@@ -84,7 +273,7 @@ class Interpreter:
 
     def reset(self):
         """Réinitialise l'environnement de l'interpréteur."""
-        self.evaluator = Evaluator()
+        self.evaluator = self._new_evaluator()
 
     # ----------------------------------------------------------
     # Gestion des variables et fonctions dans l'environnement
@@ -1,9 +1,20 @@
 from .tokens import Token, TokenType
 from .core import Lexer, LexicalError
+from .regex import RegexLexer
+from .stream import StreamLexer
+
+# Implémentations disponibles du lexer (mêmes tokens)
+LEXERS = {
+    "scanner": Lexer,     # lecture caractère par caractère
+    "regex": RegexLexer,  # expression régulière maîtresse, plus rapide sur les gros sources
+}
 
 __all__ = [
     "Token",
     "TokenType",
     "Lexer",
+    "RegexLexer",
+    "StreamLexer",
+    "LEXERS",
     "LexicalError"
-]
\ No newline at end of file
+]
@@ -1,8 +1,12 @@
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from .tokens import Token, TokenType
 
 
+# Message des commentaires bloc non fermés (une lecture en flux attend alors la suite du source)
+UNTERMINATED_COMMENT = "Commentaire bloc non terminé"
+
+
 class LexicalError(Exception):
     """Erreur lexicale détectée pendant l'analyse lexicale"""
     def __init__(self, message: str, line: int, column: int):
@@ -98,7 +102,7 @@ class Lexer:
                 comment += self.current_char
                 self.advance()
             else:
-                raise LexicalError("Commentaire bloc non terminé", start_line, start_column)
+                raise LexicalError(UNTERMINATED_COMMENT, start_line, start_column)
             return Token(TokenType.COMMENT, comment.strip(), start_line, start_column, _actual_value=f"/*{comment}*/")
         
         return None
@@ -305,22 +309,26 @@ class Lexer:
 
         return Token(TokenType.EOF, '', self.line, self.column)
 
-    def tokenize(self) -> List[Token]:
-        """Tokenise tout le code source"""
-        tokens = []
+    def iter_tokens(self) -> Iterator[Token]:
+        """
+        Générateur des tokens, produits à la demande jusqu'à EOF (inclus).
+        Les nouvelles lignes multiples sont fusionnées comme dans tokenize.
+        """
+        previous = None
         token = self.get_next_token()
         
         while token.type != TokenType.EOF:
             # Ignore les nouvelles lignes multiples
-            if token.type == TokenType.NEWLINE:
-                if not tokens or tokens[-1].type != TokenType.NEWLINE:
-                    tokens.append(token)
-            else:
-                tokens.append(token)
+            if token.type != TokenType.NEWLINE or previous != TokenType.NEWLINE:
+                yield token
+                previous = token.type
             token = self.get_next_token()
         
-        tokens.append(token)  # Add EOF
-        return tokens
+        yield token  # EOF
+
+    def tokenize(self) -> List[Token]:
+        """Tokenise tout le code source"""
+        return list(self.iter_tokens())
     
     # -----------------------------------------------------
     # Helper methods
@@ -0,0 +1,210 @@
+import re
+from typing import Iterator
+from .tokens import Token, TokenType
+from .core import Lexer, LexicalError, UNTERMINATED_COMMENT
+
+
+# Opérateurs et délimiteurs, les plus longs d'abord pour que l'alternative retienne la plus longue correspondance
+OPERATORS = {
+    '**=': TokenType.POWER_ASSIGN,
+    '+=': TokenType.PLUS_ASSIGN,
+    '-=': TokenType.MINUS_ASSIGN,
+    '*=': TokenType.MUL_ASSIGN,
+    '/=': TokenType.DIV_ASSIGN,
+    '%=': TokenType.MOD_ASSIGN,
+    '==': TokenType.EQ,
+    '!=': TokenType.NEQ,
+    '<=': TokenType.LTE,
+    '>=': TokenType.GTE,
+    '**': TokenType.POWER,
+    '->': TokenType.ARROW,
+    '+': TokenType.PLUS,
+    '-': TokenType.MINUS,
+    '*': TokenType.MUL,
+    '/': TokenType.DIV,
+    '%': TokenType.MOD,
+    '=': TokenType.ASSIGN,
+    '<': TokenType.LT,
+    '>': TokenType.GT,
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+    '}': TokenType.RBRACE,
+    '{': TokenType.LBRACE,
+    ']': TokenType.RBRACKET,
+    '[': TokenType.LBRACKET,
+    ',': TokenType.COMMA,
+    ';': TokenType.SEMICOLON,
+    ':': TokenType.COLON,
+    '.': TokenType.DOT,
+}
+
+# Expression maîtresse : les blancs en tête sont consommés avec le token,
+# puis une alternative nommée par catégorie de token, essayées dans l'ordre
+MASTER_PATTERN = re.compile(r"[ \t\r]*(?:" + "|".join([
+    r"(?P<IDENTIFIER>[^\W\d]\w*)",
+    r"(?P<LINE_COMMENT>//[^\n]*)",
+    r"(?P<BLOCK_COMMENT>/\*.*?\*/)",
+    r"(?P<UNTERMINATED_COMMENT>/\*)",
+    "(?P<OPERATOR>" + "|".join(re.escape(op) for op in OPERATORS) + ")",
+    r"(?P<NUMBER>\d[\d_]*(?:\.[\d_]*)?)",
+    r"(?P<NEWLINE>\n)",
+    r"(?P<STRING>\"(?:[^\"\\]|\\.)*\"?|'(?:[^'\\]|\\.)*'?)",
+    r"(?P<END>$)",
+]) + ")", re.DOTALL)
+
+ESCAPE_PATTERN = re.compile(r"\\(.)", re.DOTALL)
+ESCAPE_CHARS = {'n': '\n', 't': '\t', 'r': '\r'}
+
+
+def _unescape(match: re.Match) -> str:
+    char = match.group(1)
+    return ESCAPE_CHARS.get(char, char)
+
+
+def _is_escaped(text: str) -> bool:
+    """Vrai si le dernier caractère d'une chaîne est échappé (chaîne non terminée)"""
+    backslashes = len(text) - 1 - len(text[:-1].rstrip('\\'))
+    return backslashes % 2 == 1
+
+
+class RegexLexer(Lexer):
+    """
+    Lexer à expression régulière maîtresse : chaque token (blancs en tête compris)
+    est reconnu en une seule correspondance, sans parcours caractère par caractère
+    ni concaténation.
+
+    Produit exactement les mêmes tokens (valeurs et positions) que Lexer. Seule
+    différence : une barre oblique inverse en toute fin de source, dans une chaîne,
+    lève une LexicalError (Lexer échoue alors sur une TypeError).
+    Les attributs de position (line, column...) sont mis à jour à la fin de l'analyse
+    ou lors d'une erreur, et non après chaque token.
+    """
+
+    def __init__(self, source: str):
+        super().__init__(source)
+        self._tokens = None
+
+    def get_next_token(self) -> Token:
+        """Retourne le prochain token"""
+        if self._tokens is None:
+            self._tokens = self._scan(collapse_newlines=False)
+        return next(self._tokens)
+
+    def iter_tokens(self) -> Iterator[Token]:
+        """
+        Générateur des tokens, produits à la demande jusqu'à EOF (inclus).
+        Les nouvelles lignes multiples sont fusionnées comme dans tokenize.
+        """
+        if self._tokens is not None:
+            # Analyse déjà commencée par get_next_token
+            return super().iter_tokens()
+        self._tokens = self._scan(collapse_newlines=True)
+        return self._tokens
+
+    def _scan(self, collapse_newlines: bool):
+        """
+        Générateur des tokens jusqu'à EOF. Si `collapse_newlines` est vrai, les nouvelles lignes
+        consécutives sont fusionnées et le générateur s'arrête après EOF ; sinon EOF est
+        renvoyé indéfiniment, comme par Lexer.get_next_token.
+        """
+        source = self.source
+        length = len(source)
+        keywords = self.keywords
+        identifier, newline, comment = TokenType.IDENTIFIER, TokenType.NEWLINE, TokenType.COMMENT
+        position = self.position
+        line = self.line
+        line_start = position - self.column + 1  # position du début de la ligne courante
+        newline_end = -1  # fin de la dernière nouvelle ligne produite, si elle doit être fusionnée
+
+        while True:
+            # Les correspondances sont enchaînées par finditer ; un écart entre deux
+            # correspondances signale un caractère qu'aucune alternative ne reconnaît
+            for match in MASTER_PATTERN.finditer(source, position):
+                if match.start() != position:
+                    while source[position] in ' \t\r':
+                        position += 1
+                    self._sync(position, line, line_start)
+                    raise LexicalError(f"Caractère inattendu '{source[position]}'", line, self.column)
+
+                kind = match.lastgroup
+                start = match.start(kind)
+                position = match.end()
+                column = start - line_start + 1
+
+                if kind == "IDENTIFIER":
+                    text = match.group(kind)
+                    if text[0].isalpha() or text[0] == '_':
+                        yield Token(keywords.get(text, identifier), text, line, column)
+                    elif text[0].isdigit():
+                        break
+                    else:
+                        self._sync(start, line, line_start)
+                        raise LexicalError(f"Caractère inattendu '{text[0]}'", line, column)
+
+                elif kind == "OPERATOR":
+                    text = match.group(kind)
+                    yield Token(OPERATORS[text], text, line, column)
+
+                elif kind == "NUMBER":
+                    if position < length and source[position].isdigit():
+                        break
+                    text = match.group(kind)
+                    token_type = TokenType.FLOAT if '.' in text else TokenType.INTEGER
+                    yield Token(token_type, text.replace('_', ''), line, column)
+
+                elif kind == "NEWLINE":
+                    if match.start() != newline_end:
+                        yield Token(newline, '\\n', line, column, _actual_value='\n')
+                    if collapse_newlines:
+                        newline_end = position
+                    line, line_start = line + 1, position
+
+                elif kind == "STRING":
+                    text = match.group(kind)
+                    quote = text[0]
+                    terminated = len(text) > 1 and text[-1] == quote and not _is_escaped(text)
+                    if not terminated and position < length:
+                        self._sync(position, line, line_start)
+                        raise LexicalError("Chaîne non terminée", line, column)
+                    value = ESCAPE_PATTERN.sub(_unescape, text[1:-1] if terminated else text[1:])
+                    yield Token(TokenType.STRING, value, line, column, _actual_value=f"{quote}{value}{quote}")
+                    newlines = text.count('\n')
+                    if newlines:
+                        line, line_start = line + newlines, start + text.rindex('\n') + 1
+                    if not terminated:
+                        line_start -= 1  # comme Lexer, qui avance d'un caractère au-delà de la fin de la source
+
+                elif kind == "LINE_COMMENT":
+                    text = match.group(kind)[2:]
+                    yield Token(comment, text.strip(), line, column, _actual_value=f"//{text}")
+
+                elif kind == "BLOCK_COMMENT":
+                    text = match.group(kind)[2:-2]
+                    yield Token(comment, text.strip(), line, column, _actual_value=f"/*{text}*/")
+                    newlines = text.count('\n')
+                    if newlines:
+                        line, line_start = line + newlines, start + 2 + text.rindex('\n') + 1
+
+                elif kind == "UNTERMINATED_COMMENT":
+                    self._sync(start, line, line_start)
+                    raise LexicalError(UNTERMINATED_COMMENT, line, column)
+
+                else:  # END
+                    self._sync(position, line, line_start)
+                    yield Token(TokenType.EOF, '', self.line, self.column)
+                    while not collapse_newlines:
+                        yield Token(TokenType.EOF, '', self.line, self.column)
+                    return
+
+            # Nombre contenant un chiffre non décimal (exposant...), accepté par str.isdigit :
+            # lu caractère par caractère par Lexer.read_number, puis reprise de l'expression
+            self._sync(start, line, line_start)
+            yield self.read_number()
+            position = self.position
+
+    def _sync(self, position: int, line: int, line_start: int):
+        """Reporte la position de lecture sur les attributs du lexer"""
+        self.position = position
+        self.line = line
+        self.column = position - line_start + 1
+        self.current_char = self.source[position] if position < len(self.source) else None
@@ -0,0 +1,108 @@
+from typing import Iterable, Iterator, List, Optional, Tuple, Type
+from .tokens import Token, TokenType
+from .core import Lexer, LexicalError, UNTERMINATED_COMMENT
+
+
+class StreamLexer:
+    """
+    Analyse lexicale d'un source lu ligne par ligne (fichier, entrée standard...).
+
+    Chaque ligne est tokenisée dès sa lecture, avec les numéros de ligne du source
+    complet. Quand une ligne laisse une chaîne ou un commentaire bloc ouvert, les tokens
+    qui le précèdent sont produits et seul le littéral ouvert est conservé : il n'est
+    retokenisé que lorsqu'une ligne suivante contient de quoi le fermer (guillemet ou `*/`).
+    Produit les mêmes tokens que le lexer sur le source complet.
+    """
+
+    def __init__(self, lines: Iterable[str], lexer: Type[Lexer] = Lexer):
+        self.lines = iter(lines)
+        self.lexer = lexer
+        self.line = 1    # numéro de la première ligne non encore tokenisée
+        self.column = 1  # colonne du premier caractère non encore tokenisé dans cette ligne
+
+    def iter_tokens(self) -> Iterator[Token]:
+        """Générateur des tokens jusqu'à EOF (inclus), les nouvelles lignes multiples étant fusionnées"""
+        pending = ''   # source lu mais pas encore tokenisé
+        closer = None  # texte qui peut fermer le littéral ouvert au début de `pending`
+        previous = None
+
+        for text in self.lines:
+            pending += text
+            if not pending.endswith('\n'):
+                continue  # dernière ligne sans retour à la ligne : tokenisée avec EOF
+            if closer is not None and closer not in text:
+                continue  # le littéral reste ouvert : inutile de le retokeniser
+            tokens, literal = self._tokenize(pending, final=False)
+            for token in tokens:
+                if token.type != TokenType.NEWLINE or previous != TokenType.NEWLINE:
+                    yield token
+                    previous = token.type
+            if literal is None:
+                self.line += pending.count('\n')
+                self.column = 1
+                pending, closer = '', None
+            else:
+                index, closer = literal
+                self._advance(pending[:index])
+                pending = pending[index:]
+
+        tokens, _ = self._tokenize(pending, final=True)
+        for token in tokens:
+            if token.type != TokenType.NEWLINE or previous != TokenType.NEWLINE:
+                yield token
+                previous = token.type
+
+    def _advance(self, consumed: str):
+        """Met à jour la position de début du source restant après `consumed`"""
+        newlines = consumed.count('\n')
+        if newlines:
+            self.line += newlines
+            self.column = len(consumed) - consumed.rindex('\n')
+        else:
+            self.column += len(consumed)
+
+    def _tokenize(self, source: str, final: bool) -> Tuple[List[Token], Optional[Tuple[int, str]]]:
+        """
+        Tokens de `source` (sans EOF sauf si `final`), repositionnés à partir de la position courante.
+        Si le source s'arrête dans une chaîne ou un commentaire bloc (jamais quand `final`), retourne
+        aussi l'index de début de ce littéral dans `source` et le texte qui peut le fermer : les
+        tokens retournés sont alors ceux qui le précèdent.
+        """
+        literal = None
+        try:
+            tokens = self.lexer(source).tokenize()
+        except LexicalError as e:
+            if final or e.message != UNTERMINATED_COMMENT:
+                line, column = self._position(e.line, e.column)
+                raise LexicalError(e.message, line, column) from None
+            # Tokens précédant le commentaire : le source tronqué se termine entre deux tokens
+            index = _index(source, e.line, e.column)
+            tokens = self.lexer(source[:index]).tokenize()
+            literal = (index, '*/')
+
+        eof = tokens.pop()
+        if literal is None and not final and tokens and tokens[-1].type == TokenType.STRING and source.endswith('\n'):
+            # Une chaîne fermée serait suivie du token NEWLINE de la fin de ligne
+            string = tokens.pop()
+            index = _index(source, string.line, string.column)
+            literal = (index, source[index])
+
+        if final:
+            tokens.append(eof)
+        for token in tokens:
+            token.line, token.column = self._position(token.line, token.column)
+        return tokens, literal
+
+    def _position(self, line: int, column: int) -> Tuple[int, int]:
+        """Position dans le source complet d'une position relative au source restant"""
+        if line == 1:
+            column += self.column - 1
+        return line + self.line - 1, column
+
+
+def _index(source: str, line: int, column: int) -> int:
+    """Index dans `source` de la position (ligne, colonne)"""
+    start = 0
+    for _ in range(line - 1):
+        start = source.index('\n', start) + 1
+    return start + column - 1
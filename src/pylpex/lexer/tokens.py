@@ -69,7 +69,7 @@ class TokenType(Enum):
     def __repr__(self):
         return f"<{self.__class__.__name__}.{self.value}>"
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     type: TokenType
     value: str
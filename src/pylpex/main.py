@@ -40,7 +40,39 @@ def banner():
 # -----------------------------------------------------
 # Boucle principale (REPL)
 
+def run_file(path: str):
+    """Exécute un fichier source (son AST compilé est conservé dans un .pylc)."""
+    interpreter = Interpreter()
+    try:
+        interpreter.evaluate_file(path)
+    except Exception as e:
+        print(red(f"Erreur: {e}"))
+        sys.exit(1)
+
+
+def run_stream(stream):
+    """Exécute un source instruction par instruction, au fil de sa lecture (ex. entrée standard)."""
+    interpreter = Interpreter()
+    try:
+        interpreter.evaluate_stream(stream)
+    except Exception as e:
+        print(red(f"Erreur: {e}"))
+        sys.exit(1)
+
+
 def main():
+    if len(sys.argv) > 1:
+        if sys.argv[1] == "-":
+            run_stream(sys.stdin)
+        else:
+            run_file(sys.argv[1])
+        return
+
+    if not sys.stdin.isatty():
+        # Source redirigé (pipe, fichier) : exécution en flux
+        run_stream(sys.stdin)
+        return
+
     interpreter = Interpreter()
     banner()
 
@@ -0,0 +1,6 @@
+from .core import Optimizer, count_nodes
+
+__all__ = [
+    "Optimizer",
+    "count_nodes",
+]
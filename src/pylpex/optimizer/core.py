@@ -0,0 +1,224 @@
+import copy
+from dataclasses import fields
+from typing import Any, Dict, List, Optional, Tuple, Type
+from pylpex.parser.ASTNodes import *
+from pylpex.evaluator.operators import BINARY_OPERATIONS, UNARY_OPERATIONS
+
+LITERAL_NODES = (NumberNode, StringNode, BooleanNode, NoneNode)
+
+# Champs contenant une suite d'instructions
+BLOCK_FIELDS = {"statements", "body", "then_block", "else_block"}
+
+# Taille maximale (en bits pour les entiers, en caractères pour les chaînes) d'un résultat replié :
+# au-delà, le calcul est laissé à l'exécution pour ne pas alourdir l'AST
+MAX_FOLDED_SIZE = 4096
+
+
+_CHILD_FIELDS: Dict[Type[ASTNode], Tuple[str, ...]] = {}
+
+
+def child_fields(cls: Type[ASTNode]) -> Tuple[str, ...]:
+    """
+    Champs d'une classe de nœud pouvant contenir des sous-nœuds, calculés une fois par classe
+    (fields() est coûteux). Les champs privés (position, annotations du Resolver) sont exclus.
+    """
+    names = _CHILD_FIELDS.get(cls)
+    if names is None:
+        names = _CHILD_FIELDS[cls] = tuple(f.name for f in fields(cls) if not f.name.startswith("_"))
+    return names
+
+
+def count_nodes(node: Any) -> int:
+    """Nombre de nœuds d'un AST (ou d'une liste de nœuds)"""
+    if isinstance(node, (list, tuple)):
+        return sum(count_nodes(item) for item in node)
+    if not isinstance(node, ASTNode):
+        return 0
+    return 1 + sum(count_nodes(getattr(node, name)) for name in child_fields(type(node)))
+
+
+def literal_value(node: ASTNode) -> Any:
+    return None if isinstance(node, NoneNode) else node.value
+
+
+def make_literal(value: Any, position: Optional[tuple[int, int]]) -> Optional[ASTNode]:
+    """Nœud littéral représentant `value`, ou None si la valeur n'a pas de forme littérale"""
+    if value is None:
+        return NoneNode(position=position)
+    if isinstance(value, bool):
+        return BooleanNode(value, position=position)
+    if isinstance(value, int):
+        if value.bit_length() > MAX_FOLDED_SIZE:
+            return None
+        return NumberNode(value, NumberType.INTEGER, position=position)
+    if isinstance(value, float):
+        return NumberNode(value, NumberType.FLOAT, position=position)
+    if isinstance(value, str):
+        if len(value) > MAX_FOLDED_SIZE:
+            return None
+        return StringNode(value, position=position)
+    return None
+
+
+def _is_cheap(operator: BinaryOperatorType, left: Any, right: Any) -> bool:
+    """Évite de calculer à l'optimisation des résultats démesurés (ex. 9 ** 9 ** 9 dans une branche morte)"""
+    if operator == BinaryOperatorType.POWER and isinstance(left, int) and isinstance(right, int):
+        return right <= 0 or abs(left) <= 1 or right * left.bit_length() <= MAX_FOLDED_SIZE
+    if operator == BinaryOperatorType.MUL:
+        for text, count in ((left, right), (right, left)):
+            if isinstance(text, str) and isinstance(count, int):
+                return len(text) * count <= MAX_FOLDED_SIZE
+    return True
+
+
+class Optimizer:
+    """
+    Passe d'optimisation de l'AST, exécutée entre le parsing et l'évaluation.
+
+    - repli des constantes : BinaryOpNode, UnaryOpNode et TernaryNode dont les opérandes sont littéraux
+    - élagage des IfNode dont la condition est littérale
+    - suppression des CommentNode
+
+    Une opération qui échoue (division par zéro, types incompatibles...) n'est pas repliée :
+    l'erreur reste levée à l'exécution, à la même position.
+
+    L'AST d'origine n'est pas modifié : les nœuds réécrits et leurs ancêtres sont copiés,
+    les sous-arbres inchangés sont partagés avec le résultat.
+
+    Une chaîne repliée plus longue que `max_string_size` ne l'est pas : l'opération reste
+    exécutée, donc soumise à la limite de taille des collections (cf. ExecutionLimits).
+    """
+
+    def __init__(self, max_string_size: Optional[int] = None):
+        self.max_string_size = max_string_size
+        self.nodes_removed = 0          # nœuds supprimés lors du dernier appel à optimize
+        self.total_nodes_removed = 0    # cumul depuis la création
+
+    def optimize(self, node: ASTNode) -> ASTNode:
+        """Retourne l'AST optimisé (le nombre de nœuds supprimés est compté pendant la réécriture)"""
+        self.nodes_removed = 0
+        node = self._optimize(node)
+        self.total_nodes_removed += self.nodes_removed
+        return node
+
+    def _optimize(self, node: ASTNode) -> ASTNode:
+        changes = None
+        for name in child_fields(type(node)):
+            value = getattr(node, name)
+            if isinstance(value, ASTNode):
+                new_value = self._optimize(value)
+            elif isinstance(value, list):
+                if name in BLOCK_FIELDS:
+                    new_value = self._optimize_block(value)
+                else:
+                    new_value = self._optimize_items(value)
+            else:
+                continue
+            if new_value is not value:
+                if changes is None:
+                    changes = {}
+                changes[name] = new_value
+
+        if changes:
+            node = copy.copy(node)
+            for name, value in changes.items():
+                setattr(node, name, value)
+            if isinstance(node, ProgramNode):
+                node._resolved = False  # les nœuds réécrits ne sont pas annotés
+
+        method = getattr(self, f"_optimize_{type(node).__name__}", None)
+        if method is None:
+            return node
+        result = method(node)
+        if result is not node:
+            self.nodes_removed += count_nodes(node) - count_nodes(result)
+        return result
+
+    def _optimize_items(self, items: list) -> list:
+        """Liste optimisée, ou la liste elle-même si aucun élément n'a changé"""
+        result = [self._optimize_item(item) for item in items]
+        if all(new is old for new, old in zip(result, items)):
+            return items
+        return result
+
+    def _optimize_item(self, item: Any) -> Any:
+        if isinstance(item, ASTNode):
+            return self._optimize(item)
+        if isinstance(item, tuple):
+            result = tuple(self._optimize_item(element) for element in item)
+            return item if all(new is old for new, old in zip(result, item)) else result
+        return item
+
+    def _optimize_block(self, statements: List[ASTNode]) -> List[ASTNode]:
+        """Bloc optimisé, ou le bloc lui-même s'il n'a pas changé"""
+        result = []
+        changed = False
+        last = len(statements) - 1
+        for i, statement in enumerate(statements):
+            if isinstance(statement, CommentNode):
+                self.nodes_removed += 1
+                changed = True
+                continue
+            optimized = self._optimize(statement)
+            changed = changed or optimized is not statement
+            if isinstance(optimized, IfNode) and isinstance(optimized.condition, LITERAL_NODES):
+                # Les blocs ne créent pas de portée : la branche retenue est insérée telle quelle
+                changed = True
+                kept, dropped = optimized.then_block, optimized.else_block
+                if not literal_value(optimized.condition):
+                    kept, dropped = dropped, kept
+                self.nodes_removed += 2 + count_nodes(dropped)  # le if, sa condition et la branche écartée
+                if kept:
+                    result.extend(kept)
+                elif i == last:
+                    # Le if vaut None en dernière position (valeur du bloc)
+                    result.append(NoneNode(position=optimized.position))
+                    self.nodes_removed -= 1
+                continue
+            result.append(optimized)
+        return result if changed else statements
+
+    # -------------------------------
+    # Repli des constantes
+
+    def _optimize_BinaryOpNode(self, node: BinaryOpNode) -> ASTNode:
+        left, right, operator = node.left, node.right, node.operator
+
+        if operator in (BinaryOperatorType.AND, BinaryOperatorType.OR) and isinstance(left, LITERAL_NODES):
+            # Court-circuit : le résultat est l'opérande gauche ou l'opérande droit tel quel
+            if operator == BinaryOperatorType.AND:
+                return right if literal_value(left) else left
+            return left if literal_value(left) else right
+
+        if not (isinstance(left, LITERAL_NODES) and isinstance(right, LITERAL_NODES)):
+            return node
+
+        left_value, right_value = literal_value(left), literal_value(right)
+        if not _is_cheap(operator, left_value, right_value):
+            return node
+        try:
+            if operator == BinaryOperatorType.DIV:
+                if right_value == 0:
+                    return node
+                result = left_value / right_value
+            else:
+                result = BINARY_OPERATIONS[operator](left_value, right_value)
+        except Exception:
+            return node
+        if self.max_string_size is not None and isinstance(result, str) and len(result) > self.max_string_size:
+            return node
+        return make_literal(result, node.position) or node
+
+    def _optimize_UnaryOpNode(self, node: UnaryOpNode) -> ASTNode:
+        if not isinstance(node.operand, LITERAL_NODES):
+            return node
+        try:
+            result = UNARY_OPERATIONS[node.operator](literal_value(node.operand))
+        except Exception:
+            return node
+        return make_literal(result, node.position) or node
+
+    def _optimize_TernaryNode(self, node: TernaryNode) -> ASTNode:
+        if not isinstance(node.condition, LITERAL_NODES):
+            return node
+        return node.true_expr if literal_value(node.condition) else node.false_expr
@@ -1,7 +1,7 @@
 
 from typing import List, Optional, Union, Any
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, InitVar
 from abc import ABC, abstractmethod
 from pylpex.lexer import Token
 from pylpex.typesystem import TypeInfo
@@ -9,25 +9,63 @@ from pylpex.typesystem import TypeInfo
 # -----------------------------------------------------
 # Abstract base class
 
-@dataclass
+# Les positions (ligne, colonne) sont stockées sous forme d'un seul entier
+NO_POSITION = -1
+COLUMN_BITS = 32
+
+def pack_position(position: Optional[tuple[int, int]]) -> int:
+    if position is None:
+        return NO_POSITION
+    line, column = position
+    return (line << COLUMN_BITS) | column
+
+def unpack_position(packed: int) -> Optional[tuple[int, int]]:
+    if packed == NO_POSITION:
+        return None
+    return (packed >> COLUMN_BITS, packed & ((1 << COLUMN_BITS) - 1))
+
+
+@dataclass(slots=True, repr=False)
 class ASTNode(ABC):
-    """Classe de base pour tous les nœuds de l'arbre syntaxique"""
-    position: Optional[tuple[int, int]] = field(default=None, kw_only=True)  # (line, column)
+    """
+    Classe de base pour tous les nœuds de l'arbre syntaxique.
+    Les nœuds n'ont pas de __dict__ (slots) et la position est compactée en un entier :
+    `position` reste accessible comme un couple (line, column).
+    """
+    position: InitVar[Optional[tuple[int, int]]] = field(default=None, kw_only=True)  # (line, column)
+    _position: int = field(init=False, default=NO_POSITION, repr=False)
+
+    def __post_init__(self, position: Optional[tuple[int, int]]):
+        self._position = pack_position(position)
     
     @classmethod
     def from_token(cls, token: Token, **kwargs):
         """Factory method pour créer un node avec position du token"""
         return cls(**kwargs, position=(token.line, token.column))
+
+    def _get_position(self) -> Optional[tuple[int, int]]:
+        return unpack_position(self._position)
+
+    def _set_position(self, position: Optional[tuple[int, int]]):
+        self._position = pack_position(position)
     
     @property
     def line(self) -> Optional[int]:
         """Ligne de la position du node"""
-        return self.position[0] if self.position else None
+        return self._position >> COLUMN_BITS if self._position != NO_POSITION else None
     
     @property
     def column(self) -> Optional[int]:
         """Colonne de la position du node"""
-        return self.position[1] if self.position else None
+        return self._position & ((1 << COLUMN_BITS) - 1) if self._position != NO_POSITION else None
+
+    def __repr__(self):
+        values = [f"position={self.position!r}"]
+        values += [f"{f.name}={getattr(self, f.name)!r}" for f in fields(self) if f.repr]
+        return f"{type(self).__name__}({', '.join(values)})"
+
+# Remplace la valeur par défaut de l'InitVar (posée par dataclass) par l'accès à la position compactée
+ASTNode.position = property(ASTNode._get_position, ASTNode._set_position)
 
 
 class TypeEnum(Enum):
@@ -40,13 +78,14 @@ class TypeEnum(Enum):
 # Program structure
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class ProgramNode(ASTNode):
     """Nœud racine du programme"""
     statements: List[ASTNode]
+    _resolved: bool = field(default=False, repr=False, compare=False) # déjà annoté par le Resolver
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class CommentNode(ASTNode):
     """Nœud pour les commentaires (optionnel, peut être ignoré)"""
     text: str
@@ -55,7 +94,7 @@ class CommentNode(ASTNode):
 # Data types
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class NoneNode(ASTNode):
     """Nœud pour la valeur None"""
 
@@ -64,32 +103,32 @@ class NumberType(TypeEnum):
     INTEGER = "integer"
     FLOAT = "float"
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class NumberNode(ASTNode):
     """Nœud pour les nombres (entiers, flottants, complexes)"""
     value: Union[int, float]
     type: NumberType
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class StringNode(ASTNode):
     """Nœud pour les chaînes de caractères"""
     value: str
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class BooleanNode(ASTNode):
     """Nœud pour les booléens"""
     value: bool
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class ListNode(ASTNode):
     """Nœud pour les listes"""
     elements: List[ASTNode]
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class DictionaryNode(ASTNode):
     """Nœud pour les dictionnaires"""
     pairs: List[tuple[ASTNode, ASTNode]]  # [(key, value), ...]
@@ -99,11 +138,12 @@ class DictionaryNode(ASTNode):
 # Identifiers
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class IdentifierNode(ASTNode):
     """Nœud pour les identifiants (variables)"""
     name: str
     _type_annotation: Optional[TypeInfo] = None # for type inference
+    _slot: Optional[tuple[int, Optional[int]]] = field(default=None, repr=False, compare=False) # (depth, slot), cf. Resolver
 
     def get_type(self) -> Optional[TypeInfo]:
         return self._type_annotation
@@ -118,7 +158,7 @@ class AssignmentOperatorType(TypeEnum):
     POWER = "**="
     MOD = "%="
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class AssignmentNode(ASTNode):
     """Nœud pour les assignations (=, +=, -=, etc.)"""
     target: ASTNode  # nom de la variable
@@ -154,7 +194,7 @@ class UnaryOperatorType(TypeEnum):
     NEGATIVE = "-"
     NOT = "not"
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class TernaryNode(ASTNode):
     """Nœud pour les opérations conditionnelles (a if cond else b)"""
     condition: ASTNode
@@ -162,7 +202,7 @@ class TernaryNode(ASTNode):
     false_expr: ASTNode
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class BinaryOpNode(ASTNode):
     """Nœud pour les opérations binaires (+, -, *, /, etc.)"""
     left: ASTNode
@@ -170,7 +210,7 @@ class BinaryOpNode(ASTNode):
     right: ASTNode
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class UnaryOpNode(ASTNode):
     """Nœud pour les opérations unaires (-, +, not)"""
     operator: UnaryOperatorType
@@ -179,27 +219,28 @@ class UnaryOpNode(ASTNode):
 # -----------------------------------------------------
 # Expressions
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class ArgumentNode(ASTNode):
     """Argument d'appel de fonction (positionnel ou nommé)"""
     name: Optional[str]  # None pour les positionnels
     value: ASTNode 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class CallNode(ASTNode):
     """Nœud pour les appels de fonction ( f(a, b) )"""
     function: Union[str, ASTNode] # support pour "obj.foo()"
     arguments: List[ArgumentNode]
+    _slot: Optional[tuple[int, Optional[int]]] = field(default=None, repr=False, compare=False) # si function est un nom
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class IndexNode(ASTNode):
     """Nœud pour l'indexation (tableaux, chaînes A[i])"""
     collection: ASTNode
     index: ASTNode
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class AttributeNode(ASTNode):
     """Nœud pour l'accès aux attributs (obj.attr)"""
     object: ASTNode
@@ -209,14 +250,14 @@ class AttributeNode(ASTNode):
 # -----------------------------------------------------
 # Statements
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class ParameterNode(ASTNode):
     """Paramètre de fonction, possiblement avec valeur par défaut"""
     name: str
     default_value: Optional[ASTNode] = None
     type_annotation: Optional[TypeInfo] = None
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class FunctionDefNode(ASTNode):
     """Nœud pour les définitions de fonctions"""
     name: str
@@ -224,14 +265,17 @@ class FunctionDefNode(ASTNode):
     body: List[ASTNode]
     return_type: Optional[TypeInfo] = None
     type_annotation: Optional[TypeInfo] = None
+    _slot: Optional[tuple[int, Optional[int]]] = field(default=None, repr=False, compare=False) # nom de la fonction
+    _locals: Optional[List[str]] = field(default=None, repr=False, compare=False) # noms locaux, indexés par slot
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class ReturnNode(ASTNode):
     """Nœud pour les retours de fonction"""
     value: Optional[ASTNode]
+    _tail_call: bool = field(default=False, repr=False, compare=False) # return f(...) dans le corps de f, cf. Resolver
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class IfNode(ASTNode):
     """Nœud pour les conditions if/else"""
     condition: ASTNode
@@ -239,26 +283,27 @@ class IfNode(ASTNode):
     else_block: Optional[List[ASTNode]]
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class WhileNode(ASTNode):
     """Nœud pour les boucles while"""
     condition: ASTNode
     body: List[ASTNode]
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class ForNode(ASTNode):
     """Nœud pour les boucles for"""
     variable: str
     iterable: ASTNode
     body: List[ASTNode]
+    _slot: Optional[tuple[int, Optional[int]]] = field(default=None, repr=False, compare=False) # variable de boucle
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class BreakNode(ASTNode):
     """Nœud pour l'instruction break"""
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class ContinueNode(ASTNode):
     """Nœud pour l'instruction continue"""
\ No newline at end of file
@@ -1,7 +1,8 @@
 # base.py
 from pylpex.lexer import TokenType, Token
 from .ASTNodes import *
-from typing import List, Optional
+from collections import deque
+from typing import Iterable, List, Optional
 
 class SyntaxicalError(Exception):
     """Erreur de syntaxe détectée pendant l'analyse syntaxique"""
@@ -60,26 +61,44 @@ class BaseParser:
         TokenType.NOT: UnaryOperatorType.NOT,
     }
 
-    def __init__(self, tokens: List[Token]):
+    # Nombre maximal de tokens consultables au-delà du token courant (cf. peek)
+    LOOKAHEAD = 2
+
+    def __init__(self, tokens: Iterable[Token]):
+        """
+        Args:
+            tokens: Liste de tokens, ou flux de tokens (ex. Lexer.iter_tokens) consommé
+                    au fil du parsing : seuls les tokens de l'anticipation sont conservés
+        """
         self.tokens = tokens
+        self._stream = iter(tokens)
+        self._lookahead: deque[Token] = deque()  # tokens lus au-delà du token courant
         self.position = 0
-        self.current_token = tokens[0] if tokens else None
+        self.current_token = next(self._stream, None)
         self.loop_depth = 0 # loop context (for break/continue)
 
 
     def advance(self):
         """Avance au token suivant"""
         self.position += 1
-        if self.position < len(self.tokens):
-            self.current_token = self.tokens[self.position]
+        if self._lookahead:
+            self.current_token = self._lookahead.popleft()
         else:
-            self.current_token = None
+            self.current_token = next(self._stream, None)
 
 
     def peek(self, offset: int = 1) -> Optional[Token]:
-        """Regarde le token à une position future"""
-        peek_position = self.position + offset
-        return self.tokens[peek_position] if peek_position < len(self.tokens) else None
+        """Regarde le token à une position future (au plus LOOKAHEAD tokens plus loin)"""
+        if offset == 0:
+            return self.current_token
+        if offset > self.LOOKAHEAD:
+            raise ValueError(f"Anticipation limitée à {self.LOOKAHEAD} tokens, demandé {offset}")
+        while len(self._lookahead) < offset:
+            token = next(self._stream, None)
+            if token is None:
+                return None
+            self._lookahead.append(token)
+        return self._lookahead[offset - 1]
     
 
     def expect(self, token_type) -> Token:
@@ -1,5 +1,6 @@
+from typing import Iterator
 from pylpex.lexer import TokenType
-from .ASTNodes import ProgramNode
+from .ASTNodes import ProgramNode, ASTNode
 from .expressions import ExpressionParser
 from .statements import StatementParser
 from .functions import FunctionParser
@@ -10,22 +11,23 @@ class Parser(ExpressionParser, StatementParser, FunctionParser, StructureParser)
     
     def parse(self) -> ProgramNode:
         """Point d'entrée: parse tout le programme"""
-        statements = []
         token = self.current_token
-        
+        statements = list(self.iter_statements())
+        return ProgramNode.from_token(token=token, statements=statements)
+
+    def iter_statements(self) -> Iterator[ASTNode]:
+        """
+        Générateur des instructions de premier niveau, chacune produite dès qu'elle est
+        parsée (avant de lire les tokens qui la suivent).
+        """
         self.skip_whitespace_and_comments()
         
         while self.current_token and self.current_token.type != TokenType.EOF:
-            self.skip_whitespace_and_comments()
-            
-            if self.current_token and self.current_token.type != TokenType.EOF:
-                stmt = self.parse_statement()
-                if stmt:
-                    statements.append(stmt)
+            stmt = self.parse_statement()
+            if stmt:
+                yield stmt
             
             self.skip_whitespace_and_comments()
-        
-        return ProgramNode.from_token(token=token, statements=statements)
     
     # -----------------------------------------------------
     # Helper methods
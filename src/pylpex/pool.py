@@ -0,0 +1,117 @@
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+from .interpreter import Interpreter
+
+
+class InterpreterPool:
+    """
+    Réserve d'interpréteurs prêts à l'emploi, pour exécuter de nombreux programmes
+    indépendants (éventuellement depuis plusieurs threads) sans payer la création
+    d'un Interpreter à chaque fois.
+
+    Les `size` interpréteurs sont créés d'avance et exécutent le `prelude` éventuel.
+    Un interpréteur emprunté est rendu réinitialisé : son environnement est recréé et le
+    prelude réexécuté (sans reparsing, grâce au cache de l'interpréteur), de sorte qu'aucun
+    état ne passe d'un programme à l'autre. Un interpréteur rendu après une erreur est
+    remplacé par un neuf. Le nombre d'interpréteurs, donc la mémoire, reste borné :
+    quand tous sont empruntés, `acquire` attend qu'un interpréteur soit rendu.
+
+        pool = InterpreterPool(4, prelude="def double(x) { return 2 * x }")
+        with pool.interpreter() as interpreter:
+            interpreter.evaluate("double(21)")  # 42
+    """
+
+    def __init__(self, size: int = 4, prelude: Optional[str] = None, **options):
+        """
+        Args:
+            size: Nombre d'interpréteurs de la réserve
+            prelude: Code exécuté par chaque interpréteur avant d'être prêté (définitions communes)
+            options: Arguments transmis à Interpreter (engine, optimize, lexer...)
+        """
+        if size < 1:
+            raise ValueError(f"La taille de la réserve doit être positive, pas {size}")
+        self.size = size
+        self.prelude = prelude
+        self.options = options
+        self._available: "queue.LifoQueue[Interpreter]" = queue.LifoQueue()
+        self._in_use = set()
+        self._lock = threading.Lock()
+        for _ in range(size):
+            self._available.put(self._create())
+
+    def _create(self) -> Interpreter:
+        """Nouvel interpréteur, prelude exécuté"""
+        interpreter = Interpreter(**self.options)
+        self._run_prelude(interpreter)
+        return interpreter
+
+    def _run_prelude(self, interpreter: Interpreter):
+        if self.prelude is not None:
+            interpreter.evaluate(self.prelude)
+
+    @property
+    def available(self) -> int:
+        """Nombre d'interpréteurs disponibles"""
+        return self._available.qsize()
+
+    def acquire(self, timeout: Optional[float] = None) -> Interpreter:
+        """
+        Emprunte un interpréteur (à rendre avec `release`).
+
+        Args:
+            timeout: Attente maximale en secondes si aucun interpréteur n'est disponible
+                     (None pour attendre indéfiniment)
+        """
+        try:
+            interpreter = self._available.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"Aucun interpréteur disponible après {timeout} s") from None
+        with self._lock:
+            self._in_use.add(interpreter)
+        return interpreter
+
+    def release(self, interpreter: Interpreter, discard: bool = False):
+        """
+        Rend un interpréteur emprunté, après l'avoir réinitialisé.
+
+        Args:
+            interpreter: Interpréteur obtenu par `acquire`
+            discard: Si True, l'interpréteur est abandonné et remplacé par un neuf
+        """
+        with self._lock:
+            if interpreter not in self._in_use:
+                raise ValueError("Cet interpréteur n'a pas été emprunté à cette réserve")
+            self._in_use.remove(interpreter)
+        try:
+            if not discard:
+                try:
+                    interpreter.reset()
+                    self._run_prelude(interpreter)
+                except Exception:
+                    discard = True
+            if discard:
+                interpreter = self._create()
+        finally:
+            # La place est toujours rendue, pour ne pas bloquer les prochains `acquire`
+            self._available.put(interpreter)
+
+    @contextmanager
+    def interpreter(self, timeout: Optional[float] = None) -> Iterator[Interpreter]:
+        """Emprunte un interpréteur le temps d'un bloc `with` (remplacé si une erreur en sort)"""
+        interpreter = self.acquire(timeout)
+        try:
+            yield interpreter
+        except BaseException:
+            self.release(interpreter, discard=True)
+            raise
+        self.release(interpreter)
+
+    def evaluate(self, code: str, timeout: Optional[float] = None) -> Any:
+        """Évalue un code avec un interpréteur emprunté le temps de l'exécution"""
+        with self.interpreter(timeout) as interpreter:
+            return interpreter.evaluate(code)
+
+    def __repr__(self) -> str:
+        return f"InterpreterPool(size={self.size}, available={self.available})"
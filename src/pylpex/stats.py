@@ -0,0 +1,131 @@
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Optional
+from .evaluator import Evaluator
+from .evaluator.visitor import ASTVisitor
+
+# Phases mesurées, dans l'ordre d'exécution
+PHASES = ("tokenize", "parse", "optimize", "evaluate")
+
+
+class InterpreterStats:
+    """
+    Statistiques d'exécution d'un Interpreter créé avec `stats=True` : temps passé dans
+    chaque phase, nombre de tokens produits, de nœuds d'AST construits et de nœuds visités
+    par l'évaluateur, pour le dernier appel (`last`), les `history` derniers appels
+    (`calls`) et en cumul depuis la création (ou `reset`).
+
+    Quand les statistiques sont activées, le lexer produit la liste complète des tokens
+    avant le parsing (au lieu de les produire au fil du parsing) pour mesurer les deux
+    phases séparément. Un code trouvé dans le cache des AST n'est ni tokenisé ni parsé :
+    l'appel est marqué `cached` et ne compte ni tokens ni nœuds. Pour un fichier (`evaluate_file`),
+    la lecture de la source ou de son `.pylc` est mesurée comme phase "parse" et les tokens
+    ne sont pas comptés.
+    Les nœuds visités ne sont comptés que par les moteurs qui parcourent l'AST à l'exécution
+    par `visit` ("tree") ; ils valent None pour les autres moteurs.
+    """
+
+    def __init__(self, history: int = 100):
+        self.history = history
+        # Compteur des nœuds visités, jamais remis à zéro : chaque appel en mesure la différence
+        self._visited: Optional[int] = None
+        self.reset()
+
+    def reset(self):
+        """Remet les compteurs à zéro"""
+        self.calls: Deque[Dict[str, Any]] = deque(maxlen=self.history)
+        self.last: Optional[Dict[str, Any]] = None
+        self.total = self._new_record()
+        self.total.pop("cached")
+        self.total["calls"] = 0
+        self._current: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def _new_record() -> Dict[str, Any]:
+        return {**dict.fromkeys(PHASES, 0.0), "tokens": 0, "nodes": 0, "nodes_visited": None, "cached": False}
+
+    # -------------------------------
+    # Enregistrement (utilisé par Interpreter)
+
+    def instrument(self, evaluator: Any):
+        """Compte les nœuds visités par l'évaluateur, s'il évalue l'AST par `visit`"""
+        cls = type(evaluator)
+        if cls.evaluate is not Evaluator.evaluate or cls.visit is not ASTVisitor.visit:
+            self._visited = None
+            return
+        if self._visited is None:
+            self._visited = 0
+        visit = ASTVisitor.visit.__get__(evaluator)
+
+        def counting_visit(node):
+            self._visited += 1
+            return visit(node)
+        evaluator.visit = counting_visit
+
+    @contextmanager
+    def call(self) -> Iterator[Dict[str, Any]]:
+        """Enregistre un appel de l'interpréteur (evaluate, eval_ast...)"""
+        if self._current is not None:
+            # Appel imbriqué (ex. evaluate_file -> eval_ast) : compté dans l'appel englobant
+            yield self._current
+            return
+        record = self._current = self._new_record()
+        visited = self._visited
+        try:
+            yield record
+        finally:
+            self._current = None
+            if visited is not None and self._visited is not None:
+                record["nodes_visited"] = self._visited - visited
+            self._add_to_total(record)
+            self.calls.append(record)
+            self.last = record
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Chronomètre une phase (ajoutée à l'appel en cours, ou directement au cumul hors appel)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if self._current is not None:
+                self._current[name] += elapsed
+            else:
+                self.total[name] += elapsed
+
+    def count(self, name: str, value: int):
+        """Ajoute des tokens ("tokens") ou des nœuds ("nodes") à l'appel en cours"""
+        if self._current is not None:
+            self._current[name] += value
+        else:
+            self.total[name] += value
+
+    def mark_cached(self):
+        if self._current is not None:
+            self._current["cached"] = True
+
+    def _add_to_total(self, record: Dict[str, Any]):
+        total = self.total
+        total["calls"] += 1
+        for key in (*PHASES, "tokens", "nodes"):
+            total[key] += record[key]
+        if record["nodes_visited"] is not None:
+            total["nodes_visited"] = (total["nodes_visited"] or 0) + record["nodes_visited"]
+
+    # -------------------------------
+    # Consultation
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Statistiques exportables (JSON) : cumul, dernier appel et appels récents"""
+        return {
+            "total": dict(self.total),
+            "last": dict(self.last) if self.last is not None else None,
+            "calls": [dict(record) for record in self.calls],
+        }
+
+    def __repr__(self) -> str:
+        total = self.total
+        phases = ", ".join(f"{phase}={total[phase] * 1000:.2f}ms" for phase in PHASES)
+        return f"InterpreterStats(calls={total['calls']}, {phases}, tokens={total['tokens']}, nodes={total['nodes']})"
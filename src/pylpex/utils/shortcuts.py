@@ -1,18 +1,20 @@
 from typing import List, Any
-from pylpex.lexer import Lexer, Token
+from pylpex.lexer import Token, LEXERS
 from pylpex.parser import Parser, ASTNode
-from pylpex.evaluator import Evaluator
+from pylpex.interpreter import ENGINES
+from pylpex.optimizer import Optimizer
 
-def tokenize(code: str) -> List[Token]:
-    lexer = Lexer(code)
+def tokenize(code: str, lexer: str = "scanner") -> List[Token]:
+    lexer = LEXERS[lexer](code)
     return lexer.tokenize()
 
-def parse(code: str) -> ASTNode:
-    tokens = tokenize(code)
-    parser = Parser(tokens)
+def parse(code: str, lexer: str = "scanner") -> ASTNode:
+    parser = Parser(LEXERS[lexer](code).iter_tokens())
     return parser.parse()
 
-def evaluate(code: str) -> Any:
+def evaluate(code: str, engine: str = "tree", optimize: bool = False) -> Any:
     ast = parse(code)
-    evaluator = Evaluator()
+    if optimize:
+        ast = Optimizer().optimize(ast)
+    evaluator = ENGINES[engine]()
     return evaluator.evaluate(ast)
\ No newline at end of file
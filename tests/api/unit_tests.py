@@ -0,0 +1,787 @@
+"""
+Tests de l'API Python de Pylpex (options de l'Interpreter, optimiseur, outils de mesure...).
+
+Chaque cas est une fonction sans argument dont le résultat est comparé à la valeur attendue ;
+une valeur attendue "Error: message" signifie qu'une erreur contenant ce message doit être levée.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# -------------------------------
+# Moteurs compilés : la table de tests de l'évaluateur doit donner les mêmes échecs qu'avec "tree"
+
+def _table_failures(engine: str, optimize: bool) -> List[str]:
+    import contextlib
+    import io
+    from tests.evaluator.unit_tests import get_test_cases, run_tests
+    with contextlib.redirect_stdout(io.StringIO()):
+        return [expr for expr, _, _ in run_tests(get_test_cases(), engine=engine, optimize=optimize)]
+
+
+def _same_failures_as_tree(engine: str) -> List[bool]:
+    return [_table_failures(engine, optimize) == _table_failures("tree", optimize) for optimize in (False, True)]
+
+
+def engine_tail_calls():
+    from pylpex.utils import evaluate
+    code = "def f(n, acc) { if n == 0 { return acc } return f(n - 1, acc + 1) } f(100000, 0)"
+    return [evaluate(code, engine, False) for engine in ("tree", "stack", "bytecode", "profile", "trace")]
+
+
+def engine_stack_depth():
+    from pylpex.utils import evaluate
+    deep_expression = "x = " + " + ".join(["1"] * 20000)
+    deep_recursion = "def f(n) { if n == 0 { return 0 } return 1 + f(n - 1) } f(20000)"
+    return [evaluate(deep_expression, "stack", False), evaluate(deep_recursion, "stack", False)]
+
+
+def engine_closure_table():
+    return _same_failures_as_tree("closure")
+
+
+def engine_bytecode_table():
+    return _same_failures_as_tree("bytecode")
+
+
+def engine_python_table():
+    return _same_failures_as_tree("python")
+
+
+# -------------------------------
+# Optimiseur
+
+def optimizer_keeps_original():
+    from pylpex.utils import parse
+    from pylpex.optimizer import Optimizer
+    ast = parse("a = 1 + 2; if false { b = 3 } a")
+    before = repr(ast)
+    optimized = Optimizer().optimize(ast)
+    return [repr(ast) == before, optimized is ast, repr(optimized) == before]
+
+
+def optimizer_unchanged_ast():
+    from pylpex.utils import parse
+    from pylpex.optimizer import Optimizer
+    ast = parse("def f(x) { return x * 2 } f(3)")
+    return Optimizer().optimize(ast) is ast
+
+
+def optimizer_nodes_removed():
+    from pylpex.utils import parse
+    from pylpex.optimizer import Optimizer, count_nodes
+    result = []
+    for code in ["seconds = 60 * 60 * 24", "if false { a = 1 } 2", "x = 1 if true else 2", "if true { }"]:
+        ast = parse(code)
+        optimizer = Optimizer()
+        optimized = optimizer.optimize(ast)
+        assert optimizer.nodes_removed == count_nodes(ast) - count_nodes(optimized)
+        result.append(optimizer.nodes_removed)
+    return result
+
+
+def optimizer_total_nodes_removed():
+    from pylpex import Interpreter
+    interpreter = Interpreter(optimize=True)
+    interpreter.evaluate("a = 1 + 1")
+    interpreter.evaluate("b = 2 * 3 * 4")
+    return [interpreter.optimizer.nodes_removed, interpreter.optimizer.total_nodes_removed]
+
+
+def optimizer_unknown_operation_kept():
+    from pylpex.parser.ASTNodes import BinaryOpNode, BinaryOperatorType, NumberNode, NumberType, ProgramNode
+    from pylpex.optimizer import Optimizer
+    operation = BinaryOpNode(NumberNode(1, NumberType.INTEGER), BinaryOperatorType.IS, NumberNode(1, NumberType.INTEGER))
+    ast = ProgramNode([operation])
+    return Optimizer().optimize(ast) is ast
+
+
+def optimizer_disabled_by_default():
+    from pylpex import Interpreter
+    return Interpreter().optimizer is None
+
+
+def optimizer_eval_ast_keeps_ast():
+    from pylpex import Interpreter
+    from pylpex.utils import parse
+    ast = parse("x = 2 ** 10; if true { x += 1 } x")
+    before = repr(ast)
+    result = Interpreter(optimize=True).eval_ast(ast)
+    return [result, repr(ast) == before]
+
+
+# -------------------------------
+# Mémoïsation
+
+def memoize_deep_recursion():
+    from pylpex.utils import evaluate
+    code = "def f(n) { if n == 0 { return 0 } return 1 + f(n - 1) } f = memoize(f, none); [f(5000), cache_info(f)['misses']]"
+    return [evaluate(code, engine, False) for engine in ("stack", "bytecode")]
+
+
+# -------------------------------
+# Cache des AST
+
+def cache_lru_order():
+    from pylpex import Interpreter
+    interpreter = Interpreter(cache_size=2)
+    for code in ("1", "2", "1", "3", "2", "1"):
+        interpreter.evaluate(code)
+    return [interpreter.cache_hits, interpreter.cache_misses, len(interpreter.cache),
+            "2" in interpreter.cache, "3" in interpreter.cache]
+
+
+def cache_disabled():
+    from pylpex import Interpreter
+    interpreter = Interpreter(cache_size=0)
+    interpreter.evaluate("1 + 1")
+    interpreter.evaluate("1 + 1")
+    return [interpreter.cache_hits, interpreter.cache_misses, len(interpreter.cache)]
+
+
+# -------------------------------
+# Fichiers compilés .pylc
+
+PYLC_CODE = """// programme de test
+def scale(values: list[int], factor: float = 2.0) -> list {
+    result = []
+    for v in values { append(result, v * factor) }
+    return result
+}
+config = {'name': "pylpex\\n", 'debug': false, 'level': none}
+i = 0
+while i < 3 { i += 1 }
+[scale([1, 2, 3]), -i if config['debug'] else i ** 2, not true]
+"""
+
+
+def _write_source(directory: str, code: str) -> str:
+    import os
+    path = os.path.join(directory, "program.pyl")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(code)
+    return path
+
+
+def _touch(path: str, seconds: int = 10):
+    """Décale la date de modification d'un fichier sans changer son contenu"""
+    import os
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 10**9))
+
+
+def pylc_round_trip():
+    from pylpex.cache import dump_ast, load_ast
+    from pylpex.utils import format_ast, parse
+    ast = parse(PYLC_CODE)
+    loaded = load_ast(dump_ast(ast))
+    return [loaded == ast, format_ast(loaded, show_position=True) == format_ast(ast, show_position=True)]
+
+
+def pylc_written_and_reused():
+    import os
+    import tempfile
+    from unittest import mock
+    from pylpex import Interpreter
+    from pylpex.cache import cache_path
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_source(directory, PYLC_CODE)
+        first = Interpreter().evaluate_file(path)
+        written = os.path.exists(cache_path(path))
+        # Second lancement : l'AST est lu depuis le .pylc, sans parsing
+        with mock.patch("pylpex.cache.pylc.Parser", side_effect=AssertionError("source reparsée")):
+            second = Interpreter().evaluate_file(path)
+    return [first, written, second == first]
+
+
+def pylc_not_written():
+    import os
+    import tempfile
+    from pylpex import Interpreter
+    from pylpex.cache import cache_path
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_source(directory, "1 + 1")
+        result = Interpreter().evaluate_file(path, write_cache=False)
+        return [result, os.path.exists(cache_path(path))]
+
+
+def pylc_timestamp_invalidation():
+    import tempfile
+    from pylpex import Interpreter
+    from pylpex.cache import read_pylc
+    from pylpex.utils import parse
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_source(directory, "x = 1; x")
+        Interpreter().evaluate_file(path)
+        valid = read_pylc(path) == parse("x = 1; x")
+        _touch(path)
+        touched = read_pylc(path)
+        _write_source(directory, "x = 2; x")
+        _touch(path, 20)
+        result = Interpreter().evaluate_file(path)
+        return [valid, touched, result, read_pylc(path) == parse("x = 2; x")]
+
+
+def pylc_hash_invalidation():
+    import os
+    import tempfile
+    from pylpex.cache import read_pylc, write_pylc
+    from pylpex.utils import parse
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_source(directory, "x = 1; x")
+        write_pylc(path, parse("x = 1; x"), "x = 1; x", validation="hash")
+        _touch(path)
+        touched = read_pylc(path) == parse("x = 1; x")
+        # Même taille et même date, contenu différent
+        stat = os.stat(path)
+        _write_source(directory, "x = 2; x")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        return [touched, read_pylc(path)]
+
+
+def pylc_invalid_files():
+    import tempfile
+    from pylpex import Interpreter
+    from pylpex.cache import cache_path, read_pylc
+    from pylpex.cache.pylc import HEADER
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_source(directory, PYLC_CODE)
+        expected = Interpreter().evaluate_file(path)
+        with open(cache_path(path), "rb") as f:
+            data = f.read()
+        schema_offset = HEADER.size - 8
+        variants = {
+            "vide": b"",
+            "en-tête tronqué": data[:HEADER.size - 1],
+            "validation tronquée": data[:HEADER.size + 4],
+            "AST tronqué": data[:len(data) // 2],
+            "AST corrompu": data[:-40] + bytes(range(40)),
+            "schéma": data[:schema_offset] + bytes(8) + data[HEADER.size:],
+            "magic": b"XXXX" + data[4:],
+        }
+        result = []
+        for name, content in variants.items():
+            with open(cache_path(path), "wb") as f:
+                f.write(content)
+            rejected = read_pylc(path) is None
+            # Le fichier invalide est ignoré : la source est reparsée et le .pylc réécrit
+            reparsed = Interpreter().evaluate_file(path) == expected and read_pylc(path) is not None
+            result.append((name, rejected, reparsed))
+        return result
+
+
+# -------------------------------
+# Réserve d'interpréteurs
+
+def pool_reset_between_programs():
+    from pylpex import InterpreterPool
+    pool = InterpreterPool(1, prelude="def double(x) { return 2 * x }")
+    first = pool.acquire()
+    first.evaluate("x = 1; double = 0")
+    pool.release(first)
+    second = pool.acquire()
+    defined = second.has_variable("x")
+    result = second.evaluate("double(21)")
+    pool.release(second)
+    return [second is first, defined, result]
+
+
+def pool_discard():
+    from pylpex import InterpreterPool
+    pool = InterpreterPool(1)
+    first = pool.acquire()
+    pool.release(first, discard=True)
+    second = pool.acquire()
+    pool.release(second)
+    try:
+        with pool.interpreter() as third:
+            third.evaluate("1 / 0")
+    except Exception:
+        pass
+    fourth = pool.acquire()
+    return [second is first, third is second, fourth is third, pool.available]
+
+
+def pool_available():
+    from pylpex import InterpreterPool
+    pool = InterpreterPool(2)
+    counts = [pool.available]
+    with pool.interpreter():
+        counts.append(pool.available)
+        counts.append(pool.evaluate("1 + 1"))
+        counts.append(pool.available)
+    counts.append(pool.available)
+    return counts
+
+
+def pool_timeout():
+    from pylpex import InterpreterPool
+    pool = InterpreterPool(1)
+    pool.acquire()
+    return pool.acquire(timeout=0.01)
+
+
+def pool_release_foreign():
+    from pylpex import Interpreter, InterpreterPool
+    InterpreterPool(1).release(Interpreter())
+
+
+# -------------------------------
+# Benchmarks : détection des régressions
+
+def _benchmark_report(**results):
+    phases = ("lex", "parse", "optimize", "evaluate", "total")
+    return {"results": {name: dict(zip(phases, times)) for name, times in results.items()}}
+
+
+def benchmark_compare_threshold():
+    from benchmarks.runner import compare
+    baseline = _benchmark_report(fib=(0.01, 0.02, 0.01, 0.10, 0.14))
+    report = _benchmark_report(fib=(0.0105, 0.03, 0.01, 0.12, 0.1705))
+    return [(r["benchmark"], r["phase"], round(r["ratio"], 2)) for r in compare(report, baseline)]
+
+
+def benchmark_compare_custom_threshold():
+    from benchmarks.runner import compare
+    baseline = _benchmark_report(fib=(0.01, 0.02, 0.01, 0.10, 0.14))
+    report = _benchmark_report(fib=(0.0105, 0.03, 0.01, 0.12, 0.1705))
+    return [r["phase"] for r in compare(report, baseline, threshold=0.25)]
+
+
+def benchmark_compare_min_time():
+    from benchmarks.runner import compare
+    baseline = _benchmark_report(loop=(0.0001, 0.0005, 0.0, 0.01, 0.0106))
+    report = _benchmark_report(loop=(0.0009, 0.002, 0.001, 0.01, 0.0139))
+    return [r["phase"] for r in compare(report, baseline)]
+
+
+def benchmark_compare_ignored():
+    from benchmarks.runner import compare
+    baseline = _benchmark_report(fib=(0.01, 0.02, 0.01, 0.10, 0.14))
+    del baseline["results"]["fib"]["optimize"]
+    report = _benchmark_report(fib=(0.01, 0.02, 0.05, 0.10, 0.18), new=(1.0, 1.0, 1.0, 1.0, 4.0))
+    return [(r["benchmark"], r["phase"]) for r in compare(report, baseline)]
+
+
+def benchmark_compare_faster():
+    from benchmarks.runner import compare
+    baseline = _benchmark_report(fib=(0.01, 0.02, 0.01, 0.10, 0.14))
+    report = _benchmark_report(fib=(0.005, 0.01, 0.005, 0.05, 0.07))
+    return compare(report, baseline)
+
+
+# -------------------------------
+# Statistiques de l'interpréteur
+
+STATS_CODE = "x = 1 + 2; x * 3"
+
+
+def stats_counts():
+    from pylpex import Interpreter
+    from pylpex.utils import parse, tokenize
+    from pylpex.optimizer import count_nodes
+    interpreter = Interpreter(stats=True, optimize=False)
+    interpreter.evaluate(STATS_CODE)
+    last = interpreter.stats.last
+    return [last["tokens"] == len(tokenize(STATS_CODE)), last["nodes"] == count_nodes(parse(STATS_CODE)),
+            last["nodes_visited"], last["cached"]]
+
+
+def stats_cached():
+    from pylpex import Interpreter
+    interpreter = Interpreter(stats=True, optimize=False)
+    interpreter.evaluate(STATS_CODE)
+    interpreter.evaluate(STATS_CODE)
+    last, total = interpreter.stats.last, interpreter.stats.total
+    return [[last["cached"], last["tokens"], last["nodes"], last["nodes_visited"], last["parse"]],
+            [total["calls"], total["tokens"], total["nodes"], total["nodes_visited"]],
+            [record["cached"] for record in interpreter.stats.calls]]
+
+
+def stats_not_visiting_engine():
+    from pylpex import Interpreter
+    interpreter = Interpreter(engine="stack", stats=True, optimize=False)
+    interpreter.evaluate(STATS_CODE)
+    return [interpreter.stats.last["tokens"], interpreter.stats.last["nodes_visited"],
+            interpreter.stats.total["nodes_visited"]]
+
+
+def stats_phases():
+    from pylpex import Interpreter
+    result = []
+    for optimize in (False, True):
+        interpreter = Interpreter(stats=True, optimize=optimize)
+        interpreter.evaluate(STATS_CODE)
+        result.append([interpreter.stats.last[phase] > 0 for phase in ("tokenize", "parse", "optimize", "evaluate")])
+    return result
+
+
+def stats_file_counted_once():
+    import os
+    import tempfile
+    from pylpex import Interpreter
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "program.pyl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(STATS_CODE)
+        interpreter = Interpreter(stats=True, optimize=False)
+        result = interpreter.evaluate_file(path, write_cache=False)
+    last = interpreter.stats.last
+    return [result, interpreter.stats.total["calls"], last["tokens"], last["nodes"]]
+
+
+def stats_reset():
+    from pylpex import Interpreter
+    interpreter = Interpreter(stats=True, optimize=False)
+    interpreter.evaluate(STATS_CODE)
+    interpreter.stats.reset()
+    interpreter.evaluate("1")
+    return [interpreter.stats.total["calls"], len(interpreter.stats.calls), interpreter.stats.total["nodes_visited"]]
+
+
+# -------------------------------
+# Profilage (horloge simulée : chaque lecture avance d'une unité)
+
+PROFILE_CODE = """def f(n) {
+    if n == 0 { return 0 }
+    return 1 + f(n - 1)
+}
+f(2)
+"""
+
+
+def _profile(code: str):
+    import itertools
+    from unittest import mock
+    from pylpex import Interpreter
+    interpreter = Interpreter(engine="profile", optimize=False)
+    clock = itertools.count()
+    with mock.patch("pylpex.evaluator.profiler.perf_counter", lambda: next(clock)):
+        interpreter.evaluate(code)
+    return interpreter.evaluator.profile
+
+
+def profile_entry_recursion():
+    from pylpex.evaluator.profiler import ProfileEntry
+    entry = ProfileEntry("f", "f")
+    entry._active += 1
+    entry._active += 1
+    entry._exit(2.0, 1.0)   # appel imbriqué : le total n'est pas compté
+    entry._exit(5.0, 3.0)
+    return [entry.count, entry.self_time, entry.total]
+
+
+def profile_node_times():
+    profile = _profile("1 + 2")
+    program, operation, left, right = profile.nodes.values()
+    return [[entry.label, entry.self_time, entry.total]
+            for entry in (program, operation, left, right)]
+
+
+def profile_self_sums_to_total():
+    from pylpex.parser.ASTNodes import ProgramNode
+    profile = _profile(PROFILE_CODE)
+    root = next(entry for entry in profile.nodes.values() if entry.label == ProgramNode.__name__)
+    lines = sum(entry.self_time for entry in profile.lines.values())
+    positions = sum(entry.self_time for entry in profile.positions.values())
+    return [sum(entry.self_time for entry in profile.nodes.values()) == root.total,
+            lines == positions == root.total - root.self_time]
+
+
+def profile_recursive_function():
+    profile = _profile(PROFILE_CODE)
+    f = profile.functions["f"]
+    return [f.count, f.total == f.self_time, f.total <= profile.lines[5].total, profile.lines[3].count > 0]
+
+
+def profile_builtin_excluded_from_self():
+    profile = _profile("def g(x) { return len(x) + len(x) }\ng([1, 2])")
+    g, builtin = profile.functions["g"], profile.functions["len (builtin)"]
+    return [g.count, builtin.count, g.self_time == g.total - builtin.total]
+
+
+def profile_sort_error():
+    _profile("1").hot_lines(sort="name")
+
+
+# -------------------------------
+# Trace des appels (horloge simulée : chaque lecture avance d'une milliseconde)
+
+TRACE_CODE = "def g(x) { return len(x) } def f() { return g([1]) + g([2]) } f()"
+
+
+def _trace(code: str):
+    import itertools
+    from unittest import mock
+    from pylpex import Interpreter
+    interpreter = Interpreter(engine="trace", optimize=False)
+    clock = itertools.count()
+    with mock.patch("pylpex.evaluator.tracer.perf_counter", lambda: next(clock) / 1000):
+        interpreter.evaluate(code)
+    return interpreter.evaluator.trace
+
+
+def trace_collapsed():
+    return _trace(TRACE_CODE).to_collapsed().splitlines()
+
+
+def trace_collapsed_recursion():
+    return _trace("def r(n) { if n == 0 { return 0 } return 1 + r(n - 1) } r(1)").to_collapsed().splitlines()
+
+
+def trace_speedscope():
+    import json
+    profile = json.loads(json.dumps(_trace(TRACE_CODE).to_speedscope("test")))
+    events = profile["profiles"][0]["events"]
+    frames = [frame["name"] for frame in profile["shared"]["frames"]]
+    return [frames, profile["name"], profile["profiles"][0]["endValue"],
+            [(event["type"], frames[event["frame"]]) for event in events[:4]],
+            [event["type"] for event in events].count("O") == [event["type"] for event in events].count("C"),
+            [round(event["at"]) for event in events] == list(range(0, 12000, 1000))]
+
+
+def trace_empty():
+    from pylpex.evaluator.tracer import CallTrace
+    trace = CallTrace()
+    return [trace.to_collapsed(), trace.to_speedscope()["profiles"][0]["endValue"]]
+
+
+# -------------------------------
+# Limites d'exécution (moteurs "tree" et "stack")
+
+LIMITED_ENGINES = ("tree", "stack")
+
+
+def _limited(code: str, engine: str, **limits) -> Any:
+    """Résultat du code, ou nom de la limite dépassée"""
+    from pylpex import Interpreter
+    from pylpex.evaluator import ExecutionLimits, LimitExceededError
+    interpreter = Interpreter(engine=engine, optimize=False, limits=ExecutionLimits(**limits))
+    try:
+        return interpreter.evaluate(code)
+    except LimitExceededError as e:
+        return e.limit
+
+
+def limits_max_steps():
+    code = "a = 1; b = 2; c = 3"
+    return [[_limited(code, engine, max_steps=3), _limited(code, engine, max_steps=2),
+             _limited("while true { }", engine, max_steps=1000)] for engine in LIMITED_ENGINES]
+
+
+def limits_max_steps_per_evaluation():
+    from pylpex import Interpreter
+    from pylpex.evaluator import ExecutionLimits
+    result = []
+    for engine in LIMITED_ENGINES:
+        interpreter = Interpreter(engine=engine, optimize=False, limits=ExecutionLimits(max_steps=50))
+        code = "t = 0; for i in range(1, 10) { t += i } t"
+        result.append([interpreter.evaluate(code) for _ in range(3)])
+    return result
+
+
+def limits_tail_calls_count_steps():
+    code = "def loop(n) { if n == 0 { return 0 } return loop(n - 1) } loop(%d)"
+    return [[_limited(code % 5, engine, max_steps=100), _limited(code % 10000, engine, max_steps=1000),
+             _limited(code % 10000, engine, max_depth=2)] for engine in LIMITED_ENGINES]
+
+
+def limits_max_depth():
+    code = "def f(n) { if n == 0 { return 0 } return 1 + f(n - 1) } f(50)"
+    return [[_limited(code, engine, max_depth=51), _limited(code, engine, max_depth=50)] for engine in LIMITED_ENGINES]
+
+
+def limits_timeout():
+    return [_limited("while true { }", engine, timeout=0.05) for engine in LIMITED_ENGINES]
+
+
+def limits_max_collection_size():
+    codes = ["len([0] * 100)", "[0] * 101", "x = 'ab' * 60", "d = {}; for i in range(1, 200) { d[i] = i }",
+             "x = []; for i in range(1, 200) { append(x, i) }"]
+    return [[_limited(code, engine, max_collection_size=100) for code in codes] for engine in LIMITED_ENGINES]
+
+
+def limits_max_collection_size_optimized():
+    from pylpex import Interpreter
+    from pylpex.evaluator import ExecutionLimits, LimitExceededError
+    result = []
+    for code in ("x = 'ab' * 60", "x = 'a' * 60 + 'b' * 60", "len('ab' * 50)"):
+        interpreter = Interpreter(optimize=True, limits=ExecutionLimits(max_collection_size=100))
+        try:
+            result.append(interpreter.evaluate(code))
+        except LimitExceededError as e:
+            result.append(e.limit)
+    return result
+
+
+def limits_error_position():
+    from pylpex import Interpreter
+    from pylpex.evaluator import ExecutionLimits, LimitExceededError
+    result = []
+    for engine in LIMITED_ENGINES:
+        try:
+            Interpreter(engine=engine, optimize=False, limits=ExecutionLimits(max_steps=3)).evaluate("x = 1\nif true { y = 2; z = 3 }")
+        except LimitExceededError as e:
+            result.append(str(e).split(":")[0])
+    return result
+
+
+def limits_unsupported_engines():
+    from pylpex import Interpreter
+    from pylpex.evaluator import ExecutionLimits
+    result = []
+    for engine in ("closure", "bytecode", "python"):
+        try:
+            Interpreter(engine=engine, limits=ExecutionLimits(max_steps=10))
+            result.append(None)
+        except ValueError as e:
+            result.append("n'applique pas les limites d'exécution" in str(e))
+    return result
+
+
+TESTS: Dict[str, List[Tuple[Callable[[], Any], Any]]] = {
+    "engines": [
+        (engine_tail_calls, [100000] * 5),
+        (engine_stack_depth, [20000, 20000]),
+        (engine_closure_table, [True, True]),
+        (engine_bytecode_table, [True, True]),
+        (engine_python_table, [True, True]),
+    ],
+    "optimizer": [
+        (optimizer_keeps_original, [True, False, False]),
+        (optimizer_unchanged_ast, True),
+        (optimizer_nodes_removed, [4, 5, 3, 1]),
+        (optimizer_total_nodes_removed, [4, 6]),
+        (optimizer_unknown_operation_kept, True),
+        (optimizer_disabled_by_default, True),
+        (optimizer_eval_ast_keeps_ast, [1025, True]),
+    ],
+    "cache": [
+        (cache_lru_order, [1, 5, 2, True, False]),
+        (cache_disabled, [0, 2, 0]),
+    ],
+    "pylc": [
+        (pylc_round_trip, [True, True]),
+        (pylc_written_and_reused, [[[2.0, 4.0, 6.0], 9, False], True, True]),
+        (pylc_not_written, [2, False]),
+        (pylc_timestamp_invalidation, [True, None, 2, True]),
+        (pylc_hash_invalidation, [True, None]),
+        (pylc_invalid_files, [(name, True, True) for name in ("vide", "en-tête tronqué", "validation tronquée",
+                                                              "AST tronqué", "AST corrompu", "schéma", "magic")]),
+    ],
+    "pool": [
+        (pool_reset_between_programs, [True, False, 42]),
+        (pool_discard, [False, True, False, 0]),
+        (pool_available, [2, 1, 2, 1, 2]),
+        (pool_timeout, "Error: TimeoutError: Aucun interpréteur disponible après 0.01 s"),
+        (pool_release_foreign, "Error: ValueError: Cet interpréteur n'a pas été emprunté à cette réserve"),
+    ],
+    "benchmarks": [
+        (benchmark_compare_threshold, [("fib", "parse", 1.5), ("fib", "evaluate", 1.2), ("fib", "total", 1.22)]),
+        (benchmark_compare_custom_threshold, ["parse"]),
+        (benchmark_compare_min_time, ["total"]),
+        (benchmark_compare_ignored, [("fib", "total")]),
+        (benchmark_compare_faster, []),
+    ],
+    "stats": [
+        (stats_counts, [True, True, 8, False]),
+        (stats_cached, [[True, 0, 0, 8, 0.0], [2, 10, 9, 16], [False, True]]),
+        (stats_not_visiting_engine, [10, None, None]),
+        (stats_phases, [[True, True, False, True], [True, True, True, True]]),
+        (stats_file_counted_once, [9, 1, 0, 9]),
+        (stats_reset, [1, 1, 2]),
+    ],
+    "profile": [
+        (profile_entry_recursion, [2, 4.0, 5.0]),
+        (profile_node_times, [["ProgramNode", 2, 7], ["BinaryOpNode", 3, 5], ["NumberNode", 1, 1], ["NumberNode", 1, 1]]),
+        (profile_self_sums_to_total, [True, True]),
+        (profile_recursive_function, [3, True, True, True]),
+        (profile_builtin_excluded_from_self, [1, 2, True]),
+        (profile_sort_error, "Error: ValueError: Tri inconnu 'name'"),
+    ],
+    "trace": [
+        (trace_collapsed, ["<programme> 2000", "<programme>;f 3000", "<programme>;f;g 4000",
+                           "<programme>;f;g;len (builtin) 2000"]),
+        (trace_collapsed_recursion, ["<programme> 2000", "<programme>;r 2000", "<programme>;r;r 1000"]),
+        (trace_speedscope, [["<programme>", "f", "g", "len (builtin)"], "test", 11000.0,
+                            [("O", "<programme>"), ("O", "f"), ("O", "g"), ("O", "len (builtin)")], True, True]),
+        (trace_empty, ["", 0]),
+    ],
+    "limits": [
+        (limits_max_steps, [[3, "max_steps", "max_steps"]] * 2),
+        (limits_max_steps_per_evaluation, [[55, 55, 55]] * 2),
+        (limits_tail_calls_count_steps, [[0, "max_steps", 0]] * 2),
+        (limits_max_depth, [[50, "max_depth"]] * 2),
+        (limits_timeout, ["timeout", "timeout"]),
+        (limits_max_collection_size, [[100, "max_collection_size", "max_collection_size", "max_collection_size",
+                                       "max_collection_size"]] * 2),
+        (limits_max_collection_size_optimized, ["max_collection_size", "max_collection_size", 100]),
+        (limits_error_position, ["Erreur à la ligne 2, colonne 1"] * 2),
+        (limits_unsupported_engines, [True, True, True]),
+    ],
+    "memoize": [
+        (memoize_deep_recursion, [[5000, 5001], [5000, 5001]]),
+    ],
+}
+
+
+def get_test_categories() -> List[str]:
+    return list(TESTS.keys())
+
+
+def get_test_cases(category: Optional[str] = None) -> Optional[List[Tuple[Callable[[], Any], Any]]]:
+    if category:
+        return TESTS.get(category)
+    return [test for tests in TESTS.values() for test in tests]
+
+
+def run_tests(tests):
+    total = len(tests)
+    passed = 0
+    failed_tests = []
+
+    for i, (test, expected) in enumerate(tests, 1):
+        name = test.__name__
+        print("------------------------------------------------")
+        print(f"[{i}/{total}] {name}")
+        try:
+            result = test()
+            print("\tResult:   ", result)
+            print("\tExpected: ", expected)
+
+            if isinstance(expected, str) and expected.startswith("Error:"):
+                print("\tCorrect:  🟥 (aucune erreur levée)")
+                failed_tests.append((name, expected, f"Aucune erreur levée (résultat={result})"))
+            elif result == expected:
+                print("\tCorrect:  ✅")
+                passed += 1
+            else:
+                print("\tCorrect:  🟥")
+                failed_tests.append((name, expected, result))
+        except Exception as e:
+            error_message = f"{type(e).__name__}: {e}"
+            print("\tError:    ", error_message)
+            print("\tExpected: ", expected)
+
+            if isinstance(expected, str) and expected.startswith("Error:"):
+                expected_error_msg = expected.split("Error:")[1].strip()
+                if expected_error_msg in error_message:
+                    print("\tCorrect:  ✅")
+                    passed += 1
+                else:
+                    print("\tCorrect:  🟥 (mauvais message d’erreur)")
+                    failed_tests.append((name, expected, f"Erreur différente: {error_message}"))
+            else:
+                print("\tCorrect:  🟥 (erreur inattendue)")
+                failed_tests.append((name, expected, f"Erreur inattendue: {error_message}"))
+
+    # Résumé
+    print("\n================================================")
+    print(f"Résultats : {passed}/{total} tests réussis ✅")
+    if failed_tests:
+        print("------------------------------------------------")
+        print("Tests échoués :")
+        for name, expected, got in failed_tests:
+            print(f"❌ {name}")
+            print(f"   Attendu : {expected}")
+            print(f"   Obtenu  : {got}")
+    print("================================================\n")
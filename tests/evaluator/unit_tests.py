@@ -122,6 +122,34 @@ TESTS = {
         ("def add(a, b) { return a + b } add_ = add; add_(1, 2)", 3),
         ("def add(a, b) { return a + b } array = [add]; array[0](1, 2)", 3),
         ("some_function = 78; some_function()", "Error: n'est pas appelable"),
+        ("def f(a, a) { return a } f(1, 2)", 2),
+        ("def f(a, a) { return a } f(a=3)", 3),
+    ],
+
+    "scopes": [
+        ("x = 1; def f() { return x } f()", 1),
+        ("def f(a) { def g() { def h() { return a } return h() } return g() } f(4)", 4),
+        ("def counter() { n = 0; def inc() { n += 1; return n } return inc } c = counter(); c(); c()", 2),
+        ("total = 0; def add(v) { total += v } add(2); add(3); total", 5),
+        ("x = 1; def f() { y = x; x = 2; return [y, x] } [f(), x]", [[1, 2], 1]),
+        ("def f() { return y } y = 3; f()", 3),
+        ("def f() { z = 1 } f(); z", "Error: Variable 'z' non définie"),
+        ("x = 1; def f() { if false { x = 5 } return x } f()", 1),
+        ("x = 1; def f() { x += 1; x = 10; x += 1; return x } [f(), x]", [11, 2]),
+        ("def o() { x = 1; def f() { r = x; x = 2; def g() { return x } return [r, g()] } return f() } o()", [1, 2]),
+    ],
+
+    "constant_folding": [
+        ("60 * 60 * 24", 86400),
+        ("'prefix' + 'suffix'", "prefixsuffix"),
+        ("-(2 ** 3) + 1", -7),
+        ("not (1 < 2)", False),
+        ("'yes' if 2 > 1 else 'no'", "yes"),
+        ("false and undefined_variable", False),
+        ("x = 0; if false { x = 1 } else { x = 2 } x", 2),
+        ("x = 5; if false { x = 1 }", None),
+        ("x = 1 / 0", "Error: Division par zéro"),
+        ("1 + 'a'", "Error: Erreur d'opération"),
     ],
 
     "types": [
@@ -163,6 +191,9 @@ TESTS = {
         ("abs(-3.1)", 3.1),
         ("min(1, 2, 3)", 1),
         ("max(1, 2, 3)", 3),
+        # builtins masqués par une variable globale
+        ("abs = 3; abs", 3),
+        ("def f() { abs = 2; return abs } [f(), abs(-1)]", [2, 1]),
         # string
         ("capitalize('hElLo')", "Hello"),
         ("lower('hElLo')", "hello"),
@@ -179,6 +210,20 @@ TESTS = {
         ("array = [1, 2, 3]; reverse(array); array", [3, 2, 1]),
         ("array = [1, 3, 2]; sort(array); array", [1, 2, 3]),
         ("range(1, 3)", [1, 2, 3]),
+        ("r = range(1, 10000000); [len(r), r[-1], 5000000 in r, 0 in r]", [10000000, 10000000, True, False]),
+        ("t = 0; for i in range(1, 10000000) { if i > 3 { break } t += i } t", 6),
+        ("x = copy(range(1, 3)); append(x, 4); x", [1, 2, 3, 4]),
+        ("append(range(1, 3), 4)", "Error: Un range ne peut pas être modifié"),
+        ("r = range(1, 3); r[0] = 5", "Error: Un range ne peut pas être modifié"),
+        ("r = range(1, 3); r[0] += 5", "Error: Un range ne peut pas être modifié"),
+        ("[range(1, 2) * 2, 2 * range(1, 2)]", [[1, 2, 1, 2], [1, 2, 1, 2]]),
+        ("convert_to(range(1, 3), 'string')", "[1, 2, 3]"),
+        # memoize
+        ("def fib(n) { if n <= 1 { return n } return fib(n - 1) + fib(n - 2) } fib = memoize(fib, 100); [fib(40), cache_info(fib)['misses']]", [102334155, 41]),
+        ("def f(x) { return x * 2 } g = memoize(f, 2); [g(1), g(2), g(3), g(3), cache_info(g)]", [2, 4, 6, 6, {"hits": 1, "misses": 3, "evictions": 1, "size": 2, "maxsize": 2}]),
+        ("def f(x) { return x } memoize(f)([1])", "Error: les arguments doivent être hashables"),
+        ("def f(x) { return x } m = memoize(f); [m(1), m(true), m(1.0), cache_info(m)['size']]", [1, True, 1.0, 3]),
+        ("def f(x) { return x } m = memoize(f); m(x=1)", "Error: les arguments nommés ne sont pas supportés"),
     ],
 }
 
@@ -193,7 +238,7 @@ def get_test_cases(category: Optional[str] = None) -> Optional[List[Tuple[str, A
 
 
 
-def run_tests(tests):
+def run_tests(tests, engine: str = "tree", optimize: bool = False):
     from pylpex.utils import evaluate
 
     total = len(tests)
@@ -204,7 +249,7 @@ def run_tests(tests):
         print("------------------------------------------------")
         print(f"[{i}/{total}] {expr}")
         try:
-            result = evaluate(expr)
+            result = evaluate(expr, engine=engine, optimize=optimize)
             print("\tResult:   ", result)
             print("\tExpected: ", expected)
 
@@ -246,3 +291,4 @@ def run_tests(tests):
             print(f"   Attendu : {expected}")
             print(f"   Obtenu  : {got}")
     print("================================================\n")
+    return failed_tests
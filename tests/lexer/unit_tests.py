@@ -0,0 +1,79 @@
+from typing import List, Tuple
+
+TESTS = [
+    (
+        "comments",
+        ["// comment", "/* comment */", "/* multi\nline\ncomment */", "x = 1 // fin", "a /* b */ c", "/* non terminé"]
+    ),
+    (
+        "literals",
+        ["none", "45", "4.5", "1_000_000", "1.2.3", "'hello world'", "\"hello \\nworld\"", "'it\\'s'", "'a\\\\'", "'non terminée"]
+    ),
+    (
+        "operators",
+        [
+            "== != <= >= ** ->",
+            "+ - * / % = < > ( ) { } [ ] , ; : .",
+            "+= -= *= /= %= **=",
+            "a**=b**c", "x->y", "!x",
+        ]
+    ),
+    (
+        "positions",
+        [
+            "x = 1\n\n\ny = 2",
+            "a\n\n  \n// c\n\nb",
+            "s = 'multi\nligne'; t = 1",
+            "/* a\nb */ c",
+            "\tif x {\r\n\t\treturn 2\r\n\t}",
+            "été = 2; _privé = été",
+            "x = ²",
+            "a = 1; /* x\ny */ b = 'c\nd' + 'e\n\nf'; g",
+            "x = 'a\\'\nb' + 1\n/* ' */ y = \"z\nw\" /* q\n\n*/ 2",
+            "f(1, /* a\nb */ 'c\nd', /* e */ 'f\n')",
+        ]
+    ),
+]
+
+
+def get_test_cases() -> List[Tuple[str, List[str]]]:
+    return TESTS
+
+
+def run_tests(tests):
+    """
+    Compare les tokens (valeurs et positions) produits par chaque lexer à ceux de Lexer,
+    sur le source complet et lu ligne par ligne (StreamLexer)
+    """
+    import io
+    from pylpex.lexer import Lexer, StreamLexer, LEXERS
+
+    def tokens(lexer, code):
+        try:
+            return [(t.type, t.value, t.line, t.column, t.get_actual_value()) for t in lexer(code).iter_tokens()]
+        except Exception as e:
+            return f"Error: {e}"
+
+    total = passed = 0
+    for category, lines in tests:
+        print(f"  Testing {category.upper()}")
+        print("=====================================")
+        for code in lines:
+            expected = tokens(Lexer, code)
+            for name, lexer in LEXERS.items():
+                variants = [
+                    (name, lexer),
+                    (f"{name}, flux", lambda code, lexer=lexer: StreamLexer(io.StringIO(code), lexer)),
+                ]
+                for label, make_lexer in variants:
+                    total += 1
+                    result = tokens(make_lexer, code)
+                    if result == expected:
+                        passed += 1
+                    else:
+                        print(f"❌ [{label}] {code!r}")
+                        print(f"   Attendu : {expected}")
+                        print(f"   Obtenu  : {result}")
+        print()
+
+    print(f"Résultats : {passed}/{total} tests réussis ✅")